@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+A persisted AWS profile to AWS account id map. The index name and cache key
+use the account id instead of the profile name, so all profiles of the same
+account share the same indexes. The account id is resolved with the
+fingerprinted :data:`~aws_resource_search.identity.identity_cache`, so the
+index name doesn't need ``sts.get_caller_identity()`` every time. This map
+records the last verified account id of each profile, it is the fallback
+when the account can't be verified because there is no network or the
+credential is expired, so the existing indexes are still found offline.
+
+Usage::
+
+    >>> from aws_resource_search.account_map import profile_account_map
+    >>> profile_account_map.get_account_id(bsm)
+    '111122223333'
+"""
+
+import typing as T
+import threading
+import dataclasses
+from pathlib import Path
+
+from boto_session_manager import BotoSesManager
+from boto_session_manager.manager import NOTHING
+
+from .base_model import BaseModel
+from .utils import load_json, dump_json
+from .paths import path_profile_account_json
+from .identity import identity_cache, get_profile
+from .client_registry import client_registry
+from .offline import is_offline_error
+
+
+def _get_profile(bsm: BotoSesManager) -> T.Optional[str]:
+    if bsm.profile_name is NOTHING or bsm.profile_name is None:
+        return None
+    else:
+        return bsm.profile_name
+
+
+@dataclasses.dataclass
+class ProfileAccountMap(BaseModel):
+    """
+    The ``{profile: account_id}`` map, it is stored in a json file.
+
+    :param path: the path of the json file.
+    """
+
+    path: Path = dataclasses.field()
+    _data: T.Optional[T.Dict[str, str]] = dataclasses.field(default=None)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def _load(self) -> T.Dict[str, str]:
+        if self._data is None:
+            self._data = load_json(self.path, default=dict)
+        return self._data
+
+    def get(self, profile: str) -> T.Optional[str]:
+        with self._lock:
+            return self._load().get(profile)
+
+    def set(self, profile: str, account_id: str):
+        """
+        Update the account id of a profile, the file is only written if
+        it is changed.
+        """
+        with self._lock:
+            data = self._load()
+            if data.get(profile) == account_id:
+                return
+            data[profile] = account_id
+            dump_json(self.path, data, indent=4, sort_keys=True)
+
+    def update(self, bsm: BotoSesManager):
+        """
+        Remember the account id of the boto session's profile, it calls
+        ``sts.get_caller_identity()`` if it is not called yet.
+        """
+        profile = _get_profile(bsm)
+        if profile is not None:
+            self.set(profile, client_registry.get_account_id(bsm))
+
+    def get_account_id(self, bsm: BotoSesManager) -> str:
+        """
+        Get the account id of the boto session. The cached identity in
+        :data:`~aws_resource_search.identity.identity_cache` is only trusted
+        when the fingerprint of the AWS config is unchanged, otherwise the
+        account id is taken from the boto session, which calls
+        ``sts.get_caller_identity()`` once per boto session, and both caches
+        are overwritten. The map is only used when that call fails with
+        :func:`~aws_resource_search.offline.is_offline_error`, it never
+        overrides a boto session that works.
+        """
+        try:
+            profile = get_profile(bsm)
+        except ValueError:
+            return client_registry.get_account_id(bsm)
+        identity = identity_cache.get(profile)
+        if identity is not None:
+            return identity.account_id
+        try:
+            identity = identity_cache.fetch(bsm)
+        except Exception as e:
+            account_id = None if profile is None else self.get(profile)
+            if account_id is None or is_offline_error(e) is False:
+                raise e
+            return account_id
+        if profile is not None:
+            self.set(profile, identity.account_id)
+        return identity.account_id
+
+    def clear(self):
+        with self._lock:
+            self._data = dict()
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+profile_account_map = ProfileAccountMap(path=path_profile_account_json)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+"""
+Multi-account search support. A resource type can be suffixed with
+``#{accounts}`` to search the same resource type in multiple AWS accounts at
+once, it can be combined with the multi-region search, for example:
+
+- ``iam-role#*: admin``: search all accounts in the ``accounts`` config,
+    or all AWS profiles in ``~/.aws/config`` if it is empty.
+- ``s3-bucket#dev,prod: logs``: search the ``dev`` and ``prod`` AWS profiles.
+- ``ec2-instance#*@*: web``: search all accounts in all regions.
+
+An account can be an AWS profile name, or an IAM role ARN to assume from
+the current boto session, for example
+``iam-role#arn:aws:iam::111122223333:role/ars: admin``. The ``:`` in the role
+ARN is not treated as the delimiter of the resource query, see
+:func:`escape_account_query`.
+
+Usage::
+
+    >>> from aws_resource_search.accounts import Account, resolve_accounts
+    >>> accounts = resolve_accounts(bsm, "dev,arn:aws:iam::111122223333:role/ars")
+    >>> docs = ars.iam_role.search("admin", accounts=accounts)
+"""
+
+import typing as T
+import re
+import threading
+import dataclasses
+
+from boto_session_manager import BotoSesManager
+
+from .base_model import BaseModel
+
+#: the character between the resource type and the account query
+ACCOUNT_SEP = "#"
+#: the account query that means "all accounts"
+ALL_ACCOUNTS = "*"
+
+#: the IAM role ARN right after ``#`` or ``,`` in the account query
+_ROLE_ARN_PATTERN = re.compile(
+    r"(?<=[#,])\s*arn:aws[a-z-]*:iam::\d{12}:role/[\w+=,.@/-]+?(?=[:,@\s]|$)"
+)
+#: the placeholder of ``:`` in the escaped role ARN
+_ESCAPED_COLON = "\x1f"
+
+_account_cache: T.Dict[str, "Account"] = dict()
+_lock = threading.Lock()
+
+
+@dataclasses.dataclass
+class Account(BaseModel):
+    """
+    One AWS account to search in.
+
+    :param name: the AWS profile name, or the assumed IAM role ARN.
+    :param bsm: the boto session of this account.
+    """
+
+    name: str = dataclasses.field()
+    bsm: BotoSesManager = dataclasses.field()
+
+    @classmethod
+    def from_profile(cls, profile: str) -> "Account":
+        """
+        Get the account of an AWS profile. The boto session is cached,
+        so the credentials and the boto3 clients are reused.
+        """
+        with _lock:
+            try:
+                return _account_cache[profile]
+            except KeyError:
+                pass
+            account = cls(name=profile, bsm=BotoSesManager(profile_name=profile))
+            _account_cache[profile] = account
+            return account
+
+    @classmethod
+    def from_role(
+        cls,
+        bsm: BotoSesManager,
+        role_arn: str,
+        duration_seconds: int = 3600,
+    ) -> "Account":
+        """
+        Get the account by assuming an IAM role from the given boto session.
+        The assumed role session is cached until it is about to expire.
+        """
+        with _lock:
+            account = _account_cache.get(role_arn)
+            if account is not None and account.bsm.is_expired(delta=60) is False:
+                return account
+            account = cls(
+                name=role_arn,
+                bsm=bsm.assume_role(
+                    role_arn=role_arn,
+                    duration_seconds=duration_seconds,
+                    region_name=bsm.aws_region,
+                ),
+            )
+            _account_cache[role_arn] = account
+            return account
+
+    @classmethod
+    def from_name(cls, bsm: BotoSesManager, name: str) -> "Account":
+        """
+        Get the account by a profile name or an IAM role ARN.
+
+        :param bsm: the boto session to assume the role from.
+        """
+        if name.startswith("arn:"):
+            return cls.from_role(bsm=bsm, role_arn=name)
+        else:
+            return cls.from_profile(profile=name)
+
+    @property
+    def label(self) -> str:
+        """
+        The short name to show in the UI, it is the profile name, or the
+        account id for an assumed role.
+        """
+        return get_account_label(self.name)
+
+
+def get_account_label(name: str) -> str:
+    """
+    See :attr:`Account.label`.
+    """
+    if name.startswith("arn:"):
+        return name.split(":")[4]
+    else:
+        return name
+
+
+def get_account(name: str) -> T.Optional[Account]:
+    """
+    Get a cached :class:`Account` by its name.
+    """
+    return _account_cache.get(name)
+
+
+def escape_account_query(query: str) -> str:
+    """
+    Escape the ``:`` in the IAM role ARNs of the ``#accounts`` part of the
+    UI query, so the query can be split by ``:`` to get the resource type
+    part and the resource query. :func:`parse_account_query` unescapes it.
+
+    Example::
+
+        >>> query = escape_account_query("iam-role#arn:aws:iam::111122223333:role/ars: admin")
+        >>> resource_type_part, resource_query = query.split(":")
+        >>> parse_account_query(resource_type_part)
+        ('iam-role', 'arn:aws:iam::111122223333:role/ars')
+    """
+    return _ROLE_ARN_PATTERN.sub(
+        lambda match: match.group(0).replace(":", _ESCAPED_COLON),
+        query,
+    )
+
+
+def parse_account_query(resource_type_part: str) -> T.Tuple[str, T.Optional[str]]:
+    """
+    Split the ``resource-type#accounts`` string.
+
+    Example::
+
+        >>> parse_account_query("s3-bucket#dev,prod")
+        ('s3-bucket', 'dev,prod')
+        >>> parse_account_query("s3-bucket")
+        ('s3-bucket', None)
+
+    :return: the resource type and the account query, the account query is
+        None if it is a single account search.
+    """
+    if ACCOUNT_SEP in resource_type_part:
+        resource_type, account_query = resource_type_part.split(ACCOUNT_SEP, 1)
+        account_query = account_query.replace(_ESCAPED_COLON, ":")
+        return resource_type.strip(), account_query.strip()
+    else:
+        return resource_type_part, None
+
+
+def resolve_accounts(
+    bsm: BotoSesManager,
+    account_query: str,
+    default_accounts: T.Optional[T.List[str]] = None,
+) -> T.List[Account]:
+    """
+    Convert the account query to a list of :class:`Account`.
+
+    :param bsm: the boto session to assume the IAM roles from.
+    :param account_query: ``"*"`` or comma separated profile names or
+        IAM role ARNs.
+    :param default_accounts: the accounts for ``"*"``, if not given, use the
+        ``accounts`` config, then all AWS profiles in ``~/.aws/config``.
+    """
+    if account_query.strip() in ["", ALL_ACCOUNTS]:
+        if default_accounts is None:
+            from .conf.init import config
+
+            default_accounts = config.accounts
+        if default_accounts:
+            names = list(default_accounts)
+        else:
+            names = list(bsm.boto_ses.available_profiles)
+    else:
+        names = list()
+        for name in account_query.split(","):
+            name = name.strip()
+            if name and name not in names:
+                names.append(name)
+    return [Account.from_name(bsm=bsm, name=name) for name in names]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""
+Helpers for the asyncio API, such as
+:meth:`~aws_resource_search.base_searcher.BaseSearcher.asearch` and
+:func:`~aws_resource_search.downloader.alist_resources`.
+
+boto3 is synchronous, so the blocking work runs in the default executor of
+the event loop. To propagate the cancellation of the asyncio task into the
+worker thread, each call gets a cancel event in a ``contextvars`` variable,
+and the long-running loops (e.g. downloading pages) call
+:func:`check_cancelled` between steps.
+
+Usage::
+
+    >>> import asyncio
+    >>> async def main():
+    ...     return await asyncio.gather(
+    ...         ars.s3_bucket.asearch("my bucket"),
+    ...         ars.iam_role.asearch("my role"),
+    ...     )
+"""
+
+import typing as T
+import asyncio
+import functools
+import threading
+import contextvars
+
+from .exc import OperationCancelledError
+
+#: the cancel event of the current call, ``None`` in the synchronous API
+_cancel_event = contextvars.ContextVar("ars_cancel_event", default=None)
+
+
+def check_cancelled():
+    """
+    Raise :class:`~aws_resource_search.exc.OperationCancelledError` if the
+    asyncio task of the current call is cancelled. It does nothing in the
+    synchronous API.
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise OperationCancelledError("the asyncio task is cancelled")
+
+
+def submit_with_context(executor, func: T.Callable, *args, **kwargs):
+    """
+    Submit the function to a ``concurrent.futures`` executor with a copy of
+    the current context, so the cancel event is visible in that thread too.
+    """
+    return executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+
+async def run_in_thread(func: T.Callable, *args, **kwargs) -> T.Any:
+    """
+    Run the blocking function in the default executor. If the awaiting task
+    is cancelled, the cancel event is set, so the function stops at the next
+    :func:`check_cancelled` call.
+    """
+    loop = asyncio.get_running_loop()
+    event = threading.Event()
+
+    def run():
+        _cancel_event.set(event)
+        return func(*args, **kwargs)
+
+    context = contextvars.copy_context()
+    future = loop.run_in_executor(None, functools.partial(context.run, run))
+    try:
+        return await future
+    except asyncio.CancelledError:
+        event.set()
+        raise
@@ -1,58 +1,131 @@
 # -*- coding: utf-8 -*-
 
-from .res_lib import format_shortcut
-from .res_lib import highlight_text
-from .res_lib import format_resource_type
-from .res_lib import format_key
-from .res_lib import format_value
-from .res_lib import format_key_value
-from .res_lib import ShortcutEnum
-from .res_lib import SUBTITLE
-from .res_lib import SHORT_SUBTITLE
-from .res_lib import SearcherEnum
-from .res_lib import T_RESULT_DATA
-from .res_lib import ResourceIterproxy
-from .res_lib import ResultPath
-from .res_lib import list_resources
-from .res_lib import extract_tags
-from .res_lib import BaseArsDocument
-from .res_lib import T_ARS_DOCUMENT
-from .res_lib import ResourceTypeDocument
-from .res_lib import get_utc_now
-from .res_lib import to_human_readable_elapsed
-from .res_lib import to_utc_dt
-from .res_lib import SIMPLE_DT_FMT
-from .res_lib import to_simple_dt_fmt
-from .res_lib import to_iso_dt_fmt
-from .res_lib import get_none_or_default
-from .res_lib import get_description
-from .res_lib import get_datetime
-from .res_lib import get_datetime_simple_fmt
-from .res_lib import get_datetime_iso_fmt
-from .res_lib import ResourceDocument
-from .res_lib import T_ARS_RESOURCE_DOCUMENT
-from .res_lib import BaseArsItem
-from .res_lib import T_ARS_ITEM
-from .res_lib import DetailItem
-from .res_lib import ExceptionItem
-from .res_lib import FileItem
-from .res_lib import InfoItem
-from .res_lib import UrlItem
-from .res_lib import AwsResourceTypeItem
-from .res_lib import AwsResourceItem
-from .res_lib import SetAwsProfileItem
-from .res_lib import ShowAwsInfoItem
-from .res_lib import preprocess_query
-from .res_lib import BaseSearcher
-from .res_lib import T_SEARCHER
-from .res_lib import config
-
-from .ars_def import ARS
-
-from .handlers.api import search_aws_profile_handler
-from .handlers.api import search_resource_type_handler
-from .handlers.api import search_resource_handler
-from .handlers.api import show_aws_info_handler
-
-from .ui_def import UI
-from .ui_def import handler
+"""
+The public API. The attributes are imported on first access, for example,
+``from aws_resource_search.api import ARS`` doesn't import the UI.
+"""
+
+import typing as T
+
+from .utils import lazy_getattr
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .res_lib import format_shortcut
+    from .res_lib import highlight_text
+    from .res_lib import format_resource_type
+    from .res_lib import format_key
+    from .res_lib import format_value
+    from .res_lib import format_key_value
+    from .res_lib import ShortcutEnum
+    from .res_lib import SUBTITLE
+    from .res_lib import SHORT_SUBTITLE
+    from .res_lib import SearcherEnum
+    from .res_lib import T_RESULT_DATA
+    from .res_lib import ResourceIterproxy
+    from .res_lib import ResultPath
+    from .res_lib import list_resources
+    from .res_lib import extract_tags
+    from .res_lib import BaseArsDocument
+    from .res_lib import T_ARS_DOCUMENT
+    from .res_lib import ResourceTypeDocument
+    from .res_lib import get_utc_now
+    from .res_lib import to_human_readable_elapsed
+    from .res_lib import to_utc_dt
+    from .res_lib import SIMPLE_DT_FMT
+    from .res_lib import to_simple_dt_fmt
+    from .res_lib import to_iso_dt_fmt
+    from .res_lib import get_none_or_default
+    from .res_lib import get_description
+    from .res_lib import get_datetime
+    from .res_lib import get_datetime_simple_fmt
+    from .res_lib import get_datetime_iso_fmt
+    from .res_lib import ResourceDocument
+    from .res_lib import T_ARS_RESOURCE_DOCUMENT
+    from .res_lib import BaseArsItem
+    from .res_lib import T_ARS_ITEM
+    from .res_lib import DetailItem
+    from .res_lib import ExceptionItem
+    from .res_lib import FileItem
+    from .res_lib import InfoItem
+    from .res_lib import UrlItem
+    from .res_lib import AwsResourceTypeItem
+    from .res_lib import AwsResourceItem
+    from .res_lib import SetAwsProfileItem
+    from .res_lib import ShowAwsInfoItem
+    from .res_lib import preprocess_query
+    from .res_lib import BaseSearcher
+    from .res_lib import SearchPage
+    from .res_lib import T_SEARCHER
+    from .res_lib import config
+    from .ars_def import ARS
+    from .handlers.api import search_aws_profile_handler
+    from .handlers.api import search_resource_type_handler
+    from .handlers.api import search_resource_handler
+    from .handlers.api import show_aws_info_handler
+    from .ui_def import UI
+    from .ui_def import handler
+
+_LAZY_ATTRS = {
+    "format_shortcut": ".res_lib",
+    "highlight_text": ".res_lib",
+    "format_resource_type": ".res_lib",
+    "format_key": ".res_lib",
+    "format_value": ".res_lib",
+    "format_key_value": ".res_lib",
+    "ShortcutEnum": ".res_lib",
+    "SUBTITLE": ".res_lib",
+    "SHORT_SUBTITLE": ".res_lib",
+    "SearcherEnum": ".res_lib",
+    "T_RESULT_DATA": ".res_lib",
+    "ResourceIterproxy": ".res_lib",
+    "ResultPath": ".res_lib",
+    "list_resources": ".res_lib",
+    "extract_tags": ".res_lib",
+    "BaseArsDocument": ".res_lib",
+    "T_ARS_DOCUMENT": ".res_lib",
+    "ResourceTypeDocument": ".res_lib",
+    "get_utc_now": ".res_lib",
+    "to_human_readable_elapsed": ".res_lib",
+    "to_utc_dt": ".res_lib",
+    "SIMPLE_DT_FMT": ".res_lib",
+    "to_simple_dt_fmt": ".res_lib",
+    "to_iso_dt_fmt": ".res_lib",
+    "get_none_or_default": ".res_lib",
+    "get_description": ".res_lib",
+    "get_datetime": ".res_lib",
+    "get_datetime_simple_fmt": ".res_lib",
+    "get_datetime_iso_fmt": ".res_lib",
+    "ResourceDocument": ".res_lib",
+    "T_ARS_RESOURCE_DOCUMENT": ".res_lib",
+    "BaseArsItem": ".res_lib",
+    "T_ARS_ITEM": ".res_lib",
+    "DetailItem": ".res_lib",
+    "ExceptionItem": ".res_lib",
+    "FileItem": ".res_lib",
+    "InfoItem": ".res_lib",
+    "UrlItem": ".res_lib",
+    "AwsResourceTypeItem": ".res_lib",
+    "AwsResourceItem": ".res_lib",
+    "SetAwsProfileItem": ".res_lib",
+    "ShowAwsInfoItem": ".res_lib",
+    "preprocess_query": ".res_lib",
+    "BaseSearcher": ".res_lib",
+    "SearchPage": ".res_lib",
+    "T_SEARCHER": ".res_lib",
+    "config": ".res_lib",
+    "ARS": ".ars_def",
+    "search_aws_profile_handler": ".handlers.api",
+    "search_resource_type_handler": ".handlers.api",
+    "search_resource_handler": ".handlers.api",
+    "show_aws_info_handler": ".handlers.api",
+    "UI": ".ui_def",
+    "handler": ".ui_def",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+__getattr__ = lazy_getattr(__name__, __package__, _LAZY_ATTRS)
+
+
+def __dir__():
+    return __all__
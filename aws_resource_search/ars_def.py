@@ -8,6 +8,7 @@ import typing as T
 import shutil
 import dataclasses
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from diskcache import Cache
 from boto_session_manager import BotoSesManager
@@ -15,13 +16,29 @@ from boto_session_manager.manager import NOTHING
 import aws_console_url.api as acu
 
 from .exc import MalformedBotoSessionError
+from .aio import submit_with_context
 from .paths import dir_index, dir_cache
+from .client_registry import client_registry
 from .searcher_finder import SearcherFinder, searcher_finder
+from .regions import get_regional_bsm
+from .accounts import Account
+from .profile_pool import profile_pool
 from .ars_search_patterns import ArsSearchPatternsMixin
 from .ars_mixin import ARSMixin
+from .compat import cached_property
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from .res_lib import T_SEARCHER
+    from .documents.resource_document import T_ARS_RESOURCE_DOCUMENT
+
+T_SEARCH_MANY_QUERY = T.Union[
+    T.Tuple[str, str],
+    T.Tuple[str, str, T.Optional[dict]],
+]
+"""
+Type hint for one query of :meth:`ARS.search_many`, it is a
+``(resource_type, query)`` or ``(resource_type, query, boto_kwargs)`` tuple.
+"""
 
 
 def validate_bsm(bsm: "BotoSesManager"):
@@ -30,7 +47,7 @@ def validate_bsm(bsm: "BotoSesManager"):
     permission because we need to get aws_account_id, and be able to get ``aws_region``.
     """
     try:
-        _ = bsm.aws_account_id
+        client_registry.get_account_id(bsm)
     except Exception as e:  # pragma: no cover
         raise MalformedBotoSessionError(
             f"failed to use sts.get_caller_identity() to get AWS account id:, "
@@ -105,8 +122,8 @@ class ARS(
         Create a new :class:`ARSBase` object by an AWS profile. If None, then
         use the default AWS profile.
         """
-        bsm = BotoSesManager(profile_name=profile)
-        return cls.from_bsm(bsm=bsm)
+        context = profile_pool.get(profile)
+        return cls(bsm=context.bsm, aws_console=context.aws_console)
 
     @classmethod
     def from_bsm(cls, bsm: T.Optional["BotoSesManager"] = None):
@@ -114,19 +131,72 @@ class ARS(
             bsm = BotoSesManager()
         return cls(bsm=bsm, aws_console=acu.AWSConsole.from_bsm(bsm))
 
+    def get_regional_ars(self, region: T.Optional[str]) -> "ARS":
+        """
+        Get an :class:`ARS` object that uses the same credential in another
+        region. It is used to open the console url or view the details of
+        a resource found by the multi-region search.
+
+        :param region: the region name, None means the current region.
+        """
+        if region is None or region == self.bsm.aws_region:
+            return self
+        bsm = get_regional_bsm(self.bsm, region)
+        return dataclasses.replace(
+            self,
+            bsm=bsm,
+            aws_console=acu.AWSConsole.from_bsm(bsm),
+        )
+
+    def get_account_ars(
+        self,
+        account: T.Optional[str],
+        region: T.Optional[str] = None,
+    ) -> "ARS":
+        """
+        Similar to :meth:`get_regional_ars`, but also switch to another AWS
+        account found by the multi-account search.
+
+        :param account: the :attr:`~aws_resource_search.accounts.Account.name`,
+            None means the current account.
+        :param region: the region name, None means the default region of
+            the account.
+        """
+        if account is None:
+            return self.get_regional_ars(region)
+        # the cached account is reused, the expired assumed role is renewed
+        bsm = Account.from_name(bsm=self.bsm, name=account).bsm
+        if region is not None:
+            bsm = get_regional_bsm(bsm, region)
+        return dataclasses.replace(
+            self,
+            bsm=bsm,
+            aws_console=acu.AWSConsole.from_bsm(bsm),
+        )
+
     def get_searcher(self, resource_type: str) -> "T_SEARCHER":
         """
         Get corresponding :class:`aws_resource_search.res_lib.Searcher`
         object by resource type.
+
+        The searcher defined in the ``aws_resource_search.res`` module is
+        shared by the whole process and never bound to a boto session. This
+        method returns a shallow copy bound to the ``bsm`` of this object, so
+        ``ARS`` objects of different AWS accounts can search concurrently
+        in multiple threads.
         """
         sr = searcher_finder.import_searcher(resource_type)
-        sr.bsm = self.bsm
-        return sr
+        return dataclasses.replace(sr, bsm=self.bsm)
 
     def clear_all_cache(self):
         """
         Clear all cache.
         """
+        from .index_registry import index_registry
+
+        # the open searchers and the in-memory expire time point to the
+        # removed indexes
+        index_registry.close()
         shutil.rmtree(self.dir_index, ignore_errors=True)
         shutil.rmtree(self.dir_cache, ignore_errors=True)
 
@@ -142,6 +212,139 @@ class ARS(
         """
         return searcher_finder.is_valid_resource_type(resource_type)
 
+    def search_many(
+        self,
+        queries: T.Iterable[T_SEARCH_MANY_QUERY],
+        limit: int = 50,
+        refresh_data: bool = False,
+        max_workers: T.Optional[int] = None,
+    ) -> T.List[T.Union[T.List["T_ARS_RESOURCE_DOCUMENT"], Exception]]:
+        """
+        Run many searches concurrently, for example, resolve a list of
+        Lambda function names and Glue table names in one call.
+
+        Example::
+
+            >>> results = ars.search_many(
+            ...     [
+            ...         ("lambda-function", "my-func-1"),
+            ...         ("lambda-function", "my-func-2"),
+            ...         ("glue-database-table", "my-table", {"DatabaseName": "my_db"}),
+            ...     ]
+            ... )
+            >>> results[0] # the documents of the first query
+            [LambdaFunctionDocument(...), ...]
+
+        Logics:
+
+        1. Group the queries by the index they search, each index is built
+            (or refreshed if expired) only once, and the indexes are built
+            concurrently. The build error is recorded once per index.
+        2. Run all queries concurrently on the open indexes. If the index
+            failed to build, the query searches the existing index when there
+            is no network or the credential is expired (see
+            :mod:`aws_resource_search.offline`), otherwise it fails with the
+            build error, the index is not downloaded again.
+        3. A failed query doesn't affect the others, its slot in the result
+            is the exception object.
+
+        :param queries: list of ``(resource_type, query)`` or
+            ``(resource_type, query, boto_kwargs)`` tuples, the ``boto_kwargs``
+            is required for the resource type that has a partitioner.
+        :param limit: the max number of documents of each query.
+        :param refresh_data: rebuild the indexes before searching.
+        :param max_workers: the number of threads, by default it is the same
+            as :meth:`~aws_resource_search.base_searcher.BaseSearcher.search_regions`.
+
+        :return: the list of documents of each query, or the exception if the
+            query failed, in the input order.
+        """
+        from .base_searcher import MAX_SESSION_WORKERS, preprocess_query
+        from .offline import is_offline_error
+
+        tasks = list()
+        for tup in queries:
+            resource_type, query = tup[0], tup[1]
+            boto_kwargs = tup[2] if len(tup) >= 3 else None
+            tasks.append((self.get_searcher(resource_type), query, boto_kwargs))
+        if len(tasks) == 0:
+            return []
+
+        # {index name: (searcher, boto kwargs)}
+        indexes = dict()
+        index_names = list()
+        for searcher, _, boto_kwargs in tasks:
+            index_name = searcher._get_index_name(
+                bsm=self.bsm,
+                final_boto_kwargs=searcher._get_final_boto_kwargs(boto_kwargs),
+            )
+            indexes.setdefault(index_name, (searcher, boto_kwargs))
+            index_names.append(index_name)
+
+        # {index name: the error of building the index}
+        build_errors: T.Dict[str, Exception] = dict()
+
+        def build_index(
+            index_name: str,
+            searcher: "T_SEARCHER",
+            boto_kwargs: T.Optional[dict],
+        ):
+            try:
+                searcher.build_index(
+                    boto_kwargs=boto_kwargs,
+                    refresh_data=refresh_data,
+                    multi_thread=False,
+                )
+            except Exception as e:
+                build_errors[index_name] = e
+
+        def search(
+            index_name: str,
+            searcher: "T_SEARCHER",
+            query: str,
+            boto_kwargs: T.Optional[dict],
+        ):
+            error = build_errors.get(index_name)
+            if error is None:
+                return searcher.search(query=query, limit=limit, boto_kwargs=boto_kwargs)
+            # search the existing index without downloading it again
+            ds = searcher._get_ds(
+                bsm=self.bsm,
+                final_boto_kwargs=searcher._get_final_boto_kwargs(boto_kwargs),
+            )
+            if is_offline_error(error) and searcher._get_index_age(ds) is not None:
+                result = searcher._run_query(
+                    ds=ds, query=preprocess_query(query), limit=limit
+                )
+                return [
+                    searcher.doc_class.from_dict(hit["_source"])
+                    for hit in result["hits"]
+                ]
+            raise error
+
+        if max_workers is None:
+            max_workers = MAX_SESSION_WORKERS
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                submit_with_context(
+                    executor, build_index, index_name, searcher, boto_kwargs
+                )
+                for index_name, (searcher, boto_kwargs) in indexes.items()
+            ]
+            for future in futures:
+                future.result()
+            futures = [
+                submit_with_context(executor, search, index_name, *task)
+                for index_name, task in zip(index_names, tasks)
+            ]
+            results = list()
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+            return results
+
     def set_profile(self, profile: T.Optional[str] = NOTHING):
         """
         Set all boto session related attributes (``bsm``, ``aws_console``,
@@ -149,27 +352,47 @@ class ARS(
 
         Logics:
 
-        1. Update the singleton ``bsm`` object by reset its cache and use a new AWS profile.
-        2. Update the ``aws_console`` object to use the new ``bsm``
-        3. Since we updated the ``bsm``, we also need to reset the ``searcher_finder``
-            cache to recreate all ``Searcher`` objects.
-        """
-        # reset boto_session_manager.BotoSesManager
-        self.bsm.aws_access_key_id = NOTHING
-        self.bsm.aws_secret_access_key = NOTHING
-        self.bsm.aws_session_token = NOTHING
-        self.bsm.region_name = NOTHING
-        self.bsm.botocore_session = NOTHING
-        self.bsm.profile_name = profile
-        self.bsm.clear_cache()
-        validate_bsm(self.bsm)
+        1. Get the validated ``bsm`` and ``aws_console`` of the profile from
+            the :data:`~aws_resource_search.profile_pool.profile_pool`. If the
+            profile was used recently, it is reused without any API call.
+        2. Forget the searcher copies cached by the ``ars.${resource_type}``
+            properties, because :meth:`get_searcher` binds them to the old
+            ``bsm``. The open indexes don't need to be reset, they are keyed
+            by account id and region.
 
-        # reset aws_console_url.AWSConsole
-        self.aws_console = acu.AWSConsole.from_bsm(self.bsm)
+        .. note::
 
-        # reset searcher_finder.SearcherFinder
-        self.searcher_finder.searcher_cache.clear()
+            It changes this object in place, which is what the UI wants. If
+            the object is shared by multiple threads (e.g. in a server), use
+            :meth:`with_profile` instead.
+        """
+        context = profile_pool.get(profile)
+        self.bsm = context.bsm
+        self.aws_console = context.aws_console
 
         # reset ARS.search_patterns
         _ = self.search_patterns
         self._clear_search_patterns_cache()
+        self._clear_searcher_cache()
+
+    def _clear_searcher_cache(self):
+        """
+        Clear the cached searchers of the :class:`~aws_resource_search.ars_mixin.ARSMixin`
+        properties, for example ``ars.s3_bucket``.
+        """
+        for name, value in vars(ARSMixin).items():
+            if isinstance(value, cached_property):
+                self.__dict__.pop(name, None)
+
+    def with_profile(self, profile: T.Optional[str] = NOTHING) -> "ARS":
+        """
+        Similar to :meth:`set_profile`, but return a new :class:`ARS` object
+        that uses the AWS profile, and leave this object unchanged. The new
+        object shares the indexes and the cache with this object.
+        """
+        context = profile_pool.get(profile)
+        return dataclasses.replace(
+            self,
+            bsm=context.bsm,
+            aws_console=context.aws_console,
+        )
@@ -12,6 +12,11 @@ from .searcher_enum import SearcherEnum
 
 if T.TYPE_CHECKING:
     from .ars_def import ARS
+    from .documents.resource_document import T_ARS_RESOURCE_DOCUMENT
+
+#: the max number of parent resources to search in the wildcard partitioner
+#: search, for example, ``glue-database-table: *@orders``
+MAX_PARTITIONS = 100
 
 
 class T_SEARCH_PATTERN(TypedDict):
@@ -119,3 +124,81 @@ class ArsSearchPatternsMixin:
         Get the boto3 kwargs for the partitioner resource.
         """
         return self.search_patterns[resource_type][K_GET_BOTO_KWARGS](partitioner_query)
+
+    def get_partitions(
+        self: "ARS",
+        resource_type: str,
+        partitioner_query: str = "*",
+        refresh_data: bool = False,
+        max_partitions: int = MAX_PARTITIONS,
+    ) -> T.List[T.Tuple[str, dict]]:
+        """
+        Search the partitioner resources (for example, glue databases for
+        glue table), and get the boto3 kwargs to search the resource under
+        each of them.
+
+        :param resource_type: the resource type that has a partitioner,
+            for example, ``"glue-database-table"``.
+        :param partitioner_query: the query to filter the partitioner resources,
+            ``*`` means all of them.
+        :param refresh_data: rebuild the partitioner index before searching.
+        :param max_partitions: the max number of partitioner resources.
+
+        :return: list of ``(partitioner name, boto_kwargs)`` tuples, it can be
+            used as the ``partitions`` argument of
+            :meth:`~aws_resource_search.base_searcher.BaseSearcher.search`.
+        """
+        searcher = self.get_searcher(self.get_partitioner_resource_type(resource_type))
+        docs = searcher.search(
+            query=partitioner_query,
+            limit=max_partitions,
+            refresh_data=refresh_data,
+        )
+        partitions = list()
+        for doc in docs:
+            name = doc.autocomplete
+            partitions.append(
+                (name, self.get_partitioner_boto_kwargs(resource_type, name))
+            )
+        return partitions
+
+    def search_all_partitions(
+        self: "ARS",
+        resource_type: str,
+        query: str = "*",
+        limit: int = 50,
+        partitioner_query: str = "*",
+        refresh_data: bool = False,
+        max_partitions: int = MAX_PARTITIONS,
+    ) -> T.List["T_ARS_RESOURCE_DOCUMENT"]:
+        """
+        Search the resource type under all partitioner resources, for example,
+        find the glue databases that have a table named ``orders``::
+
+            >>> docs = ars.search_all_partitions("glue-database-table", "orders")
+            >>> [(doc.partition, doc.name) for doc in docs]
+            [("sales", "orders"), ("archive", "orders_2020"), ...]
+
+        The child indexes are downloaded concurrently, see
+        :meth:`~aws_resource_search.base_searcher.BaseSearcher.search_partitions`.
+        Each document has a ``partition`` attribute.
+
+        :param refresh_data: rebuild the partitioner index and the child
+            indexes before searching.
+
+        See :meth:`get_partitions` for the other arguments.
+        """
+        partitions = self.get_partitions(
+            resource_type=resource_type,
+            partitioner_query=partitioner_query,
+            refresh_data=refresh_data,
+            max_partitions=max_partitions,
+        )
+        if len(partitions) == 0:
+            return []
+        return self.get_searcher(resource_type).search(
+            query=query,
+            limit=limit,
+            refresh_data=refresh_data,
+            partitions=partitions,
+        )
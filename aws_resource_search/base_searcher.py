@@ -1,22 +1,244 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
+import os
 import copy
+import json
+import time
+import threading
 import dataclasses
+from concurrent.futures import ThreadPoolExecutor
 
 from boto_session_manager import BotoSesManager
 import sayt.api as sayt
+from sayt.tracker import Tracker, TrackerIsLockedError
+import whoosh.sorting
+import whoosh.writing
 
 from .paths import dir_index, dir_cache
 from .utils import get_md5_hash
+from .compat import cached_property
 from .base_model import BaseModel
 from .downloader import ResultPath, list_resources
+from .index_registry import index_registry
+from .account_map import profile_account_map
+from .offline import is_offline_mode, is_offline_error
+from .aio import run_in_thread, submit_with_context
+from .regions import get_regional_bsm
 from .documents.api import T_ARS_RESOURCE_DOCUMENT
 
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .accounts import Account
+
 
 SEP = "____"
+#: the region part of the index name of the region-global resource type
+GLOBAL_REGION = "global"
 
 T_MORE_CACHE_KEY = T.Callable[[sayt.T_DOCUMENT], T.List[str]]
+T_PROGRESS_CALLBACK = T.Callable[[int], T.Any]
+
+_index_locks: T.Dict[str, threading.Lock] = dict()
+_index_locks_lock = threading.Lock()
+
+
+def get_index_lock(index_name: str) -> threading.Lock:
+    """
+    Get the in-process lock for the given index. We use it to make sure that
+    only one thread is downloading and indexing the same dataset at a time.
+    """
+    with _index_locks_lock:
+        if index_name not in _index_locks:
+            _index_locks[index_name] = threading.Lock()
+        return _index_locks[index_name]
+
+
+_refresh_threads: T.Dict[str, threading.Thread] = dict()
+_refresh_threads_lock = threading.Lock()
+
+
+def _get_built_at_key(ds: sayt.DataSet) -> str:
+    """
+    The cache key to store the last time the index is built. Unlike the
+    ``ds.cache_key``, it never expires, so we know the age of an expired index.
+    """
+    return f"{ds.cache_key}{SEP}built_at"
+
+
+def _get_manifest_key(ds: sayt.DataSet) -> str:
+    """
+    The cache key to store the ``{document_id: content_hash}`` mapping of the
+    current index. It is used to figure out what has changed since the last
+    time we built the index. It never expires.
+    """
+    return f"{ds.cache_key}{SEP}manifest"
+
+
+def get_doc_hash(row: sayt.T_DOCUMENT, field_names: T.Iterable[str]) -> str:
+    """
+    Get the content hash of a document, only the indexed fields are considered.
+    """
+    return get_md5_hash(
+        json.dumps(
+            [row.get(name) for name in field_names],
+            sort_keys=True,
+            default=str,
+        )
+    )
+
+
+@dataclasses.dataclass
+class SyncResult(BaseModel):
+    """
+    The summary of an index build.
+
+    :param n_inserted: number of new documents.
+    :param n_updated: number of documents that content has changed.
+    :param n_deleted: number of documents that no longer exist.
+    :param n_unchanged: number of documents that are skipped.
+    :param full_rebuild: whether the index is rebuilt from scratch, this happens
+        when there's no previous index, or the index schema has changed.
+    """
+
+    n_inserted: int = dataclasses.field(default=0)
+    n_updated: int = dataclasses.field(default=0)
+    n_deleted: int = dataclasses.field(default=0)
+    n_unchanged: int = dataclasses.field(default=0)
+    full_rebuild: bool = dataclasses.field(default=False)
+
+    @property
+    def n_changed(self) -> int:
+        return self.n_inserted + self.n_updated + self.n_deleted
+
+    def __str__(self) -> str:
+        if self.full_rebuild:
+            return f"rebuilt with {self.n_inserted} docs"
+        return (
+            f"+{self.n_inserted} ~{self.n_updated} -{self.n_deleted} "
+            f"({self.n_unchanged} unchanged)"
+        )
+
+
+def _decode_cursor(cursor: T.Optional[str]) -> int:
+    """
+    Get the offset of the first hit from the cursor of :meth:`BaseSearcher.search_page`.
+    """
+    if cursor is None:
+        return 0
+    try:
+        offset = int(cursor)
+    except ValueError:
+        raise ValueError(f"invalid cursor: {cursor!r}")
+    if offset < 0:
+        raise ValueError(f"invalid cursor: {cursor!r}")
+    return offset
+
+
+@dataclasses.dataclass
+class SearchPage(BaseModel, T.Generic[T_ARS_RESOURCE_DOCUMENT]):
+    """
+    One page of the search result, returned by :meth:`BaseSearcher.search_page`.
+
+    :param result: the elasticsearch liked result, the ``hits`` only has the
+        hits of this page.
+    :param doc_class: the document class of the hits.
+    :param cursor: the cursor of this page.
+    :param next_cursor: the cursor of the next page, None if this is the
+        last page.
+    """
+
+    result: sayt.T_Result = dataclasses.field()
+    doc_class: T.Type[T_ARS_RESOURCE_DOCUMENT] = dataclasses.field()
+    cursor: T.Optional[str] = dataclasses.field(default=None)
+    next_cursor: T.Optional[str] = dataclasses.field(default=None)
+
+    @property
+    def hits(self) -> T.List[dict]:
+        return self.result["hits"]
+
+    @cached_property
+    def docs(self) -> T.List[T_ARS_RESOURCE_DOCUMENT]:
+        """
+        The document objects of this page, they are only created when
+        this property is accessed.
+        """
+        docs = list()
+        for hit in self.hits:
+            doc = self.doc_class.from_dict(hit["_source"])
+            doc.region = hit.get("_region")
+            doc.account = hit.get("_account")
+            doc.partition = hit.get("_partition")
+            docs.append(doc)
+        return docs
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def wait_for_background_refresh(timeout: T.Optional[float] = None):
+    """
+    Wait for all the background refresh threads started by the
+    stale-while-revalidate search to finish.
+    """
+    with _refresh_threads_lock:
+        threads = list(_refresh_threads.values())
+    for thread in threads:
+        thread.join(timeout=timeout)
+
+
+#: the max number of boto sessions to search concurrently in the
+#: multi-region and multi-account search
+MAX_SESSION_WORKERS = 16
+
+#: the max number of child indexes to download concurrently in the wildcard
+#: partitioner search, it is lower to avoid the API throttling
+MAX_PARTITION_WORKERS = 8
+
+
+def merge_hits(
+    ds: sayt.DataSet,
+    labeled_results: T.List[T.Tuple[T.Dict[str, str], sayt.T_Result]],
+    limit: int,
+) -> T.List[dict]:
+    """
+    Merge the search results from multiple regions or accounts into one
+    ranked list.
+
+    Each hit is updated with the labels of its result, for example
+    ``{"_region": "us-east-1"}``. A document that is identical in multiple
+    results (e.g. a global resource) only shows up once. The hits are sorted
+    by the sortable fields of the dataset if any, otherwise by score.
+
+    :param ds: any of the datasets, they share the same schema.
+    :param labeled_results: list of ``(labels, result)`` tuples.
+    :param limit: the max number of hits to return.
+    """
+    hits = list()
+    seen = set()
+    for labels, result in labeled_results:
+        for hit in result["hits"]:
+            source = hit["_source"]
+            key = get_doc_hash(source, sorted(source))
+            if key in seen:
+                continue
+            seen.add(key)
+            hits.append(dict(hit, **labels))
+    if len(ds._sortable_fields):
+        # multi-key sort with per-key direction, the last key first
+        # sort on the typed value (number, datetime), the missing values
+        # are always the last
+        for field_name in reversed(ds._sortable_fields):
+            descending = not ds._fields_mapper[field_name]._is_ascending()
+
+            def get_key(hit: dict, field_name=field_name, descending=descending):
+                value = hit["_source"].get(field_name)
+                return ((value is not None) is descending, value)
+
+            hits.sort(key=get_key, reverse=descending)
+    else:
+        hits.sort(key=lambda hit: -(hit["_score"] or 0))
+    return hits[:limit]
 
 
 def preprocess_query(query: T.Optional[str]) -> str:
@@ -52,19 +274,62 @@ def preprocess_query(query: T.Optional[str]) -> str:
 @dataclasses.dataclass
 class BaseSearcher(BaseModel, T.Generic[T_ARS_RESOURCE_DOCUMENT]):
     """
-    todo: docstring
+    Search one AWS resource type. It calls a boto3 list API, converts the
+    response into documents, indexes them locally with ``sayt``, and runs
+    the full text search against the local index.
+
+    Lifecycle of a :meth:`search`:
+
+    1. :meth:`_get_ds` gets the ``sayt.DataSet`` of the boto session (account,
+       region) and boto kwargs. It is cached in the
+       :data:`~aws_resource_search.index_registry.index_registry`, so there is
+       one dataset per index name per process.
+    2. :meth:`_is_expired` checks whether the index has never been built or
+       is older than ``cache_expire``. If so, :meth:`_build_index` downloads
+       the data and writes the index in batches. Only the changed documents
+       are written (see :class:`SyncResult`), and one thread per index does
+       the work. With ``stale_while_revalidate=True``, an expired index that
+       was built before is searched immediately and rebuilt in the
+       background. If the data can't be downloaded (offline), the existing
+       index is searched.
+    3. :meth:`_run_query` searches the index with the open searcher of the
+       registry. Results are cached per index generation, and a query that
+       only adds more words to a previous query is filtered in memory.
+
+    Other public methods:
 
-    :param service:
-    :param method:
-    :param is_paginator:
-    :param default_boto_kwargs:
-    :param result_path:
-    :param doc_class:
-    :param resource_type:
-    :param fields:
-    :param cache_expire:
-    :param more_cache_key:
-    :param bsm:
+    - :meth:`search_page`: cursor based paging over the search result.
+    - :meth:`sync_index` / :meth:`build_index`: build the index ahead of
+      time, for example, in ``ars warm``.
+    - :meth:`read_repair`: write a freshly fetched document back into the
+      index.
+    - :meth:`asearch`: the asyncio version of :meth:`search`.
+    - :meth:`search_regions`, :meth:`search_accounts`,
+      :meth:`search_partitions`: search many indexes concurrently with
+      :meth:`search_sessions` and merge the hits.
+
+    A searcher is a shared definition, pass the ``bsm`` argument per call
+    instead of setting :attr:`bsm` on it.
+
+    :param service: the boto3 service name, for example, ``"s3"``.
+    :param method: the boto3 client method name, for example, ``"list_buckets"``.
+    :param is_paginator: whether to call the method with a paginator.
+    :param default_boto_kwargs: the default boto3 keyword arguments of the
+        method, the ``boto_kwargs`` of each call are merged into it.
+    :param result_path: how to extract the resource list from the response.
+    :param doc_class: the document class, it converts a resource into a
+        document.
+    :param resource_type: the unique name of the resource type, for example,
+        ``"s3-bucket"``.
+    :param fields: the ``sayt`` fields of the index.
+    :param cache_expire: how many seconds the index is valid.
+    :param more_cache_key: a function that takes the final boto kwargs and
+        returns more strings for the index name, for the resource type that
+        has a parent resource (for example, glue table).
+    :param bsm: the default boto session if the ``bsm`` argument is not given.
+    :param is_global: if True, the list API returns the same account-wide data
+        in every region (e.g. S3 bucket, IAM role), so all regions of
+        an account share one index and cache entry.
     """
 
     # list resources related
@@ -82,6 +347,8 @@ class BaseSearcher(BaseModel, T.Generic[T_ARS_RESOURCE_DOCUMENT]):
     more_cache_key: T.Optional[T_MORE_CACHE_KEY] = dataclasses.field()
     # boto session
     bsm: T.Optional[BotoSesManager] = dataclasses.field(default=None)
+    # region-global resource type
+    is_global: bool = dataclasses.field(default=False)
 
     def _get_bsm(
         self,
@@ -105,16 +372,17 @@ class BaseSearcher(BaseModel, T.Generic[T_ARS_RESOURCE_DOCUMENT]):
         """
         Get the logical unique fingerprint of the boto3 session. It will be
         used in the index name and cache key naming convention.
+
+        It is the account id, not the profile name, so all profiles of the
+        same account share the same indexes. The account id of a profile is
+        remembered in :data:`~aws_resource_search.account_map.profile_account_map`.
         """
-        if str(bsm.profile_name) == "Sentinel('NOTHING')":
-            account_or_profile = bsm.aws_account_id
-        else:  # pragma: no cover
-            account_or_profile = bsm.profile_name
+        account_id = profile_account_map.get_account_id(bsm)
         if bsm.aws_region is None:  # pragma: no cover
             region = "unknown-region"
         else:
             region = bsm.aws_region
-        return account_or_profile, region
+        return account_id, region
 
     def _get_final_boto_kwargs(self, boto_kwargs: T.Optional[dict] = None) -> dict:
         """
@@ -129,58 +397,502 @@ class BaseSearcher(BaseModel, T.Generic[T_ARS_RESOURCE_DOCUMENT]):
             final_boto_kwargs.update(boto_kwargs)
         return final_boto_kwargs
 
-    def _get_ds(
+    def _get_index_name(
         self,
         bsm: BotoSesManager,
         final_boto_kwargs: dict,
-    ) -> sayt.DataSet:
+    ) -> str:
         """
-        Get the corresponding ``sayt.DataSet`` object.
+        Get the index name of the dataset. It is also used as the cache key
+        and cache tag.
         """
-        account_or_profile, region = self._get_bsm_fingerprint(bsm=bsm)
+        account_id, region = self._get_bsm_fingerprint(bsm=bsm)
+        if self.is_global:
+            region = GLOBAL_REGION
         if self.more_cache_key is None:
-            index_name = SEP.join([account_or_profile, region, self.resource_type])
+            return SEP.join([account_id, region, self.resource_type])
         else:
-            index_name = SEP.join(
+            return SEP.join(
                 [
-                    account_or_profile,
+                    account_id,
                     region,
                     self.resource_type,
                     get_md5_hash(SEP.join(self.more_cache_key(final_boto_kwargs))),
                 ]
             )
+
+    def _get_ds(
+        self,
+        bsm: BotoSesManager,
+        final_boto_kwargs: dict,
+    ) -> sayt.DataSet:
+        """
+        Get the corresponding ``sayt.DataSet`` object. The dataset object is
+        cached in the :data:`~aws_resource_search.index_registry.index_registry`,
+        so it is only created once per process.
+        """
+        index_name = self._get_index_name(bsm=bsm, final_boto_kwargs=final_boto_kwargs)
         cache_key = index_name
         cache_tag = index_name
 
         def downloader():
-            resource_data_iter_proxy = list_resources(
+            # the profiles of the same account share the dataset, use the
+            # boto session of the latest search
+            latest_bsm, latest_boto_kwargs = index_registry.get_boto_context(
+                index_name=index_name,
                 bsm=bsm,
+                boto_kwargs=final_boto_kwargs,
+            )
+            resource_data_iter_proxy = list_resources(
+                bsm=latest_bsm,
                 service=self.service,
                 method=self.method,
                 is_paginator=self.is_paginator,
-                boto_kwargs=final_boto_kwargs,
+                boto_kwargs=latest_boto_kwargs,
                 result_path=self.result_path,
             )
             for document in self.doc_class.from_many_resources(
                 resources=resource_data_iter_proxy,
-                bsm=bsm,
-                boto_kwargs=final_boto_kwargs,
+                bsm=latest_bsm,
+                boto_kwargs=latest_boto_kwargs,
             ):
-                doc_dict = document.to_dict()
-                # print(doc_dict) # for DEBUG ONLY
-                yield doc_dict
+                yield document.to_dict()
+
+        def factory():
+            return sayt.DataSet(
+                dir_index=dir_index,
+                index_name=index_name,
+                fields=self.fields,
+                dir_cache=dir_cache,
+                cache_key=cache_key,
+                cache_tag=cache_tag,
+                cache_expire=self.cache_expire,
+                downloader=downloader,
+            )
 
-        return sayt.DataSet(
-            dir_index=dir_index,
+        return index_registry.get_ds(
             index_name=index_name,
-            fields=self.fields,
-            dir_cache=dir_cache,
-            cache_key=cache_key,
-            cache_tag=cache_tag,
-            cache_expire=self.cache_expire,
-            downloader=downloader,
+            bsm=bsm,
+            boto_kwargs=final_boto_kwargs,
+            factory=factory,
+        )
+
+    @staticmethod
+    def _is_expired(ds: sayt.DataSet) -> bool:
+        """
+        Check if the dataset has never been indexed or the cache is expired.
+        """
+        return index_registry.is_expired(ds)
+
+    def _build_index(
+        self,
+        ds: sayt.DataSet,
+        refresh_data: bool = False,
+        multi_thread: bool = True,
+        incremental: bool = True,
+        batch_size: T.Optional[int] = None,
+        progress_callback: T.Optional[T_PROGRESS_CALLBACK] = None,
+    ) -> T.Optional[SyncResult]:
+        """
+        Download the data and build the index if the dataset is expired,
+        or we explicitly want to refresh it. See :meth:`_write_index` for
+        the ``batch_size`` and ``progress_callback`` arguments.
+
+        It uses an in-process lock per index, so if multiple threads try to
+        build the same index, only the first one will do the work, others
+        will just wait and reuse the result.
+
+        :return: the :class:`SyncResult` if building index happened, otherwise None.
+        """
+        if (refresh_data is False) and (self._is_expired(ds) is False):
+            return None
+        with get_index_lock(ds.index_name):
+            # double check, another thread may just finish the work
+            if (refresh_data is False) and (self._is_expired(ds) is False):
+                return None
+            try:
+                # prevent other process (e.g. ``ars warm``) from indexing
+                # the same dataset at the same time
+                with Tracker.lock(ds._path_tracker, expire=300):
+                    return self._write_index(
+                        ds=ds,
+                        docs=ds.downloader(),
+                        multi_thread=multi_thread,
+                        incremental=incremental,
+                        batch_size=batch_size,
+                        progress_callback=progress_callback,
+                    )
+            except TrackerIsLockedError:  # pragma: no cover
+                # another process is indexing, wait for it and reuse the result
+                while Tracker.new(ds._path_tracker).is_locked():
+                    time.sleep(0.1)
+                return None
+
+    @staticmethod
+    def _write_index(
+        ds: sayt.DataSet,
+        docs: T.Iterable[sayt.T_DOCUMENT],
+        multi_thread: bool = True,
+        memory_limit: int = 512,
+        incremental: bool = True,
+        batch_size: T.Optional[int] = None,
+        progress_callback: T.Optional[T_PROGRESS_CALLBACK] = None,
+    ) -> SyncResult:
+        """
+        Update the whoosh index from the given documents and mark the dataset
+        as fresh in the cache.
+
+        If the index was built before, we compare the content hash of each
+        document with the one we stored last time, and only apply the inserts,
+        updates and deletes to the existing index. Otherwise, we rebuild
+        the index from scratch.
+
+        .. note::
+
+            This is equivalent to ``sayt.DataSet.build_index``, but it doesn't
+            touch the global ``sayt`` logger, so it is safe to call it from
+            multiple threads. Also, it replaces the old data in one atomic
+            commit instead of removing the index first, so the readers
+            can still search the old data while we are indexing.
+
+        :param incremental: if False, always rebuild the index from scratch.
+        :param batch_size: if given, commit the changes every ``batch_size``
+            writes, so the documents indexed so far are searchable while the
+            rest of the data is still downloading, and the writer never holds
+            more than one batch in memory. The dataset is marked as fresh
+            only after the last batch.
+        :param progress_callback: a function that takes the number of
+            documents processed so far, it is called after each batch commit.
+        """
+        manifest_key = _get_manifest_key(ds)
+        idx = ds._get_index()
+        old_manifest: T.Optional[T.Dict[str, str]] = ds.cache.get(manifest_key)
+        # the field declaration is changed, we have to start over
+        if sorted(idx.schema.names()) != sorted(ds.schema.names()):  # pragma: no cover
+            idx.close()
+            ds.remove_index()
+            idx = ds._get_index()
+            old_manifest = None
+        full_rebuild = (incremental is False) or (old_manifest is None)
+        if full_rebuild:
+            old_manifest = dict()
+
+        def new_writer():
+            # multi-processing writer doesn't pay off for small batches
+            if full_rebuild and multi_thread and batch_size is None:  # pragma: no cover
+                return idx.writer(
+                    limitmb=memory_limit,
+                    procs=os.cpu_count(),
+                    multisegment=True,
+                )
+            else:
+                return idx.writer(limitmb=memory_limit)
+
+        # the first commit of a full rebuild drops all the old segments
+        first_mergetype = whoosh.writing.CLEAR if full_rebuild else None
+
+        def commit_batch():
+            nonlocal first_mergetype
+            if first_mergetype is None:
+                writer.commit()
+            else:
+                writer.commit(mergetype=first_mergetype)
+                first_mergetype = None
+
+        writer = new_writer()
+        sync_result = SyncResult(full_rebuild=full_rebuild)
+        new_manifest: T.Dict[str, str] = dict()
+        n_pending = 0
+        try:
+            for row in docs:
+                if batch_size and n_pending >= batch_size:
+                    commit_batch()
+                    n_pending = 0
+                    if progress_callback is not None:
+                        progress_callback(len(new_manifest))
+                    writer = new_writer()
+                row = {name: row.get(name) for name in ds._field_names}
+                doc_id = row["id"]
+                doc_hash = get_doc_hash(row, ds._field_names)
+                # some resources may share the same id, we just add all of them
+                # and combine the hash, so the next sync will re-index them
+                if doc_id in new_manifest:
+                    new_manifest[doc_id] = get_md5_hash(new_manifest[doc_id] + doc_hash)
+                    writer.add_document(**row)
+                    n_pending += 1
+                    sync_result.n_inserted += 1
+                    continue
+                new_manifest[doc_id] = doc_hash
+                old_hash = old_manifest.get(doc_id)
+                if old_hash == doc_hash:
+                    sync_result.n_unchanged += 1
+                    continue
+                if old_hash is None:
+                    sync_result.n_inserted += 1
+                else:
+                    writer.delete_by_term("id", doc_id)
+                    sync_result.n_updated += 1
+                writer.add_document(**row)
+                n_pending += 1
+            for doc_id in old_manifest:
+                if doc_id not in new_manifest:
+                    writer.delete_by_term("id", doc_id)
+                    n_pending += 1
+                    sync_result.n_deleted += 1
+        except Exception as e:
+            writer.cancel()
+            # some batches may be committed, the manifest no longer matches
+            # the index, so the next build has to start over
+            if first_mergetype is None:
+                ds.cache.delete(manifest_key)
+            raise e
+
+        if n_pending or (first_mergetype is not None):
+            commit_batch()
+        else:
+            writer.cancel()
+        if progress_callback is not None:
+            progress_callback(len(new_manifest))
+        # the query cache is based on the old data, evict it
+        if sync_result.n_changed:
+            ds.remove_cache()
+        ds.cache.set(
+            ds.cache_key,
+            ds.index_name,
+            expire=ds.cache_expire,
+            tag=ds.cache_tag,
+        )
+        index_registry.mark_fresh(ds)
+        ds.cache.set(_get_built_at_key(ds), index_registry.get_handle(ds).built_at)
+        ds.cache.set(manifest_key, new_manifest)
+        return sync_result
+
+    @staticmethod
+    def _get_index_age(ds: sayt.DataSet) -> T.Optional[float]:
+        """
+        Get how many seconds ago the index was built. Return None if the index
+        has never been built.
+        """
+        handle = index_registry.get_handle(ds)
+        if not handle.built_at:
+            built_at = ds.cache.get(_get_built_at_key(ds))
+            if built_at is None:
+                return None
+            handle.built_at = built_at
+        return time.time() - handle.built_at
+
+    def _refresh_in_background(
+        self,
+        ds: sayt.DataSet,
+        refresh_data: bool = True,
+        batch_size: T.Optional[int] = None,
+        progress_callback: T.Optional[T_PROGRESS_CALLBACK] = None,
+    ) -> threading.Thread:
+        """
+        Rebuild the index in a background thread. There will be at most one
+        background refresh per index at a time.
+
+        :return: the thread that is refreshing the index, it could be the
+            one started by a previous call.
+        """
+        with _refresh_threads_lock:
+            thread = _refresh_threads.get(ds.index_name)
+            if thread is not None and thread.is_alive():
+                return thread
+
+            def refresh():
+                try:
+                    self._build_index(
+                        ds=ds,
+                        refresh_data=refresh_data,
+                        multi_thread=False,
+                        batch_size=batch_size,
+                        progress_callback=progress_callback,
+                    )
+                # the next search will try again
+                except Exception:  # pragma: no cover
+                    pass
+
+            thread = threading.Thread(target=refresh, daemon=True)
+            _refresh_threads[ds.index_name] = thread
+            thread.start()
+            return thread
+
+    @staticmethod
+    def _run_query(
+        ds: sayt.DataSet,
+        query: str,
+        limit: int,
+    ) -> sayt.T_Result:
+        """
+        Search the index without checking the expiration. It reuses the
+        open index searcher in the registry.
+
+        The result is cached per index generation. If the query only appends
+        more words to a previous query, we filter the previous result in
+        memory instead of searching the whole index again.
+        """
+        st = time.process_time()
+        with index_registry.handle(ds) as handle:
+            hits = handle.query_cache.get(query, limit)
+            cache = hits is not None
+            if hits is None:
+                searcher = handle.searcher
+                base = None
+                # the narrowed result keeps the order only if it is sorted
+                if len(ds._sortable_fields):
+                    base = handle.query_cache.find_base(query, limit)
+                if base is None:
+                    search_kwargs = dict(q=ds._parse_query(query), limit=limit)
+                    if len(ds._sortable_fields):
+                        multi_facet = whoosh.sorting.MultiFacet()
+                        for field_name in ds._sortable_fields:
+                            field = ds._fields_mapper[field_name]
+                            multi_facet.add_field(
+                                field_name, reverse=not field._is_ascending()
+                            )
+                        search_kwargs["sortedby"] = multi_facet
+                    hits = [
+                        {
+                            "_id": hit.docnum,
+                            "_score": hit.score,
+                            "_source": hit.fields(),
+                        }
+                        for hit in searcher.search(**search_kwargs)
+                    ]
+                else:
+                    extra_query, base_hits = base
+                    docnums = set(searcher.docs_for_query(ds._parse_query(extra_query)))
+                    hits = [hit for hit in base_hits if hit["_id"] in docnums][:limit]
+                handle.query_cache.put(query, limit, hits)
+        et = time.process_time()
+        return {
+            "index": ds.index_name,
+            "took": int((et - st) // 0.001),
+            "size": len(hits),
+            "fresh": False,
+            "cache": cache,
+            "hits": hits,
+        }
+
+    def read_repair(
+        self,
+        doc: T_ARS_RESOURCE_DOCUMENT,
+        boto_kwargs: T.Optional[dict] = None,
+        bsm: T.Optional[BotoSesManager] = None,
+    ) -> bool:
+        """
+        Write the latest version of a document back into the existing index,
+        for example, the one we just fetched in the detail view. It does
+        nothing if the index has never been built, the document is unchanged,
+        or someone else is writing the index.
+
+        :param doc: the document object with the latest data.
+        :param boto_kwargs: additional boto3 keyword arguments, it has to be
+            the same as the one you used to search the document.
+        :param bsm: you can explicitly use a ``BotoSesManager`` object to override
+            the default one you defined when creating the :class:`aws_resource_search.base_searcher.BaseSearcher`` object.
+
+        :return: a boolean value to indicate whether the index is updated.
+        """
+        final_boto_kwargs = self._get_final_boto_kwargs(boto_kwargs=boto_kwargs)
+        ds = self._get_ds(
+            bsm=self._get_bsm(bsm),
+            final_boto_kwargs=final_boto_kwargs,
+        )
+        manifest_key = _get_manifest_key(ds)
+        manifest: T.Optional[T.Dict[str, str]] = ds.cache.get(manifest_key)
+        if not manifest or doc.id not in manifest:
+            return False
+        doc_dict = doc.to_dict()
+        row = {name: doc_dict.get(name) for name in ds._field_names}
+        doc_hash = get_doc_hash(row, ds._field_names)
+        if manifest[doc.id] == doc_hash:
+            return False
+        lock = get_index_lock(ds.index_name)
+        # don't wait for the index building, the repair is just best effort
+        if lock.acquire(blocking=False) is False:  # pragma: no cover
+            return False
+        try:
+            if Tracker.new(ds._path_tracker).is_locked():  # pragma: no cover
+                return False
+            writer = ds._get_index().writer()
+            try:
+                writer.delete_by_term("id", doc.id)
+                writer.add_document(**row)
+            except Exception as e:  # pragma: no cover
+                writer.cancel()
+                raise e
+            writer.commit()
+            manifest[doc.id] = doc_hash
+            ds.cache.set(manifest_key, manifest)
+            return True
+        finally:
+            lock.release()
+
+    def sync_index(
+        self,
+        boto_kwargs: T.Optional[dict] = None,
+        refresh_data: bool = False,
+        multi_thread: bool = True,
+        bsm: T.Optional[BotoSesManager] = None,
+        incremental: bool = True,
+        batch_size: T.Optional[int] = None,
+        progress_callback: T.Optional[T_PROGRESS_CALLBACK] = None,
+    ) -> T.Optional[SyncResult]:
+        """
+        Download the data and apply the changes to the index ahead of time,
+        so that the following :meth:`search` can return the result immediately.
+
+        :param boto_kwargs: additional boto3 keyword arguments
+        :param refresh_data: force to refresh the data even if the index is not expired
+        :param multi_thread: use multi-processing to build index, you may want
+            to turn it off if you are building many indexes concurrently.
+        :param bsm: you can explicitly use a ``BotoSesManager`` object to override
+            the default one you defined when creating the :class:`aws_resource_search.base_searcher.BaseSearcher`` object.
+        :param incremental: if True, only apply the inserts, updates and deletes
+            to the existing index, otherwise rebuild the index from scratch.
+        :param batch_size: commit every ``batch_size`` writes, so that the
+            partial index is searchable while downloading.
+        :param progress_callback: a function that takes the number of
+            documents processed so far, it is called after each batch.
+
+        :return: the :class:`SyncResult` with the delta counts if building
+            index happened, otherwise None.
+        """
+        final_boto_kwargs = self._get_final_boto_kwargs(boto_kwargs=boto_kwargs)
+        ds = self._get_ds(
+            bsm=self._get_bsm(bsm),
+            final_boto_kwargs=final_boto_kwargs,
+        )
+        return self._build_index(
+            ds=ds,
+            refresh_data=refresh_data,
+            multi_thread=multi_thread,
+            incremental=incremental,
+            batch_size=batch_size,
+            progress_callback=progress_callback,
         )
 
+    def build_index(
+        self,
+        boto_kwargs: T.Optional[dict] = None,
+        refresh_data: bool = False,
+        multi_thread: bool = True,
+        bsm: T.Optional[BotoSesManager] = None,
+    ) -> bool:
+        """
+        Same as :meth:`sync_index`, but only return a boolean value to
+        indicate whether building index happened.
+        """
+        sync_result = self.sync_index(
+            boto_kwargs=boto_kwargs,
+            refresh_data=refresh_data,
+            multi_thread=multi_thread,
+            bsm=bsm,
+        )
+        return sync_result is not None
+
     def search(
         self,
         query: str = "*",
@@ -190,37 +902,453 @@ class BaseSearcher(BaseModel, T.Generic[T_ARS_RESOURCE_DOCUMENT]):
         simple_response: bool = True,
         verbose: bool = False,
         bsm: T.Optional[BotoSesManager] = None,
+        stale_while_revalidate: bool = False,
+        regions: T.Optional[T.List[str]] = None,
+        accounts: T.Optional[T.List["Account"]] = None,
+        partitions: T.Optional[T.List[T.Tuple[str, dict]]] = None,
     ) -> T.Union[sayt.T_Result, T.List[T_ARS_RESOURCE_DOCUMENT]]:
         """
         Search the dataset.
 
+        If the index was built before, and we can't refresh it because there
+        is no network or the credential is expired, or the offline mode is on
+        (see :mod:`aws_resource_search.offline`), the existing index is
+        searched and the ``offline`` field in the result is True.
+
         :param query: query string
         :param limit: the max number of results to return
         :param boto_kwargs: additional boto3 keyword arguments
         :param refresh_data: force to refresh the data
         :param simple_response: if True, then return a list of ``T_ARS_RESOURCE_DOCUMENT``
             objects, otherwise return the elasticsearch liked result.
-        :param verbose: whether to print the log
+        :param verbose: no effect, it is kept for backward compatibility.
         :param bsm: you can explicitly use a ``BotoSesManager`` object to override
             the default one you defined when creating the :class:`aws_resource_search.base_searcher.BaseSearcher`` object.
+        :param stale_while_revalidate: if True, and the index is expired but
+            it was built before, then search the expired index immediately
+            and refresh it in a background thread. The ``stale`` and ``age``
+            (in seconds) fields in the elasticsearch liked result tell you
+            whether the result comes from an expired index.
+        :param regions: search the same resource type in these regions
+            concurrently, and merge the results, see :meth:`search_regions`.
+            Each document has a ``region`` attribute.
+        :param accounts: search the same resource type in these AWS accounts
+            concurrently, and merge the results, see :meth:`search_accounts`.
+            Each document has an ``account`` attribute. The ``bsm`` argument
+            is ignored.
+        :param partitions: search the resource type under these parent
+            resources concurrently, and merge the results, see
+            :meth:`search_partitions`. Each document has a ``partition``
+            attribute. The ``boto_kwargs`` argument is ignored. It can't be
+            used with ``regions`` or ``accounts``.
         """
+        if partitions is not None and (accounts or regions):
+            raise ValueError("partitions can't be used with regions or accounts")
+        if accounts or regions or partitions:
+            if partitions:
+                result = self.search_partitions(
+                    partitions=partitions,
+                    query=query,
+                    limit=limit,
+                    refresh_data=refresh_data,
+                    bsm=bsm,
+                    stale_while_revalidate=stale_while_revalidate,
+                )
+            elif accounts:
+                result = self.search_accounts(
+                    accounts=accounts,
+                    regions=regions,
+                    query=query,
+                    limit=limit,
+                    boto_kwargs=boto_kwargs,
+                    refresh_data=refresh_data,
+                    stale_while_revalidate=stale_while_revalidate,
+                )
+            else:
+                result = self.search_regions(
+                    regions=regions,
+                    query=query,
+                    limit=limit,
+                    boto_kwargs=boto_kwargs,
+                    refresh_data=refresh_data,
+                    bsm=bsm,
+                    stale_while_revalidate=stale_while_revalidate,
+                )
+            if simple_response:
+                docs = list()
+                for hit in result["hits"]:
+                    doc = self.doc_class.from_dict(hit["_source"])
+                    doc.region = hit.get("_region")
+                    doc.account = hit.get("_account")
+                    doc.partition = hit.get("_partition")
+                    docs.append(doc)
+                return docs
+            else:
+                return result
+
         final_boto_kwargs = self._get_final_boto_kwargs(boto_kwargs=boto_kwargs)
         ds = self._get_ds(
             bsm=self._get_bsm(bsm),
             final_boto_kwargs=final_boto_kwargs,
         )
         final_query = preprocess_query(query)
-        result = ds.search(
-            query=final_query,
+        age = self._get_index_age(ds)
+        offline = False
+        # never refresh the existing index in offline mode
+        if (age is not None) and is_offline_mode():
+            offline = True
+            result = self._run_query(ds=ds, query=final_query, limit=limit)
+            result["stale"] = self._is_expired(ds)
+        elif (
+            stale_while_revalidate
+            and (refresh_data is False)
+            and (age is not None)
+            and self._is_expired(ds)
+        ):
+            self._refresh_in_background(ds)
+            result = self._run_query(ds=ds, query=final_query, limit=limit)
+            result["stale"] = True
+        else:
+            try:
+                sync_result = self._build_index(ds=ds, refresh_data=refresh_data)
+            except Exception as e:
+                # no network or the credential is expired, search the existing index
+                if (age is None) or (is_offline_error(e) is False):
+                    raise e
+                sync_result = None
+                offline = True
+            fresh = sync_result is not None
+            if fresh:
+                age = 0
+            result = self._run_query(ds=ds, query=final_query, limit=limit)
+            result["fresh"] = fresh
+            result["stale"] = offline
+        result["age"] = age
+        result["offline"] = offline
+        if simple_response:
+            return [self.doc_class.from_dict(dct["_source"]) for dct in result["hits"]]
+        else:
+            return result
+
+    async def asearch(
+        self,
+        query: str = "*",
+        limit: int = 50,
+        boto_kwargs: T.Optional[dict] = None,
+        refresh_data: bool = False,
+        simple_response: bool = True,
+        verbose: bool = False,
+        bsm: T.Optional["BotoSesManager"] = None,
+        stale_while_revalidate: bool = False,
+        regions: T.Optional[T.List[str]] = None,
+        accounts: T.Optional[T.List["Account"]] = None,
+        partitions: T.Optional[T.List[T.Tuple[str, dict]]] = None,
+    ) -> T.Union[sayt.T_Result, T.List[T_ARS_RESOURCE_DOCUMENT]]:
+        """
+        The asyncio version of :meth:`search`, it takes the same arguments.
+        Searches of different resource types can run concurrently in one
+        event loop with ``asyncio.gather``. If the task is cancelled, the
+        index building stops before downloading the next page, see
+        :mod:`aws_resource_search.aio`.
+        """
+        return await run_in_thread(
+            self.search,
+            query=query,
             limit=limit,
-            simple_response=False,
+            boto_kwargs=boto_kwargs,
             refresh_data=refresh_data,
+            simple_response=simple_response,
             verbose=verbose,
+            bsm=bsm,
+            stale_while_revalidate=stale_while_revalidate,
+            regions=regions,
+            accounts=accounts,
+            partitions=partitions,
         )
-        if simple_response:
-            return [self.doc_class.from_dict(dct["_source"]) for dct in result["hits"]]
+
+    def search_page(
+        self,
+        query: str = "*",
+        page_size: int = 20,
+        cursor: T.Optional[str] = None,
+        boto_kwargs: T.Optional[dict] = None,
+        refresh_data: bool = False,
+        bsm: T.Optional["BotoSesManager"] = None,
+        stale_while_revalidate: bool = False,
+        regions: T.Optional[T.List[str]] = None,
+        accounts: T.Optional[T.List["Account"]] = None,
+        partitions: T.Optional[T.List[T.Tuple[str, dict]]] = None,
+    ) -> SearchPage[T_ARS_RESOURCE_DOCUMENT]:
+        """
+        Similar to :meth:`search`, but return one page of the result, so you
+        can reach the results beyond the ``limit`` of :meth:`search`.
+
+        Example::
+
+            >>> page = searcher.search_page("my bucket", page_size=20)
+            >>> while True:
+            ...     for doc in page.docs:
+            ...         print(doc.name)
+            ...     if page.has_next is False:
+            ...         break
+            ...     page = searcher.search_page(
+            ...         "my bucket", page_size=20, cursor=page.next_cursor,
+            ...     )
+
+        :param page_size: the max number of hits in one page.
+        :param cursor: the ``next_cursor`` of the previous page, None means
+            the first page. The cursor is an opaque string, it is only valid
+            for the same query, and it may skip or repeat some hits if the
+            index is refreshed in between.
+
+        See :meth:`search` for the other arguments.
+        """
+        offset = _decode_cursor(cursor)
+        # ask for one more hit to know whether there is a next page
+        result = self.search(
+            query=query,
+            limit=offset + page_size + 1,
+            boto_kwargs=boto_kwargs,
+            refresh_data=refresh_data,
+            simple_response=False,
+            bsm=bsm,
+            stale_while_revalidate=stale_while_revalidate,
+            regions=regions,
+            accounts=accounts,
+            partitions=partitions,
+        )
+        hits = result["hits"]
+        if len(hits) > offset + page_size:
+            next_cursor = str(offset + page_size)
         else:
-            return result
+            next_cursor = None
+        result["hits"] = hits[offset : offset + page_size]
+        result["size"] = len(result["hits"])
+        return SearchPage(
+            result=result,
+            doc_class=self.doc_class,
+            cursor=cursor,
+            next_cursor=next_cursor,
+        )
+
+    def search_sessions(
+        self,
+        sessions: T.List[
+            T.Union[
+                T.Tuple[T.Dict[str, str], BotoSesManager],
+                T.Tuple[T.Dict[str, str], BotoSesManager, T.Optional[dict]],
+            ]
+        ],
+        query: str = "*",
+        limit: int = 50,
+        boto_kwargs: T.Optional[dict] = None,
+        refresh_data: bool = False,
+        stale_while_revalidate: bool = False,
+        max_workers: int = MAX_SESSION_WORKERS,
+    ) -> sayt.T_Result:
+        """
+        Search the same resource type with multiple boto sessions. Each
+        session has its own index, they are downloaded and queried
+        concurrently, so the wall time is close to a single search.
+
+        A session that fails (e.g. the region is not enabled, or the role
+        can't be assumed) is skipped and reported in the ``errors`` field,
+        unless all sessions fail.
+
+        :param sessions: list of ``(labels, bsm)`` tuples, the labels are
+            added to each hit, for example ``{"_region": "us-east-1"}``.
+            It can also be a ``(labels, bsm, boto_kwargs)`` tuple, then the
+            ``boto_kwargs`` of the session is used instead of the argument.
+        :param max_workers: the max number of sessions to search concurrently.
+
+        :return: the elasticsearch liked result. The ``index`` field is the
+            comma separated index names. The ``errors`` field is a dict of
+            the failed session label and the error message.
+        """
+        final_query = preprocess_query(query)
+
+        def search_session(
+            bsm: BotoSesManager,
+            session_boto_kwargs: T.Optional[dict],
+        ) -> sayt.T_Result:
+            return self.search(
+                query=final_query,
+                limit=limit,
+                boto_kwargs=session_boto_kwargs,
+                refresh_data=refresh_data,
+                simple_response=False,
+                bsm=bsm,
+                stale_while_revalidate=stale_while_revalidate,
+            )
+
+        st = time.process_time()
+        labeled_results = list()
+        errors = dict()
+        max_workers = max(1, min(len(sessions), max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = list()
+            for session in sessions:
+                labels, bsm = session[0], session[1]
+                session_boto_kwargs = session[2] if len(session) >= 3 else boto_kwargs
+                future = submit_with_context(
+                    executor, search_session, bsm, session_boto_kwargs
+                )
+                futures.append((labels, bsm, session_boto_kwargs, future))
+            for labels, bsm, session_boto_kwargs, future in futures:
+                try:
+                    labeled_results.append(
+                        (labels, bsm, session_boto_kwargs, future.result())
+                    )
+                except Exception as e:
+                    errors["/".join(labels.values())] = e
+        if len(labeled_results) == 0:
+            raise list(errors.values())[0]
+
+        ds = self._get_ds(
+            bsm=labeled_results[0][1],
+            final_boto_kwargs=self._get_final_boto_kwargs(
+                boto_kwargs=labeled_results[0][2]
+            ),
+        )
+        results = [result for _, _, _, result in labeled_results]
+        hits = merge_hits(
+            ds=ds,
+            labeled_results=[
+                (labels, result) for labels, _, _, result in labeled_results
+            ],
+            limit=limit,
+        )
+        ages = [result["age"] for result in results]
+        et = time.process_time()
+        return {
+            "index": ",".join(result["index"] for result in results),
+            "took": int((et - st) // 0.001),
+            "size": len(hits),
+            "fresh": any(result["fresh"] for result in results),
+            "cache": all(result["cache"] for result in results),
+            "stale": any(result["stale"] for result in results),
+            "offline": any(result["offline"] for result in results),
+            "age": None if None in ages else max(ages),
+            "errors": {label: repr(e) for label, e in errors.items()},
+            "hits": hits,
+        }
+
+    def search_regions(
+        self,
+        regions: T.List[str],
+        query: str = "*",
+        limit: int = 50,
+        boto_kwargs: T.Optional[dict] = None,
+        refresh_data: bool = False,
+        bsm: T.Optional[BotoSesManager] = None,
+        stale_while_revalidate: bool = False,
+    ) -> sayt.T_Result:
+        """
+        Search the same resource type in multiple regions with
+        :meth:`search_sessions`. Each hit has a ``_region`` field, except
+        for the region-global resource type, which is only searched once.
+
+        :param regions: list of region names.
+        """
+        final_bsm = self._get_bsm(bsm)
+        if self.is_global:
+            sessions = [({}, final_bsm)]
+        else:
+            sessions = [
+                ({"_region": region}, get_regional_bsm(final_bsm, region))
+                for region in regions
+            ]
+        return self.search_sessions(
+            sessions=sessions,
+            query=query,
+            limit=limit,
+            boto_kwargs=boto_kwargs,
+            refresh_data=refresh_data,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+
+    def search_partitions(
+        self,
+        partitions: T.List[T.Tuple[str, dict]],
+        query: str = "*",
+        limit: int = 50,
+        refresh_data: bool = False,
+        bsm: T.Optional[BotoSesManager] = None,
+        stale_while_revalidate: bool = False,
+        max_workers: int = MAX_PARTITION_WORKERS,
+    ) -> sayt.T_Result:
+        """
+        Search the resource type that has a partitioner (for example, glue
+        table) under many parent resources (for example, all glue databases)
+        with :meth:`search_sessions`. Each parent has its own index, they are
+        downloaded concurrently with at most ``max_workers`` threads. Each
+        hit has a ``_partition`` field, which is the name of the parent.
+
+        :param partitions: list of ``(partition name, boto_kwargs)`` tuples,
+            see :meth:`aws_resource_search.ars_def.ARS.get_partitions`.
+        """
+        final_bsm = self._get_bsm(bsm)
+        sessions = [
+            ({"_partition": name}, final_bsm, boto_kwargs)
+            for name, boto_kwargs in partitions
+        ]
+        return self.search_sessions(
+            sessions=sessions,
+            query=query,
+            limit=limit,
+            refresh_data=refresh_data,
+            stale_while_revalidate=stale_while_revalidate,
+            max_workers=max_workers,
+        )
+
+    def search_accounts(
+        self,
+        accounts: T.List["Account"],
+        regions: T.Optional[T.List[str]] = None,
+        query: str = "*",
+        limit: int = 50,
+        boto_kwargs: T.Optional[dict] = None,
+        refresh_data: bool = False,
+        stale_while_revalidate: bool = False,
+    ) -> sayt.T_Result:
+        """
+        Search the same resource type in multiple AWS accounts with
+        :meth:`search_sessions`. Each hit has an ``_account`` field, which is
+        the :attr:`~aws_resource_search.accounts.Account.name`, and
+        a ``_region`` field.
+
+        :param accounts: list of :class:`~aws_resource_search.accounts.Account`.
+        :param regions: also search these regions in every account, if not
+            given, only search the default region of each account. It is
+            ignored for the region-global resource type.
+        """
+        sessions = list()
+        for account in accounts:
+            if self.is_global:
+                sessions.append(({"_account": account.name}, account.bsm))
+            elif regions:
+                for region in regions:
+                    sessions.append(
+                        (
+                            {"_account": account.name, "_region": region},
+                            get_regional_bsm(account.bsm, region),
+                        )
+                    )
+            else:
+                sessions.append(
+                    (
+                        {"_account": account.name, "_region": account.bsm.aws_region},
+                        account.bsm,
+                    )
+                )
+        return self.search_sessions(
+            sessions=sessions,
+            query=query,
+            limit=limit,
+            boto_kwargs=boto_kwargs,
+            refresh_data=refresh_data,
+            stale_while_revalidate=stale_while_revalidate,
+        )
 
 
 T_SEARCHER = T.TypeVar("T_SEARCHER", bound=BaseSearcher)
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+import typing as T
+
+from ..ars_def import ARS
+from ..daemon import Daemon
+
+
+def main(
+    profile: T.Optional[str] = None,
+    port: T.Optional[int] = None,
+):
+    ars = ARS.from_profile(profile)
+    daemon = Daemon.new(ars=ars, port=port)
+    daemon.bind()
+    print(f"listening on http://{daemon.host}:{daemon.port}, press Ctrl+C to stop")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 
 """
-todo: docstring
+The ``ars`` command line interface.
+
+Each sub command imports its dependencies in the method body, so short
+invocations like ``ars -v`` and ``ars clear`` don't import boto3 or the UI.
 """
 
 import typing as T
 import fire
 
-from awscli_mate.ui import run_ui as run_awscli_mate_ui
-
 from .._version import __version__
 
 
@@ -38,13 +39,13 @@ class ArsCli:
         """
         Serve for the ``ars`` command without any arguments.
         """
-        from ..ars_def import validate_bsm
-        from ..ui_init import ui, run_ui as run_ars_ui
-
         if version:
             print(__version__)
         else:
-            validate_bsm(ui.ars.bsm)
+            # the boto session is validated when the ``ars`` object is created,
+            # unless its identity is cached, then it is verified in the background
+            from ..ui_init import run_ui as run_ars_ui
+
             run_ars_ui()
 
     def which(self):
@@ -74,6 +75,8 @@ class ArsCli:
         - ``ars set-profile``, then follow the interactive UI to set the profile.
         - Example: https://github.com/MacHu-GWU/awscli_mate-project#use-awscli_mate-as-a-interactive-cli
         """
+        from awscli_mate.ui import run_ui as run_awscli_mate_ui
+
         run_awscli_mate_ui()
 
     def clear(self):
@@ -88,6 +91,101 @@ class ArsCli:
 
         clear.main()
 
+    def warm(
+        self,
+        types: T.Optional[str] = None,
+        profiles: T.Optional[str] = None,
+        regions: T.Optional[str] = None,
+        workers: int = 8,
+        interval: bool = False,
+        refresh: bool = False,
+    ):
+        """
+        Pre-build the index of all AWS resource types in parallel, so that you
+        don't need to wait for the data to be downloaded when you search them
+        in the UI. Resource types that requires a parent resource
+        (for example, glue-database-table) are skipped.
+
+        Usage:
+
+        - ``ars warm``: warm up all resource types for the default profile.
+        - ``ars warm --types s3-bucket,iam-role``: only warm up these resource types.
+        - ``ars warm --profiles dev,prod --regions us-east-1,us-west-2``: warm up
+            all resource types for every profile and region combination.
+        - ``ars warm --workers 16``: use 16 concurrent workers, default is 8.
+        - ``ars warm --interval``: keep running, and re-warm each resource type
+            shortly before its cache expires.
+        - ``ars warm --refresh``: rebuild the index even if it is not expired.
+        """
+        from . import warm
+
+        warm.main(
+            types=types,
+            profiles=profiles,
+            regions=regions,
+            workers=workers,
+            interval=interval,
+            refresh=refresh,
+        )
+
+    def search(
+        self,
+        resource_type: T.Optional[str] = None,
+        query: str = "*",
+        limit: int = 20,
+        refresh: bool = False,
+        json: bool = False,
+        stdin: bool = False,
+    ):
+        """
+        Search AWS resources without the interactive UI.
+
+        Usage:
+
+        - ``ars search s3-bucket "my bucket"``: print the title of the matched resources.
+        - ``ars search s3-bucket "my bucket" --json``: print each matched
+            resource as a JSON line, with the arn and console url.
+        - ``ars search s3-bucket "*" --limit 100 --refresh``: rebuild the index
+            and return up to 100 resources.
+        - ``ars search ec2-instance@* web --json``: search all regions,
+            ``#*`` searches all accounts, the same as the UI.
+        - ``cat queries.txt | ars search --stdin``: each line is
+            ``${resource_type} ${query}``, all lines are searched in one process,
+            and the result is printed as JSON lines.
+        """
+        from . import search
+
+        search.main(
+            resource_type=resource_type,
+            query=query,
+            limit=limit,
+            refresh=refresh,
+            json_output=json,
+            stdin=stdin,
+        )
+
+    def daemon(
+        self,
+        profile: T.Optional[str] = None,
+        port: T.Optional[int] = None,
+    ):
+        """
+        Start a local query daemon that keeps the indexes and boto3 clients
+        warm, so editor and launcher integrations get the result in a few
+        milliseconds. It listens on 127.0.0.1 only.
+
+        Usage:
+
+        - ``ars daemon``: start the daemon with the default profile on port
+            19841, or ``$ARS_DAEMON_PORT``.
+        - ``ars daemon --profile my_profile --port 8080``: use another profile and port.
+        - query it with ``python -m aws_resource_search.daemon_client "s3-bucket: my bucket"``,
+            or ``curl "http://127.0.0.1:19841/query?q=s3-bucket:+my+bucket"``.
+        """
+        from . import daemon
+
+        daemon.main(profile=profile, port=port)
+
 
 def run():
     """
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+"""
+The non-interactive ``ars search`` command, it prints the search result as
+JSON lines, so it can be used in shell scripts.
+"""
+
+import typing as T
+import sys
+import json
+
+from ..ars_def import ARS
+from ..base_searcher import preprocess_query
+from ..regions import parse_resource_type, resolve_regions, get_regional_bsm
+from ..accounts import parse_account_query, resolve_accounts, get_account_label
+from ..terminal import remove_text_format
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from boto_session_manager import BotoSesManager
+    from ..res_lib import T_SEARCHER
+    from ..documents.resource_document import T_ARS_RESOURCE_DOCUMENT
+
+
+def parse_line(line: str) -> T.Tuple[str, str]:
+    """
+    Parse a line of the ``--stdin`` input into the resource type and query.
+    Both ``s3-bucket my bucket`` and ``s3-bucket: my bucket`` work, an empty
+    query means all resources.
+    """
+    parts = line.strip().split(None, 1)
+    resource_type = parts[0].rstrip(":")
+    query = parts[1].strip() if len(parts) == 2 else ""
+    return resource_type, query or "*"
+
+
+def serialize_document(
+    ars: ARS,
+    doc: "T_ARS_RESOURCE_DOCUMENT",
+) -> T.Dict[str, T.Any]:
+    """
+    Convert the document into a JSON serializable dict, with the title, and
+    the ARN and the AWS console url if the resource type supports them.
+    The ``raw_data`` field is dropped to keep the output small.
+    """
+    data = doc.to_dict()
+    data.pop("raw_data", None)
+    data["title"] = remove_text_format(doc.title)
+    if doc.region is not None:
+        data["region"] = doc.region
+    if doc.account is not None:
+        data["account"] = get_account_label(doc.account)
+    if doc.partition is not None:
+        data["partition"] = doc.partition
+    try:
+        data["arn"] = doc.arn
+    except NotImplementedError:
+        pass
+    try:
+        account_ars = ars.get_account_ars(account=doc.account, region=doc.region)
+        console = account_ars.aws_console
+        data["console_url"] = doc.get_console_url(console)
+    except NotImplementedError:
+        pass
+    return data
+
+
+def refresh_indexes(
+    searcher: "T_SEARCHER",
+    sessions: T.Iterable[T.Tuple["BotoSesManager", T.Optional[dict]]],
+    refreshed: T.Set[str],
+):
+    """
+    Rebuild the indexes of the ``(bsm, boto_kwargs)`` sessions that are not
+    in ``refreshed`` yet, and add their index names to it.
+    """
+    for bsm, boto_kwargs in sessions:
+        index_name = searcher._get_index_name(
+            bsm=bsm,
+            final_boto_kwargs=searcher._get_final_boto_kwargs(boto_kwargs),
+        )
+        if index_name in refreshed:
+            continue
+        searcher.build_index(boto_kwargs=boto_kwargs, refresh_data=True, bsm=bsm)
+        refreshed.add(index_name)
+
+
+def search(
+    ars: ARS,
+    resource_type: str,
+    query: str = "*",
+    limit: int = 20,
+    refresh: bool = False,
+    refreshed: T.Optional[T.Set[str]] = None,
+) -> T.List[T.Dict[str, T.Any]]:
+    """
+    Search one resource type and return the serialized documents.
+
+    :param resource_type: the resource type, it supports the ``@region`` and
+        ``#account`` suffix as the UI does, for example ``s3-bucket#*``.
+    :param query: the query string, ``*`` means all resources. For the
+        resource type that requires a parent resource, use
+        ``${parent}@${query}``, or ``*@${query}`` to search under all parents,
+        for example ``glue-database-table`` and ``*@orders``.
+    :param limit: the max number of documents to return.
+    :param refresh: rebuild the index before searching.
+    :param refreshed: the names of the indexes that are already rebuilt in
+        this batch, they are not rebuilt again even if ``refresh`` is True.
+        The indexes rebuilt by this call are added to it.
+    """
+    resource_type, region_query = parse_resource_type(resource_type)
+    resource_type, account_query = parse_account_query(resource_type)
+    if ars.is_valid_resource_type(resource_type) is False:
+        raise ValueError(f"invalid resource type: {resource_type!r}")
+    searcher = ars.get_searcher(resource_type)
+    # in batch mode, rebuild each index once before searching
+    batch_refresh = refresh and (refreshed is not None)
+    if batch_refresh:
+        refresh = False
+
+    if ars.has_partitioner(resource_type):
+        if "@" not in query:
+            raise ValueError(
+                f"{resource_type!r} requires a parent resource, "
+                f"use '${{parent}}@${{query}}' or '*@${{query}}' as the query"
+            )
+        if region_query is not None or account_query is not None:
+            raise ValueError(
+                f"multi-region / multi-account search doesn't support {resource_type!r}"
+            )
+        partitioner_query, query = [part.strip() for part in query.split("@", 1)]
+        query = preprocess_query(query)
+        if partitioner_query == "*":
+            if batch_refresh:
+                partitioner_searcher = ars.get_searcher(
+                    ars.get_partitioner_resource_type(resource_type)
+                )
+                refresh_indexes(partitioner_searcher, [(ars.bsm, None)], refreshed)
+                partitions = ars.get_partitions(resource_type)
+                refresh_indexes(
+                    searcher,
+                    [(ars.bsm, boto_kwargs) for _, boto_kwargs in partitions],
+                    refreshed,
+                )
+            docs = ars.search_all_partitions(
+                resource_type=resource_type,
+                query=query,
+                limit=limit,
+                refresh_data=refresh,
+            )
+        else:
+            boto_kwargs = ars.get_partitioner_boto_kwargs(
+                resource_type, partitioner_query
+            )
+            if batch_refresh:
+                refresh_indexes(searcher, [(ars.bsm, boto_kwargs)], refreshed)
+            docs = searcher.search(
+                query=query,
+                limit=limit,
+                boto_kwargs=boto_kwargs,
+                refresh_data=refresh,
+            )
+        return [serialize_document(ars, doc) for doc in docs]
+
+    regions = None if region_query is None else resolve_regions(ars.bsm, region_query)
+    accounts = (
+        None if account_query is None else resolve_accounts(ars.bsm, account_query)
+    )
+    if batch_refresh:
+        bsm_list = [ars.bsm] if accounts is None else [acc.bsm for acc in accounts]
+        if regions:
+            bsm_list = [
+                get_regional_bsm(bsm, region) for bsm in bsm_list for region in regions
+            ]
+        refresh_indexes(searcher, [(bsm, None) for bsm in bsm_list], refreshed)
+    docs = searcher.search(
+        query=preprocess_query(query),
+        limit=limit,
+        refresh_data=refresh,
+        bsm=ars.bsm,
+        regions=regions,
+        accounts=accounts,
+    )
+    return [serialize_document(ars, doc) for doc in docs]
+
+
+def main(
+    resource_type: T.Optional[str] = None,
+    query: str = "*",
+    limit: int = 20,
+    refresh: bool = False,
+    json_output: bool = False,
+    stdin: bool = False,
+    ars: T.Optional[ARS] = None,
+    input_stream: T.TextIO = None,
+    output_stream: T.TextIO = None,
+):
+    """
+    :param json_output: print each document as a JSON line, otherwise print
+        the title of each document.
+    :param stdin: read ``${resource_type} ${query}`` lines from stdin and
+        search them one by one in this process, the indexes are only loaded
+        once, and with ``refresh`` each index is only rebuilt once. The output
+        is always JSON lines, each line has the ``resource_type`` and
+        ``query`` of the input line. A line that doesn't match anything prints
+        ``"not_found": true``, and a failed line prints an ``error`` field.
+    """
+    input_stream = sys.stdin if input_stream is None else input_stream
+    output_stream = sys.stdout if output_stream is None else output_stream
+    if ars is None:
+        from ..ars_init import ars
+
+    def write_json(data: dict):
+        output_stream.write(json.dumps(data, default=str) + "\n")
+        output_stream.flush()
+
+    if stdin:
+        refreshed = set()
+        for line in input_stream:
+            if not line.strip():
+                continue
+            resource_type, query = parse_line(line)
+            meta = {"resource_type": resource_type, "query": query}
+            try:
+                results = search(
+                    ars, resource_type, query, limit, refresh, refreshed=refreshed
+                )
+                if len(results) == 0:
+                    write_json({**meta, "not_found": True})
+                for data in results:
+                    write_json({**meta, **data})
+            except Exception as e:
+                write_json({**meta, "error": str(e)})
+        return
+
+    if resource_type is None:
+        raise ValueError("resource type is required, or use --stdin")
+    for data in search(ars, resource_type, str(query), limit, refresh):
+        if json_output:
+            write_json(data)
+        else:
+            output_stream.write(data["title"] + "\n")
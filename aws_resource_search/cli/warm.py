@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+import typing as T
+
+from ..warmer import Warmer
+
+
+def to_list(value: T.Optional[T.Union[str, T.Iterable[str]]]) -> T.Optional[T.List[str]]:
+    """
+    Convert the comma separated CLI argument to list of string.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    return [v.strip() for v in value if v.strip()]
+
+
+def main(
+    types: T.Optional[T.Union[str, T.Iterable[str]]] = None,
+    profiles: T.Optional[T.Union[str, T.Iterable[str]]] = None,
+    regions: T.Optional[T.Union[str, T.Iterable[str]]] = None,
+    workers: int = 8,
+    interval: bool = False,
+    refresh: bool = False,
+):
+    warmer = Warmer.new(
+        resource_types=to_list(types),
+        profiles=to_list(profiles),
+        regions=to_list(regions),
+        max_workers=workers,
+    )
+    print(f"warm up {len(warmer.tasks)} indexes with {workers} workers ...")
+    if interval:
+        results = warmer.warm_forever(refresh_data=refresh)
+    else:
+        results = warmer.warm(refresh_data=refresh)
+    for result in results:
+        print(result)
+    print("done")
@@ -2,16 +2,16 @@
 
 import botocore.exceptions
 
-from ..ars_init import bsm
+from ..ars_init import ars
+from ..identity import identity_cache
 
 
 def main():
-    print(f"AWS Account ID = {bsm.aws_account_id}")
+    print(f"AWS Account ID = {ars.aws_console.aws_account_id}")
     try:
-        res = bsm.iam_client.list_account_aliases()
-        aliases = res.get("AccountAliases", [])
-        if aliases:
-            print(f"AWS Account Alias = {aliases[0]}")
+        alias = identity_cache.get_account_alias(ars.bsm)
+        if alias:
+            print(f"AWS Account Alias = {alias}")
     except botocore.exceptions.ClientError as e:
         pass
-    print(f"AWS Region = {bsm.aws_region}")
+    print(f"AWS Region = {ars.aws_console.aws_region}")
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+"""
+A registry of the boto3 clients, so that creating a client (which loads and
+parses the botocore service model and endpoint data) is thread safe and
+can be done ahead of time in a background thread.
+
+The clients are stored in the client cache of the
+:class:`~boto_session_manager.BotoSesManager` object, so both
+``list_resources`` and ``ars.bsm.${service}_client`` in ``get_details``
+share the preloaded client. The code that creates clients with
+``bsm.${service}_client`` directly (``get_details``, the account id lookup)
+calls :meth:`ClientRegistry.wait_preload` or :meth:`ClientRegistry.get_client`
+first, so it never races with the preload thread.
+
+Usage::
+
+    >>> from aws_resource_search.client_registry import client_registry
+    >>> client = client_registry.get_client(bsm, "s3")
+    >>> thread = client_registry.preload(bsm, services=["s3", "ec2"])
+"""
+
+import typing as T
+import threading
+import dataclasses
+from pathlib import Path
+
+from .base_model import BaseModel
+from .utils import load_json, dump_json
+from .paths import path_recent_resource_types_json
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from boto_session_manager import BotoSesManager
+    from botocore.client import BaseClient
+    from .ars_def import ARS
+
+
+@dataclasses.dataclass
+class ClientRegistry(BaseModel):
+    """
+    Create boto3 clients with one lock per boto session, because creating
+    clients from the same boto session in multiple threads is not thread safe.
+    The lock is keyed by ``id(bsm)``, a recycled id only means two sessions
+    share a lock.
+    """
+
+    _locks: T.Dict[int, threading.Lock] = dataclasses.field(default_factory=dict)
+    _preloads: T.Dict[int, threading.Thread] = dataclasses.field(default_factory=dict)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def _get_lock(self, bsm: "BotoSesManager") -> threading.Lock:
+        with self._lock:
+            try:
+                return self._locks[id(bsm)]
+            except KeyError:
+                lock = threading.Lock()
+                self._locks[id(bsm)] = lock
+                return lock
+
+    def get_client(self, bsm: "BotoSesManager", service: str) -> "BaseClient":
+        """
+        Get the cached client of the boto session, create it if not exists.
+        """
+        with self._get_lock(bsm):
+            return bsm.get_client(service)
+
+    def get_account_id(self, bsm: "BotoSesManager") -> str:
+        """
+        Get the AWS account id of the boto session, ``bsm.aws_account_id``
+        creates the sts client, so it is created with the lock first.
+        """
+        self.get_client(bsm, "sts")
+        return bsm.aws_account_id
+
+    def preload(
+        self,
+        bsm: "BotoSesManager",
+        services: T.Union[T.Iterable[str], T.Callable[[], T.Iterable[str]]],
+    ) -> threading.Thread:
+        """
+        Create the clients of the services in a background thread. Errors are
+        ignored, the client will be created again when it is used.
+
+        :param services: the service names, or a function that returns them,
+            it is called in the background thread.
+        """
+        if callable(services) is False:
+            services = list(services)
+
+        def preload():
+            service_list = services() if callable(services) else services
+            for service in service_list:
+                try:
+                    self.get_client(bsm, service)
+                except Exception:  # pragma: no cover
+                    pass
+
+        thread = threading.Thread(target=preload, daemon=True)
+        with self._lock:
+            self._preloads[id(bsm)] = thread
+        thread.start()
+        return thread
+
+    def wait_preload(self, bsm: "BotoSesManager"):
+        """
+        Wait for the preload thread of the boto session to finish, call it
+        before creating clients with ``bsm.${service}_client`` directly.
+        """
+        with self._lock:
+            thread = self._preloads.get(id(bsm))
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+
+client_registry = ClientRegistry()
+
+
+@dataclasses.dataclass
+class RecentResourceTypes(BaseModel):
+    """
+    The most recently searched resource types, most recent first. It is
+    stored in a json file.
+
+    :param path: the path of the json file.
+    :param max_size: the max number of resource types to remember.
+    """
+
+    path: Path = dataclasses.field()
+    max_size: int = dataclasses.field(default=10)
+    _data: T.Optional[T.List[str]] = dataclasses.field(default=None)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def _load(self) -> T.List[str]:
+        if self._data is None:
+            self._data = load_json(self.path, default=list)
+        return self._data
+
+    def get(self) -> T.List[str]:
+        with self._lock:
+            return list(self._load())
+
+    def add(self, resource_type: str):
+        """
+        Mark the resource type as the most recent one, the file is only
+        written if the order is changed.
+        """
+        with self._lock:
+            data = self._load()
+            if data[:1] == [resource_type]:
+                return
+            if resource_type in data:
+                data.remove(resource_type)
+            data.insert(0, resource_type)
+            del data[self.max_size :]
+            dump_json(self.path, data)
+
+    def clear(self):
+        with self._lock:
+            self._data = list()
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+recent_resource_types = RecentResourceTypes(path=path_recent_resource_types_json)
+
+
+def preload_recent_clients(ars: "ARS") -> threading.Thread:
+    """
+    Preload the clients of the services behind the recently searched
+    resource types, it is called when the UI starts.
+    """
+
+    # importing the searcher modules is also part of the warm up
+    def get_services() -> T.List[str]:
+        services = list()
+        for resource_type in recent_resource_types.get():
+            try:
+                service = ars.searcher_finder.import_searcher(resource_type).service
+            except Exception:  # pragma: no cover
+                continue
+            if service not in services:
+                services.append(service)
+        return services
+
+    return client_registry.preload(ars.bsm, get_services)
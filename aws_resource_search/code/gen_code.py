@@ -15,6 +15,38 @@ dir_here = Path(__file__).absolute().parent
 path_searchers_enum_json = dir_here.joinpath("searcher_enum.json")
 
 
+class _AttrPathRecorder:
+    """
+    A fake ``AWSConsole`` object that records the attribute path accessed on it.
+    """
+
+    def __init__(self, path: T.Tuple[str, ...] = ()):
+        self._path = path
+
+    def __getattr__(self, name: str) -> "_AttrPathRecorder":
+        return _AttrPathRecorder(self._path + (name,))
+
+
+def get_console_url_attr(searcher: BaseSearcher) -> T.Optional[str]:
+    """
+    Find the attribute path of the "list resources" AWS console url that the
+    ``get_list_resources_console_url`` method of the searcher's document
+    class returns, for example, ``s3.buckets``.
+    """
+    try:
+        value = searcher.doc_class.get_list_resources_console_url(
+            console=_AttrPathRecorder()
+        )
+    except NotImplementedError:
+        return None
+    if not isinstance(value, _AttrPathRecorder):  # pragma: no cover
+        raise TypeError(
+            f"{searcher.doc_class.__name__}.get_list_resources_console_url "
+            f"has to return an attribute of the AWSConsole object"
+        )
+    return ".".join(value._path)
+
+
 def load_searchers_enum_json() -> T.List[SearcherMetadata]:
     """
     Parse the ``aws_resource_search/code/searchers_enum.json`` file.
@@ -85,6 +117,9 @@ def enrich_searcher_metadata(
                 sr_meta_dct_view[value.resource_type].module = module_name
                 sr_meta_dct_view[value.resource_type].klass = value.__class__.__name__
                 sr_meta_dct_view[value.resource_type].var = var_name
+                sr_meta_dct_view[
+                    value.resource_type
+                ].console_url_attr = get_console_url_attr(value)
 
     valid_sr_meta_list = [
         sr_meta for sr_meta in sr_meta_dct_view.values() if sr_meta.klass is not None
@@ -105,6 +140,7 @@ def dump_searchers_json(sr_meta_list: T.List[SearcherMetadata]):
             "module": sr_meta.module,
             "klass": sr_meta.klass,
             "var": sr_meta.var,
+            "console_url_attr": sr_meta.console_url_attr,
         }
     path_searchers_json.write_text(json.dumps(data, indent=4, sort_keys=True))
 
@@ -25,6 +25,8 @@ class Resource(DataClass):
 @dataclasses.dataclass
 class Config(DataClass):
     res: T.Dict[str, Resource] = Resource.map_of_nested_field(default_factory=dict)
+    regions: T.List[str] = dataclasses.field(default_factory=list)
+    accounts: T.List[str] = dataclasses.field(default_factory=list)
 
     @classmethod
     def load(cls, path: Path = path_config_json) -> "Config":
@@ -45,6 +47,12 @@ class Config(DataClass):
                     }
                     for res_type in SearcherEnum
                 },
+                # the regions to search for the "resource-type@*" query,
+                # if empty, search all regions enabled in the account
+                "regions": [],
+                # the AWS profiles or IAM role ARNs to search for the
+                # "resource-type#*" query, if empty, search all AWS profiles
+                "accounts": [],
             }
             res = default_data["res"]
             res[SearcherEnum.codebuild_job_run.value]["cache_expire"] = 5 * 60
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+"""
+A long-running local query daemon. It keeps the :class:`~aws_resource_search.ars_def.ARS`
+object, the boto3 clients and the open whoosh index searchers warm in one
+process, and serves the same queries as the interactive UI over HTTP, so
+launchers (Alfred, Raycast, editor pickers) that spawn a new process per
+keystroke don't pay the startup cost every time.
+
+It only listens on ``127.0.0.1``. Start it with ``ars daemon``, then query it
+with the thin client :mod:`aws_resource_search.daemon_client`, or any HTTP client::
+
+    $ curl -H "X-ARS-Token: $(cat ~/.aws_resource_search/daemon-19841.token)" \
+        "http://127.0.0.1:19841/query?q=s3-bucket:+my+bucket"
+    {"items": [{"title": "my-bucket", "subtitle": "...", ...}]}
+
+Every request has to send the per-daemon random token in the ``X-ARS-Token``
+header, the token is written to ``~/.aws_resource_search/daemon-${port}.token``
+that only the current user can read. The ``Host`` header has to be
+``127.0.0.1:${port}`` or ``localhost:${port}``. So a web page in the browser
+can't shutdown the daemon, or read the query results with DNS rebinding.
+
+API:
+
+- ``GET /ping``: return ``{"version": ..., "pid": ...}``.
+- ``GET /query?q=${query}&limit=${limit}``: return ``{"items": [...]}``,
+    the query syntax is the same as the UI.
+- ``POST /shutdown``: stop the daemon.
+"""
+
+import typing as T
+import os
+import hmac
+import json
+import secrets
+import threading
+import dataclasses
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+from ._version import __version__
+from .base_model import BaseModel
+from .terminal import remove_text_format
+from .paths import dir_aws_resource_search
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .ars_def import ARS
+    from .ui_def import UI
+    from .items.api import T_ARS_ITEM
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 19841
+TOKEN_HEADER = "X-ARS-Token"
+
+
+def get_port() -> int:
+    """
+    Get the daemon port from the ``ARS_DAEMON_PORT`` environment variable,
+    or use the default port.
+    """
+    return int(os.environ.get("ARS_DAEMON_PORT", DEFAULT_PORT))
+
+
+def get_path_token(port: int) -> Path:
+    """
+    Get the path of the token file of the daemon on the port.
+    """
+    return dir_aws_resource_search.joinpath(f"daemon-{port}.token")
+
+
+_JSON_TYPES = (str, int, float, bool)
+
+
+def serialize_item(item: "T_ARS_ITEM") -> T.Dict[str, T.Any]:
+    """
+    Convert the zelfred item into a JSON serializable dict. The terminal
+    color codes are removed, and only the JSON serializable variables
+    (for example, the url and the arn) are kept.
+    """
+    return {
+        "uid": item.uid,
+        "title": remove_text_format(item.title),
+        "subtitle": remove_text_format(item.subtitle or ""),
+        "arg": item.arg,
+        "autocomplete": item.autocomplete,
+        "variables": {
+            key: value
+            for key, value in (item.variables or {}).items()
+            if isinstance(value, _JSON_TYPES)
+        },
+    }
+
+
+def query(
+    ui: "UI",
+    q: str,
+    limit: T.Optional[int] = None,
+) -> T.List[T.Dict[str, T.Any]]:
+    """
+    Run the query with the UI handler without rendering the UI, and return
+    the serialized items.
+    """
+    from .ui_def import handler
+
+    items = handler(query=q, ui=ui, skip_ui=True)
+    if limit is not None:
+        items = items[:limit]
+    return [serialize_item(item) for item in items]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def log_message(self, format, *args):  # pragma: no cover
+        pass
+
+    def _send_json(self, data: dict, status: int = 200):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _is_authorized(self) -> bool:
+        """
+        Check the ``Host`` header and the token, and send the 403 response
+        if the request is not authorized.
+        """
+        daemon = self.server.daemon
+        allowed_hosts = {
+            f"{host}:{daemon.port}" for host in [daemon.host, "127.0.0.1", "localhost"]
+        }
+        if self.headers.get("Host") not in allowed_hosts:
+            self._send_json({"error": "invalid host"}, status=403)
+            return False
+        token = self.headers.get(TOKEN_HEADER, "")
+        if hmac.compare_digest(token.encode("utf-8"), daemon.token.encode("utf-8")):
+            return True
+        self._send_json({"error": "invalid token"}, status=403)
+        return False
+
+    def do_GET(self):
+        if self._is_authorized() is False:
+            return
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        if url.path == "/ping":
+            self._send_json({"version": __version__, "pid": os.getpid()})
+        elif url.path == "/query":
+            q = params.get("q", [""])[0]
+            limit = params.get("limit", [None])[0]
+            try:
+                items = query(
+                    ui=self.server.daemon.ui,
+                    q=q,
+                    limit=None if limit is None else int(limit),
+                )
+                self._send_json({"items": items})
+            except Exception as e:
+                self._send_json({"error": repr(e)}, status=500)
+        else:
+            self._send_json({"error": f"not found: {url.path}"}, status=404)
+
+    def do_POST(self):
+        if self._is_authorized() is False:
+            return
+        if urlparse(self.path).path == "/shutdown":
+            self._send_json({"shutdown": True})
+            # shutdown() blocks until serve_forever() returns, so it has to
+            # be called from another thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            self._send_json({"error": f"not found: {self.path}"}, status=404)
+
+
+class _Server(HTTPServer):
+    daemon: "Daemon"
+
+
+@dataclasses.dataclass
+class Daemon(BaseModel):
+    """
+    The query daemon. Requests are handled one by one, the handlers share
+    the UI state, and each query takes a few milliseconds once warm.
+
+    :param ui: the headless UI object that holds the ``ARS`` object.
+    :param host: the host to listen on.
+    :param port: the port to listen on, 0 means a random free port.
+    :param token: the random token that every request has to send, it is
+        written to the :func:`get_path_token` file once the port is bound.
+    """
+
+    ui: "UI" = dataclasses.field()
+    host: str = dataclasses.field(default=DEFAULT_HOST)
+    port: int = dataclasses.field(default=DEFAULT_PORT)
+    token: str = dataclasses.field(default_factory=lambda: secrets.token_urlsafe(32))
+    server: T.Optional[_Server] = dataclasses.field(default=None)
+
+    @classmethod
+    def new(
+        cls,
+        ars: "ARS",
+        host: str = DEFAULT_HOST,
+        port: T.Optional[int] = None,
+    ) -> "Daemon":
+        from .ui_def import UI
+
+        return cls(
+            ui=UI.new(ars=ars),
+            host=host,
+            port=get_port() if port is None else port,
+        )
+
+    @property
+    def path_token(self) -> Path:
+        return get_path_token(self.port)
+
+    def bind(self) -> int:
+        """
+        Bind the socket, write the token file, and return the actual port.
+        """
+        self.server = _Server((self.host, self.port), _RequestHandler)
+        self.server.daemon = self
+        self.port = self.server.server_address[1]
+        self._write_token()
+        return self.port
+
+    def _write_token(self):
+        """
+        Write the token file that only the current user can read.
+        """
+        path = self.path_token
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(self.token)
+
+    def _remove_token(self):
+        try:
+            if self.path_token.read_text() == self.token:
+                self.path_token.unlink()
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+    def serve_forever(self):
+        """
+        Serve until ``POST /shutdown`` or KeyboardInterrupt.
+        """
+        if self.server is None:
+            self.bind()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self._remove_token()
+
+    def start_in_background(self) -> threading.Thread:
+        """
+        Serve in a background thread, it is mostly for testing.
+        """
+        if self.server is None:
+            self.bind()
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""
+The thin client of the :mod:`aws_resource_search.daemon`. It only uses the
+Python standard library, so a launcher that spawns a new process per
+keystroke only pays for the interpreter startup::
+
+    $ python -m aws_resource_search.daemon_client "s3-bucket: my bucket"
+    {"uid": "...", "title": "my-bucket", "subtitle": "...", ...}
+
+It prints one JSON object per line. The daemon token is read from
+``~/.aws_resource_search/daemon-${port}.token``.
+"""
+
+import typing as T
+import os
+import sys
+import json
+from pathlib import Path
+from urllib.parse import urlencode
+from urllib.request import urlopen, Request
+
+# keep it in sync with aws_resource_search.daemon, we don't import it
+# because it imports the rest of the package
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 19841
+TOKEN_HEADER = "X-ARS-Token"
+
+
+def _get_port(port: T.Optional[int] = None) -> int:
+    if port is None:
+        port = int(os.environ.get("ARS_DAEMON_PORT", DEFAULT_PORT))
+    return port
+
+
+def _get_token(port: int) -> str:
+    """
+    Read the token of the daemon on the port, return empty string if the
+    daemon is not running, the daemon rejects it anyway.
+    """
+    path = Path.home().joinpath(".aws_resource_search", f"daemon-{port}.token")
+    try:
+        return path.read_text().strip()
+    except FileNotFoundError:
+        return ""
+
+
+def _request(
+    path: str,
+    port: T.Optional[int] = None,
+    method: str = "GET",
+) -> Request:
+    port = _get_port(port)
+    return Request(
+        f"http://{DEFAULT_HOST}:{port}{path}",
+        data=b"" if method == "POST" else None,
+        headers={TOKEN_HEADER: _get_token(port)},
+        method=method,
+    )
+
+
+def ping(port: T.Optional[int] = None, timeout: float = 1) -> dict:
+    """
+    Check if the daemon is running.
+
+    :raises OSError: if the daemon is not running.
+    """
+    with urlopen(_request("/ping", port), timeout=timeout) as res:
+        return json.loads(res.read())
+
+
+def query(
+    q: str,
+    limit: T.Optional[int] = None,
+    port: T.Optional[int] = None,
+    timeout: float = 30,
+) -> T.List[dict]:
+    """
+    Send the query to the daemon and return the items.
+
+    :param q: the query string, the syntax is the same as the UI.
+    :param limit: the max number of items to return.
+    :param port: the daemon port, default is ``$ARS_DAEMON_PORT`` or 19841.
+
+    :raises OSError: if the daemon is not running.
+    :raises RuntimeError: if the daemon failed to run the query.
+    """
+    params = {"q": q}
+    if limit is not None:
+        params["limit"] = limit
+    request = _request(f"/query?{urlencode(params)}", port)
+    try:
+        with urlopen(request, timeout=timeout) as res:
+            return json.loads(res.read())["items"]
+    except Exception as e:
+        # urllib raises HTTPError for the 500 status code
+        if hasattr(e, "read"):
+            raise RuntimeError(json.loads(e.read()).get("error"))
+        raise
+
+
+def shutdown(port: T.Optional[int] = None, timeout: float = 5):
+    """
+    Stop the daemon.
+    """
+    request = _request("/shutdown", port, method="POST")
+    with urlopen(request, timeout=timeout) as res:
+        res.read()
+
+
+def main(args: T.Optional[T.List[str]] = None):  # pragma: no cover
+    args = sys.argv[1:] if args is None else args
+    for item in query(" ".join(args)):
+        print(json.dumps(item))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
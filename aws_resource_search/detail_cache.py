@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+A short-TTL in-memory cache of the resource detail view, so that bouncing in
+and out of the same resource doesn't call the boto3 API again. When the
+detail view fetches newer data of the resource, it is written back into the
+search index (read-repair).
+
+Usage::
+
+    >>> from aws_resource_search.detail_cache import get_details
+    >>> items = get_details(ars, resource_type="ec2-instance", doc=doc)
+"""
+
+import typing as T
+import time
+import threading
+import dataclasses
+from collections import OrderedDict
+
+from .base_model import BaseModel
+from .client_registry import client_registry
+from .aio import run_in_thread
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .ars_def import ARS
+    from .items.api import T_ARS_ITEM
+    from .documents.resource_document import T_ARS_RESOURCE_DOCUMENT
+
+
+T_DETAIL_CACHE_KEY = T.Tuple[str, str, str, str]
+
+
+@dataclasses.dataclass
+class DetailCache(BaseModel):
+    """
+    The LRU cache of the detail items, each entry expires after ``expire``
+    seconds. The key is ``(account_id, region, resource_type, id)``.
+
+    :param expire: how many seconds the detail items are valid.
+    :param max_size: the max number of cached resources.
+    """
+
+    expire: int = dataclasses.field(default=30)
+    max_size: int = dataclasses.field(default=256)
+    data: T.OrderedDict[T_DETAIL_CACHE_KEY, T.Tuple[float, T.List["T_ARS_ITEM"]]] = (
+        dataclasses.field(default_factory=OrderedDict)
+    )
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def get(self, key: T_DETAIL_CACHE_KEY) -> T.Optional[T.List["T_ARS_ITEM"]]:
+        with self.lock:
+            try:
+                expire_at, items = self.data[key]
+            except KeyError:
+                return None
+            if time.time() >= expire_at:
+                self.data.pop(key)
+                return None
+            self.data.move_to_end(key)
+            return items
+
+    def put(self, key: T_DETAIL_CACHE_KEY, items: T.List["T_ARS_ITEM"]):
+        with self.lock:
+            self.data[key] = (time.time() + self.expire, items)
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+detail_cache = DetailCache()
+
+
+def get_details(
+    ars: "ARS",
+    resource_type: str,
+    doc: "T_ARS_RESOURCE_DOCUMENT",
+    boto_kwargs: T.Optional[dict] = None,
+) -> T.List["T_ARS_ITEM"]:
+    """
+    A cached version of
+    :meth:`~aws_resource_search.documents.resource_document.ResourceDocument.get_details`.
+
+    If the document fetched its latest data in ``get_details``
+    (see :meth:`~aws_resource_search.documents.resource_document.ResourceDocument.set_fresh_doc`),
+    it is written back into the search index.
+
+    :param ars: the :class:`~aws_resource_search.ars_def.ARS` object.
+    :param resource_type: the resource type of the document.
+    :param doc: the document object.
+    :param boto_kwargs: the boto3 kwargs used to search the document, it is
+        only required for the resource type that has a partitioner.
+    """
+    searcher = ars.get_searcher(resource_type)
+    account_id, region = searcher._get_bsm_fingerprint(ars.bsm)
+    key = (str(account_id), str(region), resource_type, doc.id)
+    items = detail_cache.get(key)
+    if items is not None:
+        return items
+    # make sure the client is created safely before get_details calls the
+    # boto3 API in multiple threads, it is often preloaded already. The
+    # get_details may also create the clients of other services directly,
+    # so it has to wait for the preload thread to finish
+    client_registry.wait_preload(ars.bsm)
+    client_registry.get_client(ars.bsm, searcher.service)
+    items = doc.get_details(ars=ars)
+    detail_cache.put(key, items)
+    fresh_doc = doc.pop_fresh_doc()
+    if fresh_doc is not None:
+        try:
+            searcher.read_repair(doc=fresh_doc, boto_kwargs=boto_kwargs, bsm=ars.bsm)
+        # the repair is just best effort
+        except Exception:  # pragma: no cover
+            pass
+    return items
+
+
+async def aget_details(
+    ars: "ARS",
+    resource_type: str,
+    doc: "T_ARS_RESOURCE_DOCUMENT",
+    boto_kwargs: T.Optional[dict] = None,
+) -> T.List["T_ARS_ITEM"]:
+    """
+    The asyncio version of :func:`get_details`, it takes the same arguments.
+    """
+    return await run_in_thread(
+        get_details,
+        ars=ars,
+        resource_type=resource_type,
+        doc=doc,
+        boto_kwargs=boto_kwargs,
+    )
@@ -13,12 +13,8 @@ from datetime import datetime, timezone
 import jmespath
 import sayt.api as sayt
 
-try:
-    import pyperclip
-except ImportError:  # pragma: no cover
-    pass
-
-from ..terminal import SUBTITLE, SHORT_SUBTITLE
+from ..terminal import get_subtitle, get_short_subtitle
+from ..aio import run_in_thread
 from .base_document import BaseArsDocument
 
 if T.TYPE_CHECKING:  # pragma: no cover
@@ -291,6 +287,19 @@ class ResourceDocument(BaseArsDocument):
         "field": sayt.TextField(name="name_text", stored=False, sortable=True, ascending=True)}, init=False)
     # fmt: on
 
+    # the latest version of this document fetched in :meth:`get_details`,
+    # it is not a dataclass field, see :meth:`set_fresh_doc`
+    _fresh_doc = None
+    # the region where the document is found, it is only set by the
+    # multi-region search, None means the region of the current boto session
+    region = None
+    # the :attr:`~aws_resource_search.accounts.Account.name` of the account
+    # where the document is found, it is only set by the multi-account search
+    account = None
+    # the name of the parent resource where the document is found, it is only
+    # set by the wildcard partitioner search, e.g. ``glue-database-table: *@orders``
+    partition = None
+
     def __post_init__(self):
         name_text = self.name
         for char in "-_":
@@ -384,9 +393,9 @@ class ResourceDocument(BaseArsDocument):
 
         .. seealso::
 
-            :const:`~aws_resource_search.terminal.SUBTITLE`
+            :func:`~aws_resource_search.terminal.get_subtitle`
         """
-        return SUBTITLE
+        return get_subtitle()
 
     @property
     def short_subtitle(self) -> str:
@@ -395,9 +404,9 @@ class ResourceDocument(BaseArsDocument):
 
         .. seealso::
 
-            :const:`~aws_resource_search.terminal.SHORT_SUBTITLE`
+            :func:`~aws_resource_search.terminal.get_short_subtitle`
         """
-        return SHORT_SUBTITLE
+        return get_short_subtitle()
 
     @property
     def uid(self) -> str:
@@ -504,6 +513,39 @@ class ResourceDocument(BaseArsDocument):
         msg = f"{self.__class__.__name__} doesn't support get details"
         raise NotImplementedError(msg)
 
+    async def aget_details(self, ars: "ARS") -> T.List["T_ARS_ITEM"]:
+        """
+        The asyncio version of :meth:`get_details`, the boto3 API calls run
+        in a worker thread.
+        """
+        return await run_in_thread(self.get_details, ars=ars)
+
+    def set_fresh_doc(self, doc: "ResourceDocument"):
+        """
+        If :meth:`get_details` fetched the latest data of this resource in
+        the same shape as the list API response, create a new document object
+        from it and call this method. The caller will write it back into the
+        search index (read-repair), so the search result stays fresh without
+        a full refresh.
+
+        Usage example:
+
+            >>> class Ec2Instance(ResourceDocument):
+            ...     def get_details(self, ars: ARS):
+            ...         res = ars.bsm.ec2_client.describe_instances(InstanceIds=[self.id])
+            ...         inst = self.from_resource(res["Reservations"][0]["Instances"][0], ...)
+            ...         self.set_fresh_doc(inst)
+        """
+        self._fresh_doc = doc
+
+    def pop_fresh_doc(self) -> T.Optional["ResourceDocument"]:
+        """
+        Get the document set by :meth:`set_fresh_doc` and forget it.
+        """
+        doc = self._fresh_doc
+        self._fresh_doc = None
+        return doc
+
     @classmethod
     def get_dataset_fields(
         cls,
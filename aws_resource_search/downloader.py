@@ -11,6 +11,8 @@ import jmespath
 from iterproxy import IterProxy
 
 from .base_model import BaseModel
+from .client_registry import client_registry
+from .aio import check_cancelled, run_in_thread
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from boto_session_manager import BotoSesManager
@@ -138,22 +140,88 @@ def list_resources(
     """
 
     def func():
-        if boto_kwargs is None:
-            kwargs = {}
-        else:
-            kwargs = boto_kwargs
-        client = bsm.get_client(service)
-        if is_paginator:
-            paginator = client.get_paginator(method)
-            for response in paginator.paginate(**kwargs):
-                yield from result_path.extract(response)
-        else:
-            response = getattr(client, method)(**kwargs)
+        for response in _iter_responses(
+            bsm=bsm,
+            service=service,
+            method=method,
+            is_paginator=is_paginator,
+            boto_kwargs=boto_kwargs,
+        ):
             yield from result_path.extract(response)
 
     return ResourceIterproxy(func())
 
 
+def _iter_responses(
+    bsm: "BotoSesManager",
+    service: str,
+    method: str,
+    is_paginator: bool,
+    boto_kwargs: T.Optional[dict],
+) -> T.Iterator[dict]:
+    """
+    Yield the boto3 API responses page by page. It stops before the next page
+    if the asyncio task is cancelled, see :func:`~aws_resource_search.aio.check_cancelled`.
+    """
+    if boto_kwargs is None:
+        kwargs = {}
+    else:
+        kwargs = boto_kwargs
+    check_cancelled()
+    client = client_registry.get_client(bsm, service)
+    if is_paginator:
+        paginator = client.get_paginator(method)
+        for response in paginator.paginate(**kwargs):
+            yield response
+            check_cancelled()
+    else:
+        yield getattr(client, method)(**kwargs)
+
+
+async def alist_resources(
+    bsm: "BotoSesManager",
+    service: str,
+    method: str,
+    is_paginator: bool,
+    boto_kwargs: T.Optional[dict],
+    result_path: ResultPath,
+) -> T.AsyncIterator[T_RESULT_DATA]:
+    """
+    The asyncio version of :func:`list_resources`, it takes the same arguments.
+    Each page is fetched in a worker thread, so the event loop is not blocked
+    and the listing of many resource types can run concurrently. If the
+    task is cancelled, no more page is fetched.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> async for iam_group_data in alist_resources(
+        ...     bsm=bsm,
+        ...     service="iam",
+        ...     method="list_groups",
+        ...     is_paginator=True,
+        ...     boto_kwargs=None,
+        ...     result_path=ResultPath(path="Groups"),
+        ... ):
+        ...     print(iam_group_data)
+    """
+    responses = _iter_responses(
+        bsm=bsm,
+        service=service,
+        method=method,
+        is_paginator=is_paginator,
+        boto_kwargs=boto_kwargs,
+    )
+    sentinel = object()
+    while True:
+        response = await run_in_thread(next, responses, sentinel)
+        if response is sentinel:
+            break
+        for data in result_path.extract(response):
+            yield data
+
+
 def extract_tags(data: dict) -> T.Dict[str, str]:
     """
     Extract tags key value pair from boto3 API call response data.
@@ -3,3 +3,10 @@
 
 class MalformedBotoSessionError(ValueError):
     pass
+
+
+class OperationCancelledError(Exception):
+    """
+    Raised in the worker thread when the asyncio task that runs it is cancelled,
+    see :mod:`aws_resource_search.aio`.
+    """
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+An in-memory fuzzy matcher for the small catalogs that we search on almost
+every keystroke, like the resource types in ``searchers.json`` and the AWS
+profiles in ``~/.aws/config``. They only have tens of entries, so a whoosh
+index on disk is overkill.
+
+The n-gram index is built in memory on first use, and it is rebuilt exactly
+when the source files change (by their ``mtime`` and size), not on a timer.
+
+Usage::
+
+    >>> matcher = FuzzyMatcher(
+    ...     paths=[path_searchers_json],
+    ...     downloader=downloader,
+    ...     fields=["name", "ngram"],
+    ... )
+    >>> matcher.search("s3~1 buck~1", limit=20)
+    [{'id': 's3-bucket', 'name': 's3-bucket', ...}]
+"""
+
+import typing as T
+import re
+import threading
+import dataclasses
+from pathlib import Path
+
+from .base_model import BaseModel
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+_FUZZY_PATTERN = re.compile(r"~\d*$")
+
+
+def tokenize(text: str) -> T.List[str]:
+    """
+    Split the text into lower case words, ``-``, ``_``, ``.`` and other
+    punctuations are delimiters.
+    """
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def _get_deletes(text: str) -> T.Set[str]:
+    """
+    Get all strings that are one character shorter than the text.
+    """
+    return {text[:i] + text[i + 1 :] for i in range(len(text))}
+
+
+def _get_signature(paths: T.Iterable[Path]) -> T.Tuple:
+    signature = list()
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+@dataclasses.dataclass
+class FuzzyMatcher(BaseModel):
+    """
+    An in-memory n-gram index of a small list of documents.
+
+    A query term matches a document if it is a substring of a word in any of
+    the searchable fields. If the term ends with ``~`` (for example, ``buck~1``,
+    see :func:`~aws_resource_search.base_searcher.preprocess_query`), it also
+    matches the substrings that are one edit away and have the same first
+    character. All terms have to match. Documents are ranked by the number of
+    matched fields, word prefix matches rank higher, and exact matches rank
+    higher than fuzzy matches.
+
+    :param paths: the source files of the documents, the index is rebuilt
+        when any of them is changed.
+    :param downloader: a function that returns the documents.
+    :param fields: the searchable fields of the document.
+    :param minsize: the min length of the n-gram, shorter query terms are ignored.
+    :param maxsize: the max length of the n-gram.
+    """
+
+    paths: T.List[Path] = dataclasses.field()
+    downloader: T.Callable[[], T.List[dict]] = dataclasses.field()
+    fields: T.List[str] = dataclasses.field()
+    minsize: int = dataclasses.field(default=2)
+    maxsize: int = dataclasses.field(default=10)
+
+    _signature: T.Optional[T.Tuple] = dataclasses.field(default=None)
+    _docs: T.List[dict] = dataclasses.field(default_factory=list)
+    # {n-gram: {document index: score}}
+    _postings: T.Dict[str, T.Dict[int, int]] = dataclasses.field(default_factory=dict)
+    # {n-gram with one character deleted: {n-gram}}
+    _deletes: T.Dict[str, T.Set[str]] = dataclasses.field(default_factory=dict)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def _build(self, docs: T.List[dict]):
+        postings = dict()
+        deletes = dict()
+        for ind, doc in enumerate(docs):
+            for field in self.fields:
+                # one point for each matched field, one more if it is the
+                # beginning of a word
+                field_scores = dict()
+                for word in tokenize(str(doc.get(field) or "")):
+                    for start in range(len(word)):
+                        for size in range(self.minsize, self.maxsize + 1):
+                            ngram = word[start : start + size]
+                            if len(ngram) < size:
+                                break
+                            score = 2 if start == 0 else 1
+                            field_scores[ngram] = max(field_scores.get(ngram, 0), score)
+                for ngram, score in field_scores.items():
+                    doc_scores = postings.setdefault(ngram, dict())
+                    doc_scores[ind] = doc_scores.get(ind, 0) + score
+        for ngram in postings:
+            for variant in _get_deletes(ngram):
+                deletes.setdefault(variant, set()).add(ngram)
+        self._docs = docs
+        self._postings = postings
+        self._deletes = deletes
+
+    def refresh(self, force: bool = False):
+        """
+        Rebuild the index if the source files are changed.
+
+        :param force: rebuild the index anyway.
+        """
+        signature = _get_signature(self.paths)
+        with self._lock:
+            if force or signature != self._signature:
+                self._build(self.downloader())
+                self._signature = signature
+
+    def _match_ngram(self, ngram: str, fuzzy: bool) -> T.Dict[int, int]:
+        """
+        :return: the ``{document index: score}`` of the documents that have
+            the n-gram.
+        """
+        doc_scores = dict(self._postings.get(ngram, {}))
+        if fuzzy is False:
+            return doc_scores
+        # find the n-grams that are one edit away with the symmetric delete
+        # algorithm, the fuzzy matches only score one point
+        variants = _get_deletes(ngram)
+        candidates = set(self._deletes.get(ngram, set()))
+        for variant in variants:
+            candidates.update(self._deletes.get(variant, set()))
+            if variant in self._postings:
+                candidates.add(variant)
+        for candidate in candidates:
+            if candidate[:1] != ngram[:1]:
+                continue
+            for ind in self._postings[candidate]:
+                doc_scores.setdefault(ind, 1)
+        return doc_scores
+
+    def _match_term(self, term: str, fuzzy: bool) -> T.Dict[int, int]:
+        if len(term) <= self.maxsize:
+            return self._match_ngram(term, fuzzy)
+        # the term is longer than the n-gram, all of its n-grams have to match
+        doc_scores = None
+        for start in range(len(term) - self.maxsize + 1):
+            scores = self._postings.get(term[start : start + self.maxsize], {})
+            if doc_scores is None:
+                doc_scores = dict(scores)
+            else:
+                doc_scores = {
+                    ind: min(score, scores[ind])
+                    for ind, score in doc_scores.items()
+                    if ind in scores
+                }
+        return doc_scores
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        refresh_data: bool = False,
+        offset: int = 0,
+    ) -> T.List[dict]:
+        """
+        Search the documents.
+
+        :param query: the query string, ``*`` matches all documents.
+        :param limit: the max number of documents to return.
+        :param refresh_data: rebuild the index even if the source files
+            are not changed.
+        :param offset: skip the first ``offset`` documents, it is used to get
+            the next page.
+        """
+        self.refresh(force=refresh_data)
+        terms = list()
+        for word in query.split():
+            fuzzy = _FUZZY_PATTERN.search(word) is not None
+            for term in tokenize(_FUZZY_PATTERN.sub("", word)):
+                if len(term) >= self.minsize:
+                    terms.append((term, fuzzy))
+        if len(terms) == 0:
+            return self._docs[offset : offset + limit]
+
+        total_scores = None
+        for term, fuzzy in terms:
+            doc_scores = self._match_term(term, fuzzy)
+            if total_scores is None:
+                total_scores = doc_scores
+            else:
+                total_scores = {
+                    ind: score + doc_scores[ind]
+                    for ind, score in total_scores.items()
+                    if ind in doc_scores
+                }
+            if not total_scores:
+                return []
+        ranked = sorted(total_scores, key=lambda ind: (-total_scores[ind], ind))
+        return [self._docs[ind] for ind in ranked[offset : offset + limit]]
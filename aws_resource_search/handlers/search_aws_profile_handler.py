@@ -6,42 +6,34 @@ See :func:`search_aws_profile_handler`.
 
 import typing as T
 
-import sayt.api as sayt
 import awscli_mate.api as awscli_mate
 
-from ..paths import dir_index, dir_cache, path_aws_config
+from ..paths import path_aws_config, path_aws_credentials
+from ..fuzzy_matcher import FuzzyMatcher
 from .. import res_lib as rl
 
 if T.TYPE_CHECKING:  # pragma: no cover
     from ..ui_def import UI
 
 
-def downloader() -> T.List[sayt.T_DOCUMENT]:
-    pairs = awscli_mate.AWSCliConfig().extract_profile_and_region_pairs()
-    return [
-        {
-            "profile": profile,
-            "profile_ng": profile,
-            "region_ng": region,
-        }
-        for profile, region in pairs
-    ]
+def downloader() -> T.List[dict]:
+    aws_cli_config = awscli_mate.AWSCliConfig()
+    pairs = aws_cli_config.extract_profile_and_region_pairs()
+    # the profiles that only exist in ~/.aws/credentials
+    _, credentials = aws_cli_config.read_config()
+    profiles = {profile for profile, _ in pairs}
+    for profile in credentials.sections():
+        if profile != "default" and profile not in profiles:
+            pairs.append((profile, "unknown-region"))
+    return [{"profile": profile, "region": region} for profile, region in pairs]
 
 
-index_name = "aws-resource-search-aws-profiles"
-aws_profile_dataset = sayt.DataSet(
-    dir_index=dir_index,
-    index_name=index_name,
-    fields=[
-        sayt.IdField(name="profile", stored=True),
-        sayt.NgramWordsField(name="profile_ng", stored=True, minsize=2, maxsize=10),
-        sayt.NgramWordsField(name="region_ng", stored=True, minsize=2, maxsize=10),
-    ],
-    dir_cache=dir_cache,
-    cache_key=index_name,
-    cache_tag=index_name,
-    cache_expire=5 * 60,
+# the profiles are matched in memory, and re-loaded only when the
+# ~/.aws/config or ~/.aws/credentials file is changed
+aws_profile_matcher = FuzzyMatcher(
+    paths=[path_aws_config, path_aws_credentials],
     downloader=downloader,
+    fields=["profile", "region"],
 )
 
 
@@ -50,15 +42,14 @@ def search_aws_profile_and_return_items(
     profile_query: str,
     refresh_data: bool = False,
 ) -> T.List[rl.SetAwsProfileItem]:
-    docs = aws_profile_dataset.search(
+    docs = aws_profile_matcher.search(
         query=profile_query,
         limit=50,
-        simple_response=True,
         refresh_data=refresh_data,
     )
     if len(docs):
         return rl.SetAwsProfileItem.from_many_profile_region_pairs(
-            pairs=[(doc["profile_ng"], doc["region_ng"]) for doc in docs],
+            pairs=[(doc["profile"], doc["region"]) for doc in docs],
             autocomplete=line_input,
         )
     else:
@@ -8,12 +8,18 @@ import typing as T
 
 import botocore.exceptions
 import zelfred.api as zf
+from zelfred.constants import SHOW_ITEMS_LIMIT
 
 from ..paths import path_aws_config, path_aws_credentials
+from ..regions import get_regional_bsm, resolve_regions
+from ..accounts import resolve_accounts
+from ..client_registry import recent_resource_types
 from .. import res_lib as rl
 
 
 if T.TYPE_CHECKING:  # pragma: no cover
+    import sayt.api as sayt
+    from ..accounts import Account
     from ..ui_def import UI
 
 
@@ -32,8 +38,107 @@ def creating_index_items(resource_type: str) -> T.List[rl.InfoItem]:  # pragma:
     ]
 
 
+def indexing_progress_items(
+    resource_type: str,
+    n_indexed: int,
+) -> T.List[rl.InfoItem]:  # pragma: no cover
+    """
+    Print a message to tell user how many resources are indexed so far.
+
+    This method is used when we are building the index in the background.
+    """
+    return [
+        rl.InfoItem(
+            title=f"Pulling data for {resource_type!r}, {n_indexed} resources indexed so far ...",
+            subtitle="results below are partial, please wait, don't press any key",
+            uid="pulling-data",
+        )
+    ]
+
+
+def get_stale_prompt(age: float) -> str:
+    """
+    The prompt to tell user that the search result comes from an expired index,
+    and the index is being refreshed in the background.
+    """
+    return f"(Query) ⏳ {rl.to_human_readable_elapsed(int(age))} old, refreshing"
+
+
+def get_offline_prompt(age: float) -> str:
+    """
+    The prompt to tell user that we can't reach AWS, the search result comes
+    from the existing index.
+    """
+    return f"(Query) 📴 offline, {rl.to_human_readable_elapsed(int(age))} old"
+
+
 T_DOC_TO_ITEM_FUNC = T.Callable[[rl.T_ARS_RESOURCE_DOCUMENT], rl.AwsResourceItem]
 
+#: commit the index every N documents when building the index in the UI,
+#: so that we can show the partial result while downloading the rest of the data
+INDEX_BATCH_SIZE = 500
+
+#: the number of items the UI loads at a time, the next page is loaded
+#: when the user scrolls past the end of the dropdown menu
+PAGE_SIZE = SHOW_ITEMS_LIMIT
+
+#: the number of items returned when the UI is skipped (e.g. the daemon),
+#: there is no scrolling to load the next page
+SKIP_UI_LIMIT = 50
+
+
+def build_index_with_progress(
+    ui: "UI",
+    searcher: rl.T_SEARCHER,
+    ds: "sayt.DataSet",
+    query: str,
+    refresh_data: bool = False,
+    doc_to_item_func: T_DOC_TO_ITEM_FUNC = None,
+    interval: float = 0.3,
+):  # pragma: no cover
+    """
+    Build the index in a background thread with batched commit, and keep
+    showing the "N resources indexed so far" message and the partial result
+    until the index is built.
+
+    :param interval: how often to refresh the UI, in seconds.
+    """
+    if doc_to_item_func is None:
+
+        def doc_to_item_func(doc: rl.T_ARS_RESOURCE_DOCUMENT) -> rl.AwsResourceItem:
+            return rl.AwsResourceItem.from_document(
+                resource_type=searcher.resource_type,
+                doc=doc,
+            )
+
+    progress = {"n_indexed": 0}
+
+    def progress_callback(n_indexed: int):
+        progress["n_indexed"] = n_indexed
+
+    thread = searcher._refresh_in_background(
+        ds=ds,
+        refresh_data=refresh_data,
+        batch_size=INDEX_BATCH_SIZE,
+        progress_callback=progress_callback,
+    )
+    ui.run_handler(items=creating_index_items(searcher.resource_type))
+    ui.repaint()
+    while thread.is_alive():
+        thread.join(timeout=interval)
+        if progress["n_indexed"] == 0:
+            continue
+        result = searcher._run_query(ds=ds, query=query, limit=SHOW_ITEMS_LIMIT)
+        items = indexing_progress_items(searcher.resource_type, progress["n_indexed"])
+        items.extend(
+            [
+                doc_to_item_func(doc=searcher.doc_class.from_dict(hit["_source"]))
+                for hit in result["hits"]
+            ]
+        )
+        ui.run_handler(items=items)
+        ui.repaint()
+
 
 def search_resource_and_return_items(
     ui: "UI",
@@ -43,6 +148,10 @@ def search_resource_and_return_items(
     refresh_data: bool = False,
     doc_to_item_func: T_DOC_TO_ITEM_FUNC = None,
     skip_ui: bool = False,
+    stale_while_revalidate: bool = False,
+    regions: T.Optional[T.List[str]] = None,
+    accounts: T.Optional[T.List["Account"]] = None,
+    partitions: T.Optional[T.List[T.Tuple[str, dict]]] = None,
 ) -> T.List[T.Union[rl.AwsResourceItem, rl.InfoItem, rl.FileItem]]:
     """
     A wrapper of the :class:`~aws_resource_search.res_lib.Searcher`.
@@ -60,13 +169,64 @@ def search_resource_and_return_items(
         That's the purpose of this argument.
     :param skip_ui: if True, skip the UI related logic, just return the items.
         this argument is used for third party integration.
+    :param stale_while_revalidate: if True, return the result from the expired
+        index immediately and refresh it in the background.
+    :param regions: if given, search all these regions and merge the results.
+    :param accounts: if given, search all these accounts and merge the results.
+    :param partitions: if given, search under all these parent resources
+        and merge the results.
+
+    Only the first page is returned, the UI loads the next page when the user
+    scrolls past the end, see :meth:`aws_resource_search.ui_def.UI.set_next_page`.
     """
-    try:
-        docs: T.List[rl.T_ARS_RESOURCE_DOCUMENT] = searcher.search(
+    if doc_to_item_func is None:
+
+        def doc_to_item_func(doc: rl.T_ARS_RESOURCE_DOCUMENT) -> rl.AwsResourceItem:
+            return rl.AwsResourceItem.from_document(
+                resource_type=searcher.resource_type,
+                doc=doc,
+            )
+
+    def search_page(cursor: T.Optional[str], **kwargs) -> rl.SearchPage:
+        return searcher.search_page(
             query=query,
+            page_size=SKIP_UI_LIMIT if skip_ui else PAGE_SIZE,
+            cursor=cursor,
             boto_kwargs=boto_kwargs,
+            regions=regions,
+            accounts=accounts,
+            partitions=partitions,
+            **kwargs,
+        )
+
+    def set_next_page(page: rl.SearchPage):
+        if skip_ui or page.has_next is False:
+            return
+
+        def next_page() -> T.List[rl.AwsResourceItem]:
+            # same as the first page, never block the UI on a full rebuild
+            new_page = search_page(
+                cursor=page.next_cursor,
+                stale_while_revalidate=stale_while_revalidate,
+            )
+            set_next_page(new_page)
+            return [doc_to_item_func(doc=doc) for doc in new_page.docs]
+
+        ui.set_next_page(next_page)
+
+    try:
+        page = search_page(
+            cursor=None,
             refresh_data=refresh_data,
+            stale_while_revalidate=stale_while_revalidate,
         )
+        result = page.result
+        docs = page.docs
+        set_next_page(page)
+        if skip_ui is False and result["offline"]:  # pragma: no cover
+            ui.render.prompt = get_offline_prompt(result["age"])
+        elif skip_ui is False and result["stale"]:  # pragma: no cover
+            ui.render.prompt = get_stale_prompt(result["age"])
     except botocore.exceptions.ClientError as e:  # pragma: no cover
         return [
             rl.InfoItem(
@@ -92,16 +252,16 @@ def search_resource_and_return_items(
 
     # pprint(docs[:3]) # for DEBUG ONLY
 
-    if doc_to_item_func is None:
-
-        def doc_to_item_func(doc: rl.T_ARS_RESOURCE_DOCUMENT) -> rl.AwsResourceItem:
-            return rl.AwsResourceItem.from_document(
-                resource_type=searcher.resource_type,
-                doc=doc,
-            )
-
     items = [doc_to_item_func(doc=doc) for doc in docs]
     # pprint(items[:3]) # for DEBUG ONLY
+    for label, error in result.get("errors", {}).items():  # pragma: no cover
+        items.append(
+            rl.InfoItem(
+                title=f"🔴 failed to search {searcher.resource_type!r} in {label!r}",
+                subtitle=error,
+                uid=f"session-error-{label}",
+            )
+        )
     if len(items):
         return items
     else:
@@ -134,6 +294,8 @@ def search_resource(
     boto_kwargs: T.Optional[dict] = None,
     doc_to_item_func: T_DOC_TO_ITEM_FUNC = None,
     skip_ui: bool = False,
+    regions: T.Optional[T.List[str]] = None,
+    accounts: T.Optional[T.List["Account"]] = None,
 ) -> T.List[T.Union[rl.AwsResourceItem, rl.InfoItem, rl.FileItem]]:
     """
     A wrapper around :func:`search_and_return_items`, it also handles the case
@@ -151,18 +313,38 @@ def search_resource(
         to zelfred Item object.
     :param skip_ui: if True, skip the UI related logic, just return the items.
         this argument is used for third party integration.
+    :param regions: if given, search all these regions and merge the results.
+    :param accounts: if given, search all these accounts and merge the results.
     """
     zf.debugger.log(f"search_resource Query: {query}")
     final_query = rl.preprocess_query(query)
     searcher = ui.ars.get_searcher(resource_type)
+    recent_resource_types.add(resource_type)
+    if regions or accounts:
+        return search_resource_in_many(
+            ui=ui,
+            searcher=searcher,
+            query=final_query,
+            regions=regions,
+            accounts=accounts,
+            boto_kwargs=boto_kwargs,
+            doc_to_item_func=doc_to_item_func,
+            skip_ui=skip_ui,
+        )
     final_boto_kwargs = searcher._get_final_boto_kwargs(boto_kwargs=boto_kwargs)
     ds = searcher._get_ds(bsm=ui.ars.bsm, final_boto_kwargs=final_boto_kwargs)
 
-    # display "creating index ..." message
-    if ds.cache_key not in ds.cache:
+    # display "creating index ..." message, if the index has been built before
+    # we search the expired index and refresh it in the background instead
+    if searcher._is_expired(ds) and searcher._get_index_age(ds) is None:
         if skip_ui is False:  # pragma: no cover
-            ui.run_handler(items=creating_index_items(resource_type))
-            ui.repaint()
+            build_index_with_progress(
+                ui=ui,
+                searcher=searcher,
+                ds=ds,
+                query=final_query,
+                doc_to_item_func=doc_to_item_func,
+            )
         return search_resource_and_return_items(
             ui=ui,
             searcher=searcher,
@@ -174,16 +356,27 @@ def search_resource(
 
     # manually refresh data
     if final_query.endswith("!~"):
+        final_query = rl.preprocess_query(final_query[:-2])
         if skip_ui is False:  # pragma: no cover
-            ui.run_handler(items=creating_index_items(resource_type))
-            ui.repaint()
             ui.line_editor.press_backspace(n=2)
+            build_index_with_progress(
+                ui=ui,
+                searcher=searcher,
+                ds=ds,
+                query=final_query,
+                refresh_data=True,
+                doc_to_item_func=doc_to_item_func,
+            )
+            # the index is just built, no need to refresh again
+            refresh_data = False
+        else:
+            refresh_data = True
         return search_resource_and_return_items(
             ui=ui,
             searcher=searcher,
-            query=rl.preprocess_query(final_query[:-2]),
+            query=final_query,
             boto_kwargs=boto_kwargs,
-            refresh_data=True,
+            refresh_data=refresh_data,
             doc_to_item_func=doc_to_item_func,
             skip_ui=skip_ui,
         )
@@ -196,6 +389,65 @@ def search_resource(
         boto_kwargs=boto_kwargs,
         doc_to_item_func=doc_to_item_func,
         skip_ui=skip_ui,
+        stale_while_revalidate=True,
+    )
+
+
+def search_resource_in_many(
+    ui: "UI",
+    searcher: rl.T_SEARCHER,
+    query: str,
+    regions: T.Optional[T.List[str]] = None,
+    accounts: T.Optional[T.List["Account"]] = None,
+    boto_kwargs: T.Optional[dict] = None,
+    doc_to_item_func: T_DOC_TO_ITEM_FUNC = None,
+    skip_ui: bool = False,
+) -> T.List[T.Union[rl.AwsResourceItem, rl.InfoItem, rl.FileItem]]:
+    """
+    The multi-region / multi-account version of :func:`search_resource`,
+    for example ``"ec2-instance@*: dev box"`` or ``"iam-role#*: admin"``.
+    The indexes are built concurrently, so we only show one
+    "creating index" message.
+
+    :param query: the preprocessed query string.
+    :param regions: list of region names.
+    :param accounts: list of :class:`~aws_resource_search.accounts.Account`.
+    """
+    refresh_data = False
+    if query.endswith("!~"):
+        query = rl.preprocess_query(query[:-2])
+        refresh_data = True
+        if skip_ui is False:  # pragma: no cover
+            ui.line_editor.press_backspace(n=2)
+
+    if skip_ui is False:  # pragma: no cover
+        final_boto_kwargs = searcher._get_final_boto_kwargs(boto_kwargs=boto_kwargs)
+        if accounts:
+            bsm_list = [account.bsm for account in accounts]
+        else:
+            bsm_list = [ui.ars.bsm]
+        if regions:
+            bsm_list = [
+                get_regional_bsm(bsm, region) for bsm in bsm_list for region in regions
+            ]
+        for bsm in bsm_list:
+            ds = searcher._get_ds(bsm=bsm, final_boto_kwargs=final_boto_kwargs)
+            if refresh_data or searcher._get_index_age(ds) is None:
+                ui.run_handler(items=creating_index_items(searcher.resource_type))
+                ui.repaint()
+                break
+
+    return search_resource_and_return_items(
+        ui=ui,
+        searcher=searcher,
+        query=query,
+        boto_kwargs=boto_kwargs,
+        refresh_data=refresh_data,
+        doc_to_item_func=doc_to_item_func,
+        skip_ui=skip_ui,
+        stale_while_revalidate=True,
+        regions=regions,
+        accounts=accounts,
     )
 
 
@@ -291,6 +543,7 @@ def search_child_resource(
                 "doc": doc,
                 "resource_type": resource_type,
                 "partitioner_resource_type": partitioner_resource_type,
+                "boto_kwargs": boto_kwargs,
             },
         )
 
@@ -304,6 +557,84 @@ def search_child_resource(
     )
 
 
+def search_child_resource_in_all_partitions(
+    ui: "UI",
+    resource_type: str,
+    partitioner_resource_type: str,
+    resource_query: str,
+    skip_ui: bool = False,
+) -> T.List[T.Union[rl.AwsResourceItem, rl.InfoItem, rl.FileItem]]:
+    """
+    Search child resource under all partitioners, for example
+    ``"glue-database-table: *@orders"`` finds the tables named ``orders``
+    in all glue databases. The child indexes are downloaded concurrently,
+    so we only show one "creating index" message.
+
+    :param resource_type: example: "glue-database-table"
+    :param partitioner_resource_type: example: "glue-database"
+    :param resource_query: example: "my table"
+    :param skip_ui: if True, skip the UI related logic, just return the items.
+        this argument is used for third party integration.
+    """
+    zf.debugger.log(f"search_child_resource_in_all_partitions Query: {resource_query!r}")
+    query = rl.preprocess_query(resource_query)
+    refresh_data = False
+    if query.endswith("!~"):
+        query = rl.preprocess_query(query[:-2])
+        refresh_data = True
+        if skip_ui is False:  # pragma: no cover
+            ui.line_editor.press_backspace(n=2)
+
+    searcher = ui.ars.get_searcher(resource_type)
+    recent_resource_types.add(resource_type)
+    partitions = ui.ars.get_partitions(resource_type, refresh_data=refresh_data)
+    if len(partitions) == 0:
+        return [
+            rl.InfoItem(
+                title=f"🔴 No {partitioner_resource_type!r} found",
+                subtitle=f"we need a {partitioner_resource_type!r} to search {resource_type!r}",
+                autocomplete=f"{resource_type}: ",
+            )
+        ]
+    boto_kwargs_mapper = dict(partitions)
+
+    if skip_ui is False:  # pragma: no cover
+        for _, boto_kwargs in partitions:
+            ds = searcher._get_ds(
+                bsm=ui.ars.bsm,
+                final_boto_kwargs=searcher._get_final_boto_kwargs(boto_kwargs),
+            )
+            if refresh_data or searcher._get_index_age(ds) is None:
+                ui.run_handler(items=creating_index_items(resource_type))
+                ui.repaint()
+                break
+
+    def doc_to_item_func(doc: rl.T_ARS_RESOURCE_DOCUMENT) -> rl.AwsResourceItem:
+        return rl.AwsResourceItem(
+            uid=doc.uid,
+            title=f"{rl.format_resource_type(resource_type)}: {doc.title}",
+            subtitle=doc.subtitle,
+            autocomplete=f"{resource_type}: {doc.autocomplete}",
+            variables={
+                "doc": doc,
+                "resource_type": resource_type,
+                "partitioner_resource_type": partitioner_resource_type,
+                "boto_kwargs": boto_kwargs_mapper[doc.partition],
+            },
+        )
+
+    return search_resource_and_return_items(
+        ui=ui,
+        searcher=searcher,
+        query=query,
+        refresh_data=refresh_data,
+        doc_to_item_func=doc_to_item_func,
+        skip_ui=skip_ui,
+        stale_while_revalidate=True,
+        partitions=partitions,
+    )
+
+
 def search_resource_under_partitioner(
     ui: "UI",
     resource_type: str,
@@ -318,7 +649,9 @@ def search_resource_under_partitioner(
     :param resource_type: for example, ``"glue-table"``
     :param partitioner_resource_type: for example, ``"glue-database"``
     :param query: for example, if the full user query is ``"glue-table: my_database@my table"``,
-        then this argument is ``"my_database@my table"``.
+        then this argument is ``"my_database@my table"``. If the partitioner
+        is ``*``, for example ``"*@my table"``, search under all partitioners,
+        see :func:`search_child_resource_in_all_partitions`.
     :param skip_ui: if True, skip the UI related logic, just return the items.
         this argument is used for third party integration.
     """
@@ -357,6 +690,17 @@ def search_resource_under_partitioner(
     # - "my_database@"
     # - "my_database@my table"
     partitioner_query = q.trimmed_parts[0]
+
+    # example: "*@my table", "*@"
+    if partitioner_query == "*":
+        return search_child_resource_in_all_partitions(
+            ui=ui,
+            resource_type=resource_type,
+            partitioner_resource_type=partitioner_resource_type,
+            resource_query=query.split("@", 1)[1].strip() or "*",
+            skip_ui=skip_ui,
+        )
+
     boto_kwargs = ui.ars.get_partitioner_boto_kwargs(resource_type, partitioner_query)
 
     # example: "my_database@  "
@@ -390,6 +734,8 @@ def search_resource_handler(
     resource_type: str,
     query: str,
     skip_ui: bool = False,
+    region_query: T.Optional[str] = None,
+    account_query: T.Optional[str] = None,
 ) -> T.List[T.Union[rl.AwsResourceItem, rl.InfoItem, rl.FileItem]]:  # pragma: no cover
     """
     **IMPORTANT** This handle filter resource by query.
@@ -399,8 +745,36 @@ def search_resource_handler(
         then this argument is ``"my bucket"``.
     :param skip_ui: if True, skip the UI related logic, just return the items.
         this argument is used for third party integration.
+    :param region_query: for example, if the full user query is
+        ``"ec2-instance@*: web"``, then this argument is ``"*"``.
+        See :mod:`aws_resource_search.regions`.
+    :param account_query: for example, if the full user query is
+        ``"iam-role#dev,prod: admin"``, then this argument is ``"dev,prod"``.
+        See :mod:`aws_resource_search.accounts`.
     """
     ui.render.prompt = f"(Query)"
+    if region_query is not None or account_query is not None:
+        if ui.ars.has_partitioner(resource_type):
+            return [
+                rl.InfoItem(
+                    title=f"🔴 multi-region / multi-account search doesn't support {resource_type!r}",
+                    subtitle="remove the '@...' or '#...' after the resource type",
+                    autocomplete=f"{resource_type}: ",
+                )
+            ]
+        regions = accounts = None
+        if region_query is not None:
+            regions = resolve_regions(ui.ars.bsm, region_query)
+        if account_query is not None:
+            accounts = resolve_accounts(ui.ars.bsm, account_query)
+        return search_resource(
+            ui=ui,
+            resource_type=resource_type,
+            query=query,
+            skip_ui=skip_ui,
+            regions=regions,
+            accounts=accounts,
+        )
     if ui.ars.has_partitioner(resource_type):
         return search_resource_under_partitioner(
             ui=ui,
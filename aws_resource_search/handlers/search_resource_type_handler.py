@@ -8,9 +8,10 @@ import typing as T
 import json
 
 import zelfred.api as zf
-import sayt.api as sayt
+from zelfred.constants import SHOW_ITEMS_LIMIT
 
-from ..paths import dir_index, dir_cache, path_searchers_json
+from ..paths import path_searchers_json
+from ..fuzzy_matcher import FuzzyMatcher
 from .. import res_lib as rl
 
 
@@ -18,7 +19,7 @@ if T.TYPE_CHECKING:  # pragma: no cover
     from ..ui_def import UI
 
 
-def downloader() -> T.List[sayt.T_DOCUMENT]:
+def downloader() -> T.List[dict]:
     data = json.loads(path_searchers_json.read_text())
     return [
         rl.ResourceTypeDocument(
@@ -31,43 +32,66 @@ def downloader() -> T.List[sayt.T_DOCUMENT]:
     ]
 
 
-index_name = "aws-resource-search-resource-types"
-resource_type_dataset = sayt.DataSet(
-    dir_index=dir_index,
-    index_name=index_name,
-    fields=[
-        sayt.IdField(name="id", stored=True),
-        sayt.NgramWordsField(name="name", stored=True, minsize=2, maxsize=10),
-        sayt.StoredField(name="desc"),
-        sayt.NgramWordsField(name="ngram", stored=True, minsize=2, maxsize=10),
-    ],
-    dir_cache=dir_cache,
-    cache_key=index_name,
-    cache_tag=index_name,
-    cache_expire=24 * 60 * 60,
+# there are only tens of resource types, they are matched in memory, and
+# re-loaded only when the searchers.json file is changed
+resource_type_matcher = FuzzyMatcher(
+    paths=[path_searchers_json],
     downloader=downloader,
+    fields=["name", "ngram"],
+    maxsize=20,
 )
 
 
+#: the number of items the UI loads at a time
+PAGE_SIZE = SHOW_ITEMS_LIMIT
+
+#: the number of items returned when the UI is skipped
+SKIP_UI_LIMIT = 50
+
+
 def search_resource_type_and_return_items(
     ui: "UI",
     query: str,
     refresh_data: bool = False,
+    skip_ui: bool = False,
 ) -> T.List[T.Union[rl.AwsResourceTypeItem, rl.UrlItem]]:
     """
     Search AWS Resource Type based on the query and return items.
+
+    In the UI, only the first page is returned, the next page is loaded when
+    the user scrolls past the end.
     """
-    docs = resource_type_dataset.search(
-        query=query,
-        limit=50,
-        simple_response=True,
-        refresh_data=refresh_data,
-    )
-    if len(docs):
+
+    def search_page(offset: int) -> T.List[rl.AwsResourceTypeItem]:
+        docs = resource_type_matcher.search(
+            query=query,
+            # ask for one more to know whether there is a next page
+            limit=PAGE_SIZE + 1,
+            refresh_data=refresh_data if offset == 0 else False,
+            offset=offset,
+        )
+        if len(docs) > PAGE_SIZE:
+            docs = docs[:PAGE_SIZE]
+            ui.set_next_page(lambda: search_page(offset + PAGE_SIZE))
         return rl.AwsResourceTypeItem.from_many_document(
             docs=[rl.ResourceTypeDocument.from_dict(doc) for doc in docs],
             ars=ui.ars,
         )
+
+    if skip_ui:
+        docs = resource_type_matcher.search(
+            query=query,
+            limit=SKIP_UI_LIMIT,
+            refresh_data=refresh_data,
+        )
+        items = rl.AwsResourceTypeItem.from_many_document(
+            docs=[rl.ResourceTypeDocument.from_dict(doc) for doc in docs],
+            ars=ui.ars,
+        )
+    else:
+        items = search_page(offset=0)
+    if len(items):
+        return items
     else:
         return [
             rl.UrlItem.from_url(
@@ -115,6 +139,7 @@ def search_resource_type_handler(
             ui=ui,
             query=rl.preprocess_query(final_query[:-2]),
             refresh_data=True,
+            skip_ui=skip_ui,
         )
 
     # example: "ec2 inst"
@@ -122,6 +147,7 @@ def search_resource_type_handler(
         ui=ui,
         query=final_query,
         refresh_data=False,
+        skip_ui=skip_ui,
     )
     zf.debugger.log(f"end of search_resource_type_handler")
     zf.debugger.log(
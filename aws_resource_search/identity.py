@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+"""
+A persisted cache of the AWS account id, alias and region of each AWS profile,
+so that starting the app doesn't need to call ``sts.get_caller_identity()``.
+
+The cache entry is keyed by the profile name, and is only valid if the
+fingerprint of the AWS config / credentials files and the AWS environment
+variables is unchanged. The cached identity is verified in a background
+thread after it is used.
+
+Usage::
+
+    >>> from aws_resource_search.identity import identity_cache
+    >>> identity = identity_cache.get(profile="my_profile")
+    >>> identity.account_id, identity.region
+"""
+
+import typing as T
+import os
+import time
+import hashlib
+import threading
+import dataclasses
+from pathlib import Path
+
+from boto_session_manager import BotoSesManager
+from boto_session_manager.manager import NOTHING
+
+from .base_model import BaseModel
+from .utils import load_json, dump_json
+from .paths import path_identity_json, path_aws_config, path_aws_credentials
+from .client_registry import client_registry
+
+#: the environment variables that affect the identity of the default profile
+_AWS_ENV_VARS = [
+    "AWS_PROFILE",
+    "AWS_DEFAULT_PROFILE",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_CONFIG_FILE",
+    "AWS_SHARED_CREDENTIALS_FILE",
+]
+
+DEFAULT_PROFILE_KEY = "__default__"
+
+
+#: ``{path: ((path, st_mtime_ns, st_size), md5 of the content)}``
+_file_digests: T.Dict[str, T.Tuple[T.Tuple, bytes]] = dict()
+
+
+def _get_file_digest(path: Path) -> bytes:
+    """
+    Get the md5 digest of the file content, the file is only read again
+    when its ``mtime`` or size is changed.
+    """
+    try:
+        stat = path.stat()
+        signature = (str(path), stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        return b""
+    try:
+        cached_signature, digest = _file_digests[str(path)]
+        if cached_signature == signature:
+            return digest
+    except KeyError:
+        pass
+    try:
+        digest = hashlib.md5(path.read_bytes()).digest()
+    except FileNotFoundError:  # pragma: no cover
+        return b""
+    _file_digests[str(path)] = (signature, digest)
+    return digest
+
+
+def get_fingerprint(profile: T.Optional[str]) -> str:
+    """
+    Get the fingerprint of everything that decides which AWS account and
+    region a profile points to. It is called on every search, so the AWS
+    config files are only read again when they are changed.
+    """
+    md5 = hashlib.md5()
+    md5.update(str(profile).encode("utf-8"))
+    for name in _AWS_ENV_VARS:
+        md5.update(f"{name}={os.environ.get(name, '')}".encode("utf-8"))
+    path_config = Path(os.environ.get("AWS_CONFIG_FILE", str(path_aws_config)))
+    path_credentials = Path(
+        os.environ.get("AWS_SHARED_CREDENTIALS_FILE", str(path_aws_credentials))
+    )
+    md5.update(_get_file_digest(path_config.expanduser()))
+    md5.update(_get_file_digest(path_credentials.expanduser()))
+    return md5.hexdigest()
+
+
+def get_profile(bsm: BotoSesManager) -> T.Optional[str]:
+    """
+    Get the profile name of a boto session that is created from the AWS
+    config files. Return None for the default profile.
+
+    :raises ValueError: if the boto session uses explicit credentials, or
+        a botocore session, so the identity can't be derived from the profile.
+    """
+    for value in [bsm.aws_access_key_id, bsm.botocore_session]:
+        if value is not NOTHING and value is not None:
+            raise ValueError("the boto session is not created from a profile")
+    if bsm.profile_name is NOTHING or bsm.profile_name is None:
+        return None
+    return bsm.profile_name
+
+
+@dataclasses.dataclass
+class Identity(BaseModel):
+    """
+    The identity of an AWS profile.
+
+    :param account_id: the AWS account id.
+    :param region: the AWS region.
+    :param account_alias: the AWS account alias, None means not fetched yet,
+        empty string means the account has no alias.
+    :param fingerprint: see :func:`get_fingerprint`.
+    :param verified_at: the epoch timestamp when it was verified with AWS.
+    """
+
+    account_id: str = dataclasses.field()
+    region: T.Optional[str] = dataclasses.field()
+    account_alias: T.Optional[str] = dataclasses.field(default=None)
+    fingerprint: str = dataclasses.field(default="")
+    verified_at: float = dataclasses.field(default=0)
+
+
+@dataclasses.dataclass
+class IdentityCache(BaseModel):
+    """
+    The ``{profile: identity}`` cache, it is stored in a json file.
+
+    :param path: the path of the json file.
+    """
+
+    path: Path = dataclasses.field()
+    _data: T.Optional[T.Dict[str, dict]] = dataclasses.field(default=None)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def _load(self) -> T.Dict[str, dict]:
+        if self._data is None:
+            self._data = load_json(self.path, default=dict)
+        return self._data
+
+    def get(self, profile: T.Optional[str]) -> T.Optional[Identity]:
+        """
+        Get the cached identity, return None if it is not cached, or the
+        AWS config has changed since it was cached.
+        """
+        with self._lock:
+            dct = self._load().get(profile or DEFAULT_PROFILE_KEY)
+        if dct is None:
+            return None
+        identity = Identity(**dct)
+        if identity.fingerprint != get_fingerprint(profile):
+            return None
+        return identity
+
+    def put(self, profile: T.Optional[str], identity: Identity):
+        identity.fingerprint = get_fingerprint(profile)
+        with self._lock:
+            data = self._load()
+            data[profile or DEFAULT_PROFILE_KEY] = dataclasses.asdict(identity)
+            dump_json(self.path, data, indent=4, sort_keys=True)
+
+    def fetch(self, bsm: BotoSesManager) -> Identity:
+        """
+        Get the identity from AWS and cache it. The account alias is kept
+        if the account is unchanged.
+
+        :param bsm: a boto session created from an AWS profile.
+        """
+        profile = get_profile(bsm)
+        old_identity = self.get(profile)
+        identity = Identity(
+            account_id=client_registry.get_account_id(bsm),
+            region=bsm.aws_region,
+            verified_at=time.time(),
+        )
+        if old_identity is not None and old_identity.account_id == identity.account_id:
+            identity.account_alias = old_identity.account_alias
+        self.put(profile, identity)
+        return identity
+
+    def get_account_alias(self, bsm: BotoSesManager) -> str:
+        """
+        Get the account alias of the boto session's profile, it calls
+        ``iam.list_account_aliases()`` only if it is not cached.
+
+        :return: the account alias, empty string if there is no alias.
+        """
+        profile = get_profile(bsm)
+        identity = self.get(profile)
+        if identity is None:
+            identity = self.fetch(bsm)
+        if identity.account_alias is None:
+            iam_client = client_registry.get_client(bsm, "iam")
+            res = iam_client.list_account_aliases()
+            aliases = res.get("AccountAliases", [])
+            identity.account_alias = aliases[0] if aliases else ""
+            self.put(profile, identity)
+        return identity.account_alias
+
+    def verify_in_background(self, profile: T.Optional[str]) -> threading.Thread:
+        """
+        Fetch the identity again with a new boto session in a background
+        thread, so the cache is corrected for the next time if it is wrong.
+        Errors are ignored, for example, when we are offline.
+        """
+
+        def verify():
+            try:
+                self.fetch(BotoSesManager(profile_name=profile or NOTHING))
+            except Exception:  # pragma: no cover
+                pass
+
+        thread = threading.Thread(target=verify, daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self):
+        with self._lock:
+            self._data = dict()
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+identity_cache = IdentityCache(path=path_identity_json)
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+"""
+A per-process registry of the ``sayt.DataSet`` objects and the open whoosh
+index searchers, so that we don't need to create the dataset, check the cache
+and open the index from disk again on every keystroke.
+
+Usage::
+
+    >>> from aws_resource_search.index_registry import index_registry
+    >>> ds = index_registry.get_ds(index_name, bsm, boto_kwargs, factory)
+    >>> if index_registry.is_expired(ds) is False:
+    ...     with index_registry.searcher(ds) as searcher:
+    ...         ...
+"""
+
+import typing as T
+import time
+import threading
+import contextlib
+import dataclasses
+from collections import OrderedDict
+
+import sayt.api as sayt
+
+from .base_model import BaseModel
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from boto_session_manager import BotoSesManager
+    from whoosh.searching import Searcher
+
+
+#: the query string words that change the meaning of the query, we don't
+#: narrow down the previous result if the query has any of them
+_NOT_NARROWABLE_WORDS = {"AND", "OR", "NOT", "ANDNOT", "ANDMAYBE"}
+_NOT_NARROWABLE_CHARS = set("()[]{}\"':<>=^")
+
+
+def _is_narrowable(words: T.List[str]) -> bool:
+    for word in words:
+        if word in _NOT_NARROWABLE_WORDS:
+            return False
+        if _NOT_NARROWABLE_CHARS.intersection(word):
+            return False
+    return True
+
+
+@dataclasses.dataclass
+class QueryCache(BaseModel):
+    """
+    The LRU cache of the search result of one index generation. The key is
+    the ``(normalized query, limit)``, the value is the list of hits.
+
+    :param max_size: the max number of cached queries.
+    """
+
+    max_size: int = dataclasses.field(default=128)
+    data: T.OrderedDict[T.Tuple[str, int], T.List[dict]] = dataclasses.field(
+        default_factory=OrderedDict
+    )
+
+    def get(self, query: str, limit: int) -> T.Optional[T.List[dict]]:
+        key = (query, limit)
+        try:
+            self.data.move_to_end(key)
+            return self.data[key]
+        except KeyError:
+            return None
+
+    def put(self, query: str, limit: int, hits: T.List[dict]):
+        self.data[(query, limit)] = hits
+        self.data.move_to_end((query, limit))
+        while len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+    def find_base(
+        self,
+        query: str,
+        limit: int,
+    ) -> T.Optional[T.Tuple[str, T.List[dict]]]:
+        """
+        Find a cached result that we can narrow down to get the result of
+        the given query, without searching the whole index again.
+
+        The query words are combined with AND, so if the new query is the
+        cached query plus more words, the new result must be a subset of the
+        cached result. This is only true when the cached result is complete
+        (it has fewer hits than its limit).
+
+        :return: the extra words as a query string, and the cached hits.
+        """
+        words = query.split()
+        if _is_narrowable(words) is False:
+            return None
+        for (base_query, base_limit), hits in reversed(self.data.items()):
+            if len(hits) >= base_limit:
+                continue
+            base_words = base_query.split()
+            if len(base_words) < len(words) and words[: len(base_words)] == base_words:
+                return " ".join(words[len(base_words) :]), hits
+        return None
+
+    def clear(self):
+        self.data.clear()
+
+
+@dataclasses.dataclass
+class IndexHandle(BaseModel):
+    """
+    The cached objects of one index.
+
+    :param ds: the ``sayt.DataSet`` object.
+    :param bsm: the boto session of the latest search, the dataset
+        downloader uses it when the index is (re)built.
+    :param boto_kwargs: the boto3 kwargs of the latest search, the dataset
+        downloader uses it when the index is (re)built.
+    :param expire_at: the epoch timestamp when the dataset expires, 0 means
+        we don't know yet, we have to check the cache on disk.
+    :param built_at: the epoch timestamp when the index was built, 0 means
+        we don't know yet.
+    :param searcher: the open whoosh searcher, None means not opened yet.
+    :param generation: it is increased every time the searcher is reopened.
+    :param query_cache: the :class:`QueryCache` of the current generation.
+    :param lock: the lock to protect the searcher and the query cache.
+    """
+
+    ds: sayt.DataSet = dataclasses.field()
+    bsm: "BotoSesManager" = dataclasses.field()
+    boto_kwargs: dict = dataclasses.field()
+    expire_at: float = dataclasses.field(default=0)
+    built_at: float = dataclasses.field(default=0)
+    searcher: T.Optional["Searcher"] = dataclasses.field(default=None)
+    generation: int = dataclasses.field(default=0)
+    query_cache: QueryCache = dataclasses.field(default_factory=QueryCache)
+    lock: threading.RLock = dataclasses.field(default_factory=threading.RLock)
+
+    def set_searcher(self, searcher: "Searcher"):
+        if searcher is not self.searcher:
+            self.searcher = searcher
+            self.generation += 1
+            self.query_cache.clear()
+
+    def close(self):
+        with self.lock:
+            if self.searcher is not None:
+                self.searcher.close()
+                self.searcher = None
+                self.query_cache.clear()
+
+
+@dataclasses.dataclass
+class IndexRegistry(BaseModel):
+    """
+    The registry of :class:`IndexHandle`, the key is the index name, which
+    is unique for the (account, region, resource type, partition key)
+    combination. The profiles of the same account share the handle, the
+    open searcher and the query cache are kept when switching profile.
+    """
+
+    handles: T.Dict[str, IndexHandle] = dataclasses.field(default_factory=dict)
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def get_ds(
+        self,
+        index_name: str,
+        bsm: "BotoSesManager",
+        boto_kwargs: dict,
+        factory: T.Callable[[], sayt.DataSet],
+    ) -> sayt.DataSet:
+        """
+        Get the cached dataset object, create a new one by calling ``factory``
+        if it is not cached yet. The boto session and boto3 kwargs are
+        remembered for the dataset downloader, see :meth:`get_boto_context`.
+        """
+        with self.lock:
+            handle = self.handles.get(index_name)
+            if handle is None:
+                handle = IndexHandle(ds=factory(), bsm=bsm, boto_kwargs=boto_kwargs)
+                self.handles[index_name] = handle
+            else:
+                handle.bsm = bsm
+                handle.boto_kwargs = boto_kwargs
+            return handle.ds
+
+    def get_boto_context(
+        self,
+        index_name: str,
+        bsm: "BotoSesManager",
+        boto_kwargs: dict,
+    ) -> T.Tuple["BotoSesManager", dict]:
+        """
+        Get the boto session and boto3 kwargs of the latest search of the
+        index, the dataset downloader calls it at build time. Return the
+        given ones if the index is not in the registry.
+        """
+        with self.lock:
+            handle = self.handles.get(index_name)
+        if handle is None or handle.bsm is None:
+            return bsm, boto_kwargs
+        return handle.bsm, handle.boto_kwargs
+
+    def get_handle(self, ds: sayt.DataSet) -> IndexHandle:
+        """
+        Get the :class:`IndexHandle` of the dataset. The datasets of the
+        same index name share the handle, because they point to the same
+        index on disk.
+        """
+        with self.lock:
+            handle = self.handles.get(ds.index_name)
+            # the dataset is not created by the registry
+            if handle is None:
+                handle = IndexHandle(ds=ds, bsm=None, boto_kwargs=None)
+                self.handles[ds.index_name] = handle
+            return handle
+
+    def is_expired(self, ds: sayt.DataSet) -> bool:
+        """
+        Check if the dataset has never been indexed or the cache is expired.
+        The expire time is kept in memory, we only check the cache on disk
+        after it passes, because another process may have refreshed it.
+        """
+        handle = self.get_handle(ds)
+        if time.time() < handle.expire_at:
+            return False
+        value, expire_time = ds.cache.get(ds.cache_key, expire_time=True)
+        if value is None:
+            return True
+        handle.expire_at = float("inf") if expire_time is None else expire_time
+        return False
+
+    def mark_fresh(self, ds: sayt.DataSet):
+        """
+        Tell the registry that the dataset is just (re)built.
+        """
+        handle = self.get_handle(ds)
+        handle.built_at = time.time()
+        handle.expire_at = handle.built_at + ds.cache_expire
+
+    def mark_expired(self, ds: sayt.DataSet):
+        """
+        Expire the dataset, the next search will rebuild the index.
+        """
+        handle = self.get_handle(ds)
+        ds.cache.delete(ds.cache_key)
+        handle.expire_at = 0
+
+    @contextlib.contextmanager
+    def searcher(self, ds: sayt.DataSet) -> T.ContextManager["Searcher"]:
+        """
+        Get the open whoosh searcher of the dataset. It is reopened only
+        when the index generation changes.
+        """
+        with self.handle(ds) as handle:
+            yield handle.searcher
+
+    @contextlib.contextmanager
+    def handle(self, ds: sayt.DataSet) -> T.ContextManager[IndexHandle]:
+        """
+        Similar to :meth:`searcher`, but yield the locked :class:`IndexHandle`,
+        so you can also access the query cache of the current generation.
+        """
+        handle = self.get_handle(ds)
+        with handle.lock:
+            if handle.searcher is None:
+                handle.set_searcher(ds._get_index().searcher())
+            else:
+                try:
+                    if handle.searcher.up_to_date() is False:
+                        handle.set_searcher(handle.searcher.refresh())
+                # the index is removed
+                except Exception:  # pragma: no cover
+                    handle.close()
+                    handle.set_searcher(ds._get_index().searcher())
+            yield handle
+
+    def close(self, index_name: T.Optional[str] = None):
+        """
+        Close the open searchers and forget the cached datasets.
+
+        :param index_name: only close this index, if None, close all of them.
+        """
+        with self.lock:
+            if index_name is None:
+                index_names = list(self.handles)
+            else:
+                index_names = [index_name] if index_name in self.handles else []
+            for index_name in index_names:
+                self.handles.pop(index_name).close()
+
+
+index_registry = IndexRegistry()
@@ -9,6 +9,7 @@ import dataclasses
 
 from ..compat import TypedDict
 from ..terminal import remove_text_format
+from ..accounts import get_account_label
 
 from .base_item import BaseArsItem
 
@@ -16,6 +17,7 @@ if T.TYPE_CHECKING:  # pragma: no cover
     import aws_console_url.api as acu
 
     from ..documents.resource_document import T_ARS_RESOURCE_DOCUMENT
+    from ..ars_def import ARS
     from ..ui_def import UI
 
 
@@ -28,6 +30,7 @@ class T_AWS_RESOURCE_ITEM_VARIABLES(TypedDict):
     doc: "T_ARS_RESOURCE_DOCUMENT"
     resource_type: str
     partitioner_resource_type: T.Optional[str]
+    boto_kwargs: T.Optional[dict]
 
 
 @dataclasses.dataclass
@@ -76,9 +79,14 @@ class AwsResourceItem(BaseArsItem):
 
         We also have an array version :meth:`AwsResourceItem.from_many_document`.
         """
+        subtitle = doc.subtitle
+        if doc.region is not None:
+            subtitle = f"🌐 {doc.region} | {subtitle}"
+        if doc.account is not None:
+            subtitle = f"🏦 {get_account_label(doc.account)} | {subtitle}"
         return cls(
             title=doc.title,
-            subtitle=doc.subtitle,
+            subtitle=subtitle,
             uid=doc.uid,
             autocomplete=f"{resource_type}: {doc.autocomplete}",
             variables={
@@ -111,6 +119,14 @@ class AwsResourceItem(BaseArsItem):
         """
         return self.variables["doc"].name
 
+    def get_ars(self, ui: "UI") -> "ARS":
+        """
+        Get the :class:`~aws_resource_search.ars_def.ARS` object of the account
+        and region where the resource is found.
+        """
+        doc: "T_ARS_RESOURCE_DOCUMENT" = self.variables["doc"]
+        return ui.ars.get_account_ars(account=doc.account, region=doc.region)
+
     def get_console_url(self, console: "acu.AWSConsole") -> str:
         """
         Get AWS console url of the resource.
@@ -130,7 +146,7 @@ class AwsResourceItem(BaseArsItem):
 
         Open AWS console url in browser.
         """
-        self.open_url_or_print(ui, self.get_console_url(console=ui.ars.aws_console))
+        self.open_url_or_print(ui, self.get_console_url(console=self.get_ars(ui).aws_console))
 
     def ctrl_a_handler(self, ui: "UI"):  # pragma: no cover
         """
@@ -146,14 +162,21 @@ class AwsResourceItem(BaseArsItem):
 
         Copy AWS console url to clipboard.
         """
-        self.copy_or_print(ui, self.get_console_url(console=ui.ars.aws_console))
+        self.copy_or_print(ui, self.get_console_url(console=self.get_ars(ui).aws_console))
 
     def ctrl_p_handler(self, ui: "UI"):  # pragma: no cover
         """
         View details in a sub session. You can tap 'F1' to exit the sub session.
         """
+        from ..detail_cache import get_details
+
         doc: "T_ARS_RESOURCE_DOCUMENT" = self.variables["doc"]
-        items = doc.get_details(ars=ui.ars)
+        items = get_details(
+            ars=self.get_ars(ui),
+            resource_type=self.variables["resource_type"],
+            doc=doc,
+            boto_kwargs=self.variables.get("boto_kwargs"),
+        )
         ui.run_handler(items=items)
 
         # enter the main event loop of the sub query
@@ -61,18 +61,19 @@ class AwsResourceTypeItem(BaseArsItem):
         """
         resource_type = doc.name
         desc = doc.desc
-        searcher = ars.searcher_finder.import_searcher(resource_type)
-        try:
-            console_url = searcher.doc_class.get_list_resources_console_url(
-                console=ars.aws_console
-            )
+        # use the metadata, so we don't import the searcher module until
+        # the user actually searches this resource type
+        console_url = ars.searcher_finder.get_list_resources_console_url(
+            resource_type=resource_type,
+            console=ars.aws_console,
+        )
+        if console_url is None:
+            subtitle = f"hit {ShortcutEnum.TAB} to search"
+        else:
             subtitle = (
                 f"hit {ShortcutEnum.TAB} to search, "
                 f"hit {ShortcutEnum.ENTER} to list resources in AWS console."
             )
-        except NotImplementedError:
-            console_url = None
-            subtitle = f"hit {ShortcutEnum.TAB} to search"
         return cls(
             title=f"{format_resource_type(resource_type)}: {desc}",
             subtitle=subtitle,
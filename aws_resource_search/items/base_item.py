@@ -10,11 +10,6 @@ from pathlib import Path
 
 import zelfred.api as zf
 
-try:
-    import pyperclip
-except ImportError:  # pragma: no cover
-    pass
-
 
 @dataclasses.dataclass
 class BaseArsItem(zf.Item):
@@ -67,6 +62,8 @@ class BaseArsItem(zf.Item):
 
             This method will be used in the ``ctrl_a_handler`` or ``ctrl_w_handler``.
         """
+        import pyperclip
+
         try:
             pyperclip.copy(text)
         except pyperclip.PyperclipException:
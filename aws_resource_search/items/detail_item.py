@@ -7,14 +7,10 @@ See :class:`DetailItem`.
 import typing as T
 import dataclasses
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 import zelfred.api as zf
 
-try:
-    import pyperclip
-except ImportError:  # pragma: no cover
-    pass
-
 from ..terminal import ShortcutEnum, format_key_value
 from ..compat import TypedDict
 from .base_item import BaseArsItem, T_ARS_ITEM
@@ -25,6 +21,9 @@ if T.TYPE_CHECKING:  # pragma: no cover
     from ..ars_def import ARS
 
 
+T_DETAIL_TASK = T.Callable[[T.List["T_ARS_ITEM"]], T.Any]
+
+
 class T_DETAIL_ITEM_VARIABLES(TypedDict):
     """
     .. note::
@@ -321,3 +320,62 @@ class DetailItem(BaseArsItem):
             yield None
         except Exception as e:
             detail_items.append(ExceptionItem.from_error(error=e))
+
+    @classmethod
+    def run_tasks(
+        cls,
+        detail_items: T.List["T_ARS_ITEM"],
+        tasks: T.Iterable[T_DETAIL_TASK],
+        max_workers: int = 8,
+    ) -> T.List["T_ARS_ITEM"]:
+        """
+        Run many independent detail sections concurrently, each section is
+        a function that takes a list and appends detail items to it, just like
+        the body of the :meth:`error_handling` context manager. The exception
+        in each section is captured separately. The results are appended to
+        ``detail_items`` in the same order of ``tasks``, regardless of which
+        one finishes first.
+
+        Usage example:
+
+            >>> class S3BucketDocument(ResourceDocument):
+            ...     def get_details(self, ars: ARS):
+            ...         detail_items = DetailItem.get_initial_detail_items(self, ars)
+            ...         # create the boto3 client in the main thread
+            ...         s3_client = ars.bsm.s3_client
+            ...
+            ...         def get_policy(detail_items):
+            ...             res = s3_client.get_bucket_policy(...)
+            ...             detail_items.append(DetailItem.from_detail(...))
+            ...
+            ...         def get_tags(detail_items):
+            ...             res = s3_client.get_bucket_tagging(...)
+            ...             detail_items.extend(DetailItem.from_tags(...))
+            ...
+            ...         return DetailItem.run_tasks(detail_items, [get_policy, get_tags])
+
+        .. note::
+
+            The boto3 client is thread safe, but creating it is not. Please
+            create the client you need before calling this method.
+
+        :param detail_items: the list to append the result to.
+        :param tasks: the list of section functions.
+        :param max_workers: the max number of concurrent boto3 API calls.
+        """
+        tasks = list(tasks)
+        results = [list() for _ in tasks]
+
+        def run_task(task: T_DETAIL_TASK, items: T.List["T_ARS_ITEM"]):
+            with cls.error_handling(items):
+                task(items)
+
+        if len(tasks) <= 1:
+            for task, items in zip(tasks, results):
+                run_task(task, items)
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(tasks), max_workers)) as executor:
+                list(executor.map(run_task, tasks, results))
+        for items in results:
+            detail_items.extend(items)
+        return detail_items
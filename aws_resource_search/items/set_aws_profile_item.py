@@ -8,7 +8,6 @@ import typing as T
 import dataclasses
 
 import awscli_mate.api as awscli_mate
-import aws_console_url.api as aws_console_url
 
 from ..terminal import ShortcutEnum, format_key_value, highlight_text
 from .base_item import BaseArsItem
@@ -20,19 +19,10 @@ if T.TYPE_CHECKING:  # pragma: no cover
 
 def set_profile_in_bsm(profile: str, ars: "ARS"):
     """
-    Update the singleton ``bsm`` object by reset its cache and use a new AWS profile.
-    Also update all of related cached objects in ``ars``.
+    Switch the ``ars`` to use a new AWS profile, see
+    :meth:`~aws_resource_search.ars_def.ARS.set_profile`.
     """
-    ars.bsm.aws_access_key_id = None
-    ars.bsm.aws_secret_access_key = None
-    ars.bsm.aws_session_token = None
-    ars.bsm.region_name = None
-    ars.bsm.botocore_session = None
-    ars.bsm.profile_name = profile
-    ars.bsm.clear_cache()
-
-    ars.aws_console = aws_console_url.AWSConsole.from_bsm(ars.bsm)
-    ars.searcher_finder.searcher_cache.clear()
+    ars.set_profile(profile)
 
 
 @dataclasses.dataclass
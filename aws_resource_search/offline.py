@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""
+Offline mode: search the existing indexes without calling AWS, when the
+credential is expired or there is no network.
+
+- It is turned on explicitly by setting the ``ARS_OFFLINE`` environment
+    variable to ``true``, then the expired indexes are never refreshed.
+- It is also turned on automatically for one search, if refreshing the index
+    fails with :func:`is_offline_error` and the index was built before.
+"""
+
+import os
+
+import botocore.exceptions
+
+#: the error code of the ``ClientError`` caused by an expired or invalid credential
+_CREDENTIAL_ERROR_CODES = {
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "RequestExpired",
+    "InvalidClientTokenId",
+    "UnrecognizedClientException",
+}
+
+_OFFLINE_ERRORS = (
+    botocore.exceptions.ConnectionError,
+    botocore.exceptions.NoCredentialsError,
+    botocore.exceptions.PartialCredentialsError,
+    botocore.exceptions.CredentialRetrievalError,
+    botocore.exceptions.TokenRetrievalError,
+    botocore.exceptions.SSOTokenLoadError,
+    botocore.exceptions.UnauthorizedSSOTokenError,
+)
+
+
+def is_offline_mode() -> bool:
+    """
+    Check if the offline mode is turned on by the ``ARS_OFFLINE`` environment
+    variable.
+    """
+    return os.environ.get("ARS_OFFLINE", "").lower() in ["1", "true", "yes"]
+
+
+def is_offline_error(e: Exception) -> bool:
+    """
+    Check if the error is caused by no network or an expired credential,
+    so we can fall back to the existing index.
+    """
+    if isinstance(e, _OFFLINE_ERRORS):
+        return True
+    if isinstance(e, botocore.exceptions.ClientError):
+        return e.response.get("Error", {}).get("Code") in _CREDENTIAL_ERROR_CODES
+    return False
@@ -36,6 +36,11 @@ dir_index = dir_aws_resource_search.joinpath(".index")
 dir_cache = dir_aws_resource_search.joinpath(".cache")
 path_config_json = dir_aws_resource_search.joinpath("config.json")
 path_exception_item_txt = dir_aws_resource_search.joinpath("exception_item.txt")
+path_profile_account_json = dir_aws_resource_search.joinpath("profile_account.json")
+path_identity_json = dir_aws_resource_search.joinpath("identity.json")
+path_recent_resource_types_json = dir_aws_resource_search.joinpath(
+    "recent_resource_types.json"
+)
 
 # ------------------------------------------------------------------------------
 # ${HOME}/.aws/ dir
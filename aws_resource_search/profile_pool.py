@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+An LRU pool of the fully initialized per-profile boto session and AWS console
+objects, so switching back to a recently used AWS profile doesn't need to
+create a new boto session and call ``sts.get_caller_identity()`` again.
+
+Usage::
+
+    >>> from aws_resource_search.profile_pool import profile_pool
+    >>> context = profile_pool.get("my_profile")
+    >>> context.bsm, context.aws_console
+"""
+
+import typing as T
+import threading
+import dataclasses
+from collections import OrderedDict
+
+from boto_session_manager import BotoSesManager
+from boto_session_manager.manager import NOTHING
+import aws_console_url.api as acu
+
+from .base_model import BaseModel
+from .identity import identity_cache
+
+
+@dataclasses.dataclass
+class ProfileContext(BaseModel):
+    """
+    The objects bound to one AWS profile.
+
+    :param profile: the AWS profile name, None means the default profile.
+    :param bsm: the validated boto session, it also caches the boto3 clients.
+    :param aws_console: the AWS console url builder of this boto session.
+    """
+
+    profile: T.Optional[str] = dataclasses.field()
+    bsm: BotoSesManager = dataclasses.field()
+    aws_console: acu.AWSConsole = dataclasses.field()
+
+    @classmethod
+    def new(cls, profile: T.Optional[str] = NOTHING) -> "ProfileContext":
+        """
+        Create the context. If the identity of the profile is cached, it
+        doesn't call AWS at all, the identity is verified in the background.
+        """
+        from .ars_def import validate_bsm
+        from .account_map import profile_account_map
+
+        profile = None if profile is NOTHING else profile
+        bsm = BotoSesManager(profile_name=NOTHING if profile is None else profile)
+        identity = identity_cache.get(profile)
+        if identity is None:
+            validate_bsm(bsm)
+            identity = identity_cache.fetch(bsm)
+            profile_account_map.update(bsm)
+        else:
+            identity_cache.verify_in_background(profile)
+        return cls(
+            profile=profile,
+            bsm=bsm,
+            aws_console=acu.AWSConsole(
+                aws_account_id=identity.account_id,
+                aws_region=identity.region,
+                bsm=bsm,
+            ),
+        )
+
+
+@dataclasses.dataclass
+class ProfilePool(BaseModel):
+    """
+    The LRU pool of :class:`ProfileContext`, the key is the profile name.
+
+    The default profile is never pooled, because its content may be changed
+    by setting another profile as the default one.
+
+    :param max_size: the max number of pooled profiles.
+    """
+
+    max_size: int = dataclasses.field(default=8)
+    data: T.OrderedDict[str, ProfileContext] = dataclasses.field(
+        default_factory=OrderedDict
+    )
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+
+    def get(self, profile: T.Optional[str] = NOTHING) -> ProfileContext:
+        """
+        Get the context of the profile, create it if it is not pooled yet,
+        or the credential of the pooled one is expired.
+        """
+        if profile is NOTHING or profile is None:
+            return ProfileContext.new()
+        with self.lock:
+            context = self.data.get(profile)
+            if context is not None and context.bsm.is_expired() is False:
+                self.data.move_to_end(profile)
+                return context
+        context = ProfileContext.new(profile)
+        with self.lock:
+            self.data[profile] = context
+            self.data.move_to_end(profile)
+            while len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+        return context
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+profile_pool = ProfilePool()
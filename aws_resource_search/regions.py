@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+"""
+Multi-region search support. A resource type can be suffixed with
+``@{regions}`` to search the same resource type in multiple regions at once,
+for example:
+
+- ``ec2-instance@*: web``: search all regions in the ``regions`` config,
+    or all regions enabled in the account if it is empty.
+- ``ec2-instance@us-east-1,us-west-2: web``: search the given regions.
+
+Usage::
+
+    >>> from aws_resource_search.regions import parse_resource_type, resolve_regions
+    >>> resource_type, region_query = parse_resource_type("ec2-instance@*")
+    >>> regions = resolve_regions(bsm, region_query)
+    >>> docs = ars.ec2_instance.search("web", regions=regions)
+"""
+
+import typing as T
+import threading
+
+from boto_session_manager import BotoSesManager
+from boto_session_manager.manager import NOTHING
+
+#: the character between the resource type and the region query
+REGION_SEP = "@"
+#: the region query that means "all regions"
+ALL_REGIONS = "*"
+
+_regional_bsm_cache: T.Dict[T.Tuple[str, str], BotoSesManager] = dict()
+_enabled_regions_cache: T.Dict[str, T.List[str]] = dict()
+_lock = threading.Lock()
+
+
+def parse_resource_type(service_query: str) -> T.Tuple[str, T.Optional[str]]:
+    """
+    Split the ``resource-type@regions`` string.
+
+    Example::
+
+        >>> parse_resource_type("ec2-instance@*")
+        ('ec2-instance', '*')
+        >>> parse_resource_type("ec2-instance")
+        ('ec2-instance', None)
+
+    :return: the resource type and the region query, the region query is
+        None if it is a single region search.
+    """
+    if REGION_SEP in service_query:
+        resource_type, region_query = service_query.split(REGION_SEP, 1)
+        return resource_type.strip(), region_query.strip()
+    else:
+        return service_query, None
+
+
+def _get_session_key(bsm: BotoSesManager) -> str:
+    if bsm.profile_name is NOTHING or bsm.profile_name is None:
+        return bsm.boto_ses.get_credentials().access_key
+    else:
+        return bsm.profile_name
+
+
+def get_regional_bsm(bsm: BotoSesManager, region: str) -> BotoSesManager:
+    """
+    Get a ``BotoSesManager`` object that uses the same credential as the
+    given one, but in another region. The object is cached, so the boto3
+    clients are reused across searches.
+    """
+    if bsm.aws_region == region:
+        return bsm
+    key = (_get_session_key(bsm), region)
+    with _lock:
+        try:
+            return _regional_bsm_cache[key]
+        except KeyError:
+            pass
+        if bsm.profile_name is NOTHING or bsm.profile_name is None:
+            credentials = bsm.boto_ses.get_credentials()
+            regional_bsm = BotoSesManager(
+                aws_access_key_id=credentials.access_key,
+                aws_secret_access_key=credentials.secret_key,
+                aws_session_token=credentials.token,
+                region_name=region,
+            )
+        else:  # pragma: no cover
+            regional_bsm = BotoSesManager(
+                profile_name=bsm.profile_name,
+                region_name=region,
+            )
+        _regional_bsm_cache[key] = regional_bsm
+        return regional_bsm
+
+
+def get_enabled_regions(bsm: BotoSesManager) -> T.List[str]:
+    """
+    Get the list of regions enabled in the account, sorted by name.
+    """
+    key = _get_session_key(bsm)
+    with _lock:
+        try:
+            return _enabled_regions_cache[key]
+        except KeyError:
+            pass
+    res = bsm.ec2_client.describe_regions(AllRegions=False)
+    regions = sorted(dct["RegionName"] for dct in res["Regions"])
+    with _lock:
+        _enabled_regions_cache[key] = regions
+    return regions
+
+
+def resolve_regions(
+    bsm: BotoSesManager,
+    region_query: str,
+    default_regions: T.Optional[T.List[str]] = None,
+) -> T.List[str]:
+    """
+    Convert the region query to a list of regions.
+
+    :param bsm: the boto session to find the enabled regions.
+    :param region_query: ``"*"`` or comma separated region names.
+    :param default_regions: the regions for ``"*"``, if not given, use the
+        ``regions`` config, then all regions enabled in the account.
+    """
+    if region_query.strip() in ["", ALL_REGIONS]:
+        if default_regions is None:
+            from .conf.init import config
+
+            default_regions = config.regions
+        if default_regions:
+            return list(default_regions)
+        return get_enabled_regions(bsm)
+    regions = list()
+    for region in region_query.split(","):
+        region = region.strip()
+        if region and region not in regions:
+            regions.append(region)
+    return regions
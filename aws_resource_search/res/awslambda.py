@@ -71,14 +71,17 @@ class LambdaFunction(rl.ResourceDocument):
         return console.awslambda.functions
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.lambda_client.get_function(FunctionName=self.name)
+        lambda_client = ars.bsm.lambda_client
+
+        def get_function(detail_items: T.List[rl.DetailItem]):
+            res = lambda_client.get_function(FunctionName=self.name)
             func_config = res["Configuration"]
+            self.set_fresh_doc(self.from_resource(func_config, ars.bsm, {}))
             description = rl.get_description(func_config, "Description")
             role_arn = func_config["Role"]
             runtime = func_config.get("Runtime", "NA")
@@ -116,8 +119,8 @@ class LambdaFunction(rl.ResourceDocument):
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.lambda_client.list_event_source_mappings(
+        def list_event_source_mappings(detail_items: T.List[rl.DetailItem]):
+            res = lambda_client.list_event_source_mappings(
                 FunctionName=self.arn,
             )
             mappings = res.get("EventSourceMappings", [])
@@ -148,7 +151,13 @@ class LambdaFunction(rl.ResourceDocument):
                     )
                 )
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_function,
+                list_event_source_mappings,
+            ],
+        )
     # fmt: on
 
 
@@ -220,13 +229,15 @@ class LambdaFunctionAlias(rl.ResourceDocument):
         return console.awslambda.get_function_alias(name_or_arn=self.arn)
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.lambda_client.get_function_configuration(
+        lambda_client = ars.bsm.lambda_client
+
+        def get_function_configuration(detail_items: T.List[rl.DetailItem]):
+            res = lambda_client.get_function_configuration(
                 FunctionName=self.function_name,
                 Qualifier=self.name,
             )
@@ -258,8 +269,8 @@ class LambdaFunctionAlias(rl.ResourceDocument):
             env_vars = res.get("Environment", {}).get("Variables", {})
             detail_items.extend(rl.DetailItem.from_env_vars(env_vars, url))
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.lambda_client.list_event_source_mappings(
+        def list_event_source_mappings(detail_items: T.List[rl.DetailItem]):
+            res = lambda_client.list_event_source_mappings(
                 FunctionName=self.arn,
             )
             mappings = res.get("EventSourceMappings", [])
@@ -290,7 +301,13 @@ class LambdaFunctionAlias(rl.ResourceDocument):
                     )
                 )
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_function_configuration,
+                list_event_source_mappings,
+            ],
+        )
     # fmt: on
 
 
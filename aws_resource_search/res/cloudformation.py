@@ -88,7 +88,7 @@ class CloudFormationStack(rl.ResourceDocument):
         return console.cloudformation.stacks
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         detail_items = [] # don't use self.get_initial_detail_items here, the arn may change
 
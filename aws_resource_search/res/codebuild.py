@@ -71,7 +71,7 @@ class CodeBuildProject(rl.ResourceDocument):
         return console.codebuild.build_projects
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -245,7 +245,7 @@ class CodeBuildJobRun(rl.ResourceDocument):
         return console.codebuild.get_build_run(run_id_or_arn=self.arn)
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -52,12 +52,14 @@ class CodeCommitRepository(rl.ResourceDocument):
         return console.codecommit.repositories
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.codecommit_client.get_repository(repositoryName=self.name)
+        codecommit_client = ars.bsm.codecommit_client
+
+        def get_repository(detail_items: T.List[rl.DetailItem]):
+            res = codecommit_client.get_repository(repositoryName=self.name)
             dct = res["repositoryMetadata"]
             accountId = dct.get("accountId")
             repositoryId = dct.get("repositoryId")
@@ -81,12 +83,18 @@ class CodeCommitRepository(rl.ResourceDocument):
                 from_detail("cloneUrlGitRemoteCodecommit", f"codecommit::{ars.bsm.aws_region}://{self.name}", url=url)
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.codecommit_client.list_tags_for_resource(resourceArn=self.arn)
+        def list_tags_for_resource(detail_items: T.List[rl.DetailItem]):
+            res = codecommit_client.list_tags_for_resource(resourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_repository,
+                list_tags_for_resource,
+            ],
+        )
     # fmt: on
 
 
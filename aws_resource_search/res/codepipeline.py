@@ -54,13 +54,15 @@ class CodePipelinePipeline(rl.ResourceDocument):
         return console.codepipeline.pipelines
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
         
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.codepipeline_client.get_pipeline(name=self.name)
+        codepipeline_client = ars.bsm.codepipeline_client
+
+        def get_pipeline(detail_items: T.List[rl.DetailItem]):
+            res = codepipeline_client.get_pipeline(name=self.name)
             dct = res["pipeline"]
             version = dct.get("version", 0)
             update_at = rl.get_none_or_default(dct, "metadata.updated", "NA")
@@ -90,12 +92,18 @@ class CodePipelinePipeline(rl.ResourceDocument):
                     )
                 )
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.codepipeline_client.list_tags_for_resource(resourceArn=self.arn)
+        def list_tags_for_resource(detail_items: T.List[rl.DetailItem]):
+            res = codepipeline_client.list_tags_for_resource(resourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_pipeline,
+                list_tags_for_resource,
+            ],
+        )
     # fmt: on
 
 
@@ -62,13 +62,15 @@ class DynamodbTable(rl.ResourceDocument):
         return console.dynamodb.tables
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.dynamodb_client.describe_table(TableName=self.name)
+        dynamodb_client = ars.bsm.dynamodb_client
+
+        def describe_table(detail_items: T.List[rl.DetailItem]):
+            res = dynamodb_client.describe_table(TableName=self.name)
             dct = res["Table"]
 
             attrs = {d["AttributeName"]: d["AttributeType"] for d in dct.get("AttributeDefinitions", [])}
@@ -98,12 +100,18 @@ class DynamodbTable(rl.ResourceDocument):
                 ]
             )
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.dynamodb_client.list_tags_of_resource(ResourceArn=self.arn)
+        def list_tags_of_resource(detail_items: T.List[rl.DetailItem]):
+            res = dynamodb_client.list_tags_of_resource(ResourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url=url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                describe_table,
+                list_tags_of_resource,
+            ],
+        )
     # fmt: on
 
 
@@ -117,7 +117,7 @@ class Ec2Instance(rl.ResourceDocument, Ec2Mixin):
         return console.ec2.instances
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -136,6 +136,7 @@ class Ec2Instance(rl.ResourceDocument, Ec2Mixin):
             inst = self.from_resource(
                 instances[0], ars.bsm, dict(InstanceIds=[self.id])
             )
+            self.set_fresh_doc(inst)
             detail_items.extend([
                 from_detail("inst_id", inst.id, url=url),
                 from_detail("inst_type", inst.inst_type, url=url),
@@ -269,7 +270,7 @@ class Ec2Vpc(rl.ResourceDocument, Ec2Mixin):
     def get_list_resources_console_url(cls, console: acu.AWSConsole) -> str:
         return console.vpc.vpcs
 
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         get_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -389,7 +390,7 @@ class Ec2Subnet(rl.ResourceDocument, Ec2Mixin):
     def get_list_resources_console_url(cls, console: acu.AWSConsole) -> str:
         return console.vpc.subnets
 
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -497,7 +498,7 @@ class Ec2SecurityGroup(rl.ResourceDocument, Ec2Mixin):
     def get_list_resources_console_url(cls, console: acu.AWSConsole) -> str:
         return console.vpc.security_groups
 
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
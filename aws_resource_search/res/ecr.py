@@ -63,7 +63,7 @@ class EcrRepository(rl.ResourceDocument):
         return self.raw_data["repositoryName"]
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -79,18 +79,24 @@ class EcrRepository(rl.ResourceDocument):
                     from_detail("image_tag_mutability", self.raw_data["imageTagMutability"], url=url),
                 ]
             )
-            res = ars.bsm.ecr_client.get_repository_policy(
+
+        ecr_client = ars.bsm.ecr_client
+
+        def get_repository_policy(detail_items: T.List[rl.DetailItem]):
+            res = ecr_client.get_repository_policy(
                 registryId=self.registry_id,
                 repositoryName=self.repository_name,
             )
-
             detail_items.extend([
                 from_detail("repo_policy", self.one_line(res.get("policyText", "{}")), url=url),
             ])
-            res = ars.bsm.ecr_client.list_tags_for_resource(resourceArn=self.arn)
+
+        def list_tags_for_resource(detail_items: T.List[rl.DetailItem]):
+            res = ecr_client.list_tags_for_resource(resourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url=url))
-        return detail_items
+
+        return rl.DetailItem.run_tasks(detail_items, [get_repository_policy, list_tags_for_resource])
     # fmt: on
 
 
@@ -187,7 +193,7 @@ class EcrRepositoryImage(rl.ResourceDocument):
     def uri(self) -> str:
         return f"{self.repo_uri}:{self.digest}"
 
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -221,13 +221,15 @@ class GlueJob(rl.ResourceDocument, GlueMixin):
         return console.glue.jobs
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.glue_client.get_job(JobName=self.name)
+        glue_client = ars.bsm.glue_client
+
+        def get_job(detail_items: T.List[rl.DetailItem]):
+            res = glue_client.get_job(JobName=self.name)
             job_dct = res["Job"]
             description = job_dct.get("Description", "NA")
             role_arn = job_dct["Role"]
@@ -251,12 +253,12 @@ class GlueJob(rl.ResourceDocument, GlueMixin):
                 from_detail("script_location", script_location, url=ars.aws_console.s3.get_console_url(uri_liked=script_location)),
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.glue_client.get_tags(ResourceArn=self.arn)
+        def get_tags(detail_items: T.List[rl.DetailItem]):
+            res = glue_client.get_tags(ResourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(detail_items, [get_job, get_tags])
     # fmt: on
 
 
@@ -354,7 +356,7 @@ class GlueJobRun(rl.ResourceDocument):
         )
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = [
@@ -469,13 +471,15 @@ class GlueCrawler(rl.ResourceDocument, GlueMixin):
     def get_list_resources_console_url(cls, console: acu.AWSConsole) -> str:
         return console.glue.crawlers
 
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.glue_client.get_crawler(Name=self.name)
+        glue_client = ars.bsm.glue_client
+
+        def get_crawler(detail_items: T.List[rl.DetailItem]):
+            res = glue_client.get_crawler(Name=self.name)
             dct = res["Crawler"]
 
             description = dct.get("Description", "NA")
@@ -496,12 +500,12 @@ class GlueCrawler(rl.ResourceDocument, GlueMixin):
             ])
             # fmt: on
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.glue_client.get_tags(ResourceArn=self.arn)
+        def get_tags(detail_items: T.List[rl.DetailItem]):
+            res = glue_client.get_tags(ResourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(detail_items, [get_crawler, get_tags])
 
 
 class GlueCrawlerSearcher(rl.BaseSearcher[GlueCrawler]):
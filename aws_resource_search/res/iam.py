@@ -74,6 +74,7 @@ iam_group_searcher = IamGroupSearcher(
     fields=IamGroup.get_dataset_fields(),
     cache_expire=rl.config.get_cache_expire(rl.SearcherEnum.iam_group.value),
     more_cache_key=None,
+    is_global=True,
 )
 
 
@@ -129,6 +130,7 @@ iam_user_searcher = IamUserSearcher(
     fields=IamUser.get_dataset_fields(),
     cache_expire=rl.config.get_cache_expire(rl.SearcherEnum.iam_user.value),
     more_cache_key=None,
+    is_global=True,
 )
 
 
@@ -172,7 +174,7 @@ class IamRole(IamMixin, rl.ResourceDocument):
         return console.iam.roles
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -190,8 +192,10 @@ class IamRole(IamMixin, rl.ResourceDocument):
             ]
         )
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.iam_client.list_attached_role_policies(
+        iam_client = ars.bsm.iam_client
+
+        def list_attached_role_policies(detail_items: T.List[rl.DetailItem]):
+            res = iam_client.list_attached_role_policies(
                 RoleName=self.name,
                 MaxItems=50,
             )
@@ -205,8 +209,8 @@ class IamRole(IamMixin, rl.ResourceDocument):
                 for dct in res.get("AttachedPolicies", [])
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.iam_client.list_role_policies(RoleName=self.name, MaxItems=50)
+        def list_role_policies(detail_items: T.List[rl.DetailItem]):
+            res = iam_client.list_role_policies(RoleName=self.name, MaxItems=50)
             detail_items.extend(
                 [
                     from_detail(
@@ -225,12 +229,19 @@ class IamRole(IamMixin, rl.ResourceDocument):
                 ]
             )
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.iam_client.list_role_tags(RoleName=self.name)
+        def list_role_tags(detail_items: T.List[rl.DetailItem]):
+            res = iam_client.list_role_tags(RoleName=self.name)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                list_attached_role_policies,
+                list_role_policies,
+                list_role_tags,
+            ],
+        )
     # fmt: on
 
 
@@ -252,6 +263,7 @@ iam_role_searcher = IamRoleSearcher(
     fields=IamRole.get_dataset_fields(),
     cache_expire=rl.config.get_cache_expire(rl.SearcherEnum.iam_role.value),
     more_cache_key=None,
+    is_global=True,
 )
 
 
@@ -289,19 +301,21 @@ class IamPolicy(IamMixin, rl.ResourceDocument):
         return console.iam.policies
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
         detail_items.append(from_detail("create_date", self.create_date))
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.iam_client.get_policy(PolicyArn=self.arn)
+        iam_client = ars.bsm.iam_client
+
+        def get_policy(detail_items: T.List[rl.DetailItem]):
+            res = iam_client.get_policy(PolicyArn=self.arn)
             dct = res["Policy"]
             policy_id = dct["PolicyId"]
             default_version_id = dct["DefaultVersionId"]
             attachment_count = dct["AttachmentCount"]
             description = dct.get("Description", "No description")
-            res = ars.bsm.iam_client.get_policy_version(PolicyArn=self.arn, VersionId=default_version_id)
+            res = iam_client.get_policy_version(PolicyArn=self.arn, VersionId=default_version_id)
             document: dict = res["PolicyVersion"]["Document"]
             detail_items.extend([
                 from_detail("policy_id", policy_id, url=url),
@@ -310,11 +324,11 @@ class IamPolicy(IamMixin, rl.ResourceDocument):
                 from_detail("description", description, url=url),
                 from_detail("document", document, self.one_line(document), url=url),
             ])
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.iam_client.list_policy_tags(PolicyArn=self.arn)
+        def list_policy_tags(detail_items: T.List[rl.DetailItem]):
+            res = iam_client.list_policy_tags(PolicyArn=self.arn)
             tags: dict = {dct["Key"]: dct["Value"] for dct in res.get("Tags", [])}
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
-        return detail_items
+        return rl.DetailItem.run_tasks(detail_items, [get_policy, list_policy_tags])
     # fmt: on
 
 
@@ -336,4 +350,5 @@ iam_policy_searcher = IamPolicySearcher(
     fields=IamPolicy.get_dataset_fields(),
     cache_expire=rl.config.get_cache_expire(rl.SearcherEnum.iam_policy.value),
     more_cache_key=None,
+    is_global=True,
 )
@@ -65,7 +65,7 @@ class KmsKeyAlias(rl.ResourceDocument):
         return console.kms.customer_managed_keys
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -74,8 +74,10 @@ class KmsKeyAlias(rl.ResourceDocument):
             from_detail("KeyId", self.raw_data.get("TargetKeyId", "NA"), url=url),
         ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.kms_client.describe_key(KeyId=self.key_id)
+        kms_client = ars.bsm.kms_client
+
+        def describe_key(detail_items: T.List[rl.DetailItem]):
+            res = kms_client.describe_key(KeyId=self.key_id)
             dct = res["KeyMetadata"]
             detail_items.extend([
                 from_detail("KeyManager", dct.get("KeyManager", "NA"), url=url),
@@ -87,11 +89,11 @@ class KmsKeyAlias(rl.ResourceDocument):
                 from_detail("KeyUsage", dct.get("KeyUsage", "NA"), url=url),
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.kms_client.list_resource_tags(KeyId=self.key_id)
+        def list_resource_tags(detail_items: T.List[rl.DetailItem]):
+            res = kms_client.list_resource_tags(KeyId=self.key_id)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
-        return detail_items
+        return rl.DetailItem.run_tasks(detail_items, [describe_key, list_resource_tags])
     # fmt: on
 
 
@@ -128,7 +128,7 @@ class S3Bucket(rl.ResourceDocument):
     # resource details view when user tap 'Ctrl P'.
     # you may call some boto3 API to get more details about the resource.
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         """
         Include s3 uri, s3 arn, bucket location and tags in details.
         """
@@ -141,20 +141,24 @@ class S3Bucket(rl.ResourceDocument):
         detail_items.append(from_detail("s3 uri", f"s3://{self.name}", url=url))
 
         # the second code block is to call boto3 API to get more details
-        # we should wrap the code block with ``self.enrich_details(detail_items)``
-        # context manager because we may not have the permission
-        # the context manager will catch the exception and add a debug message
-        # to tell the user that we don't have the permission to call the API
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.s3_client.get_bucket_location(Bucket=self.name)
+        # each API call is a function that appends items to its own list,
+        # ``rl.DetailItem.run_tasks`` runs them concurrently, and wraps each
+        # of them with ``rl.DetailItem.error_handling`` because we may not
+        # have the permission. It will catch the exception and add a debug
+        # message to tell the user that we don't have the permission to call the API
+        # create the boto3 client before that, because it is not thread safe
+        s3_client = ars.bsm.s3_client
+
+        def get_bucket_location(detail_items: T.List[rl.DetailItem]):
+            res = s3_client.get_bucket_location(Bucket=self.name)
             location = res["LocationConstraint"]
             if not location:
                 location = "us-east-1"
             detail_items.append(from_detail("location", location, url=url))
 
         # below, we call more API to get more information
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.s3_client.get_bucket_versioning(Bucket=self.name)
+        def get_bucket_versioning(detail_items: T.List[rl.DetailItem]):
+            res = s3_client.get_bucket_versioning(Bucket=self.name)
             versioning = res.get("Status", "Not enabled yet")
             mfa_delete = res.get("MFADelete", "Not enabled yet")
             detail_items.extend([
@@ -162,8 +166,8 @@ class S3Bucket(rl.ResourceDocument):
                 from_detail("mfa_delete", mfa_delete, url=url),
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.s3_client.get_bucket_encryption(Bucket=self.name)
+        def get_bucket_encryption(detail_items: T.List[rl.DetailItem]):
+            res = s3_client.get_bucket_encryption(Bucket=self.name)
             rules = res.get("ServerSideEncryptionConfiguration", {}).get("Rules", [])
             if rules:
                 rule = rules[0]
@@ -177,24 +181,34 @@ class S3Bucket(rl.ResourceDocument):
                 ])
 
         # similar to the second code block
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.s3_client.get_bucket_policy(Bucket=self.name)
+        def get_bucket_policy(detail_items: T.List[rl.DetailItem]):
+            res = s3_client.get_bucket_policy(Bucket=self.name)
             policy = res.get("Policy", "{}")
             detail_items.append(from_detail("bucket_policy", policy, self.one_line(policy), url=url))
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.s3_client.get_bucket_cors(Bucket=self.name)
+        def get_bucket_cors(detail_items: T.List[rl.DetailItem]):
+            res = s3_client.get_bucket_cors(Bucket=self.name)
             dct = {"CORSRules": res.get("CORSRules", [])}
             cors = json.dumps(dct)
             detail_items.append(from_detail("CORS", cors, self.one_line(cors), url=url))
 
-        # the last code block is usually to get the tags of the resource
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.s3_client.get_bucket_tagging(Bucket=self.name)
+        # the last task is usually to get the tags of the resource
+        def get_bucket_tagging(detail_items: T.List[rl.DetailItem]):
+            res = s3_client.get_bucket_tagging(Bucket=self.name)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_bucket_location,
+                get_bucket_versioning,
+                get_bucket_encryption,
+                get_bucket_policy,
+                get_bucket_cors,
+                get_bucket_tagging,
+            ],
+        )
     # fmt: on
 
 
@@ -239,4 +253,7 @@ s3_bucket_searcher = S3BucketSearcher(
     cache_expire=rl.config.get_cache_expire(rl.SearcherEnum.s3_bucket.value),
     # this is only used for child resource, we will cover it in the sfn.py file
     more_cache_key=None,
+    # list_buckets returns all buckets in the account no matter which region
+    # you call it from, so all regions share one index
+    is_global=True,
 )
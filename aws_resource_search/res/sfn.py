@@ -71,13 +71,15 @@ class SfnStateMachine(rl.ResourceDocument):
         return console.step_function.state_machines
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars, arn_key="statemachine_arn")
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.sfn_client.describe_state_machine(stateMachineArn=self.arn)
+        sfn_client = ars.bsm.sfn_client
+
+        def describe_state_machine(detail_items: T.List[rl.DetailItem]):
+            res = sfn_client.describe_state_machine(stateMachineArn=self.arn)
             status = res["status"]
             role_arn = res["roleArn"]
             definition = res["definition"]
@@ -94,12 +96,18 @@ class SfnStateMachine(rl.ResourceDocument):
                 from_detail("creation_date", creation_date, url=url),
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.sfn_client.list_tags_for_resource(resourceArn=self.arn)
+        def list_tags_for_resource(detail_items: T.List[rl.DetailItem]):
+            res = sfn_client.list_tags_for_resource(resourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                describe_state_machine,
+                list_tags_for_resource,
+            ],
+        )
     # fmt: on
 
 
@@ -186,7 +194,7 @@ class SfnExecution(rl.ResourceDocument):
         )
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars, arn_key="exec_arn")
@@ -43,13 +43,15 @@ class SnsTopic(rl.ResourceDocument):
         return console.sns.topics
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.sns_client.get_topic_attributes(TopicArn=self.arn)
+        sns_client = ars.bsm.sns_client
+
+        def get_topic_attributes(detail_items: T.List[rl.DetailItem]):
+            res = sns_client.get_topic_attributes(TopicArn=self.arn)
             access_policy = res.get("Attributes", {}).get("Policy")
             delivery_policy = res.get("Attributes", {}).get("DeliveryPolicy")
             subscriptions_confirmed = res.get("Attributes", {}).get("SubscriptionsConfirmed", "NA")
@@ -67,12 +69,18 @@ class SnsTopic(rl.ResourceDocument):
                 from_detail("content_based_deduplication_enabled", content_based_deduplication_enabled, url=url),
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.sns_client.list_tags_for_resource(ResourceArn=self.arn)
+        def list_tags_for_resource(detail_items: T.List[rl.DetailItem]):
+            res = sns_client.list_tags_for_resource(ResourceArn=self.arn)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_topic_attributes,
+                list_tags_for_resource,
+            ],
+        )
     # fmt: on
 
 
@@ -61,7 +61,7 @@ class SqsQueue(rl.ResourceDocument):
     def get_list_resources_console_url(cls, console: acu.AWSConsole) -> str:
         return console.sqs.queues
 
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
@@ -73,8 +73,10 @@ class SqsQueue(rl.ResourceDocument):
         )
 
         # fmt: off
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.sqs_client.get_queue_attributes(
+        sqs_client = ars.bsm.sqs_client
+
+        def get_queue_attributes(detail_items: T.List[rl.DetailItem]):
+            res = sqs_client.get_queue_attributes(
                 QueueUrl=self.queue_url,
                 AttributeNames=["All"],
             )
@@ -97,12 +99,18 @@ class SqsQueue(rl.ResourceDocument):
             ])
         # fmt: on
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.sqs_client.list_queue_tags(QueueUrl=self.queue_url)
+        def list_queue_tags(detail_items: T.List[rl.DetailItem]):
+            res = sqs_client.list_queue_tags(QueueUrl=self.queue_url)
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_queue_attributes,
+                list_queue_tags,
+            ],
+        )
 
 
 class SqsQueueSearcher(rl.BaseSearcher[SqsQueue]):
@@ -73,13 +73,15 @@ class SsmParameter(rl.ResourceDocument):
         return console.ssm.parameters
 
     # fmt: off
-    def get_details(self, ars: "ARS") -> T.List[rl.DetailItem]:
+    def get_details(self, ars: "ARS") -> T.List["rl.DetailItem"]:
         from_detail = rl.DetailItem.from_detail
         url = self.get_console_url(console=ars.aws_console)
         detail_items = rl.DetailItem.get_initial_detail_items(doc=self, ars=ars)
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.ssm_client.get_parameter(Name=self.name)
+        ssm_client = ars.bsm.ssm_client
+
+        def get_parameter(detail_items: T.List[rl.DetailItem]):
+            res = ssm_client.get_parameter(Name=self.name)
             param = res["Parameter"]
             detail_items.extend([
                 from_detail("LastModifiedDate", self.raw_data.get("LastModifiedDate", "NA"), url=url),
@@ -89,15 +91,21 @@ class SsmParameter(rl.ResourceDocument):
                 from_detail("Value", param.get("Value", "NA"), self.one_line(param.get("Value", "NA")), url=url),
             ])
 
-        with rl.DetailItem.error_handling(detail_items):
-            res = ars.bsm.ssm_client.list_tags_for_resource(
+        def list_tags_for_resource(detail_items: T.List[rl.DetailItem]):
+            res = ssm_client.list_tags_for_resource(
                 ResourceType="Parameter",
                 ResourceId=self.name,
             )
             tags = rl.extract_tags(res)
             detail_items.extend(rl.DetailItem.from_tags(tags, url))
 
-        return detail_items
+        return rl.DetailItem.run_tasks(
+            detail_items,
+            [
+                get_parameter,
+                list_tags_for_resource,
+            ],
+        )
     # fmt: on
 
 
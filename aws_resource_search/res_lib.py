@@ -2,52 +2,120 @@
 
 """
 This module is an import namespace for everything related to the search.
+
+The attributes are imported on first access, so importing this namespace
+is cheap, and each resource searcher module only loads the parts it uses.
 """
 
-from .terminal import terminal
-from .terminal import format_shortcut
-from .terminal import highlight_text
-from .terminal import format_resource_type
-from .terminal import format_key
-from .terminal import format_value
-from .terminal import format_key_value
-from .terminal import ShortcutEnum
-from .terminal import SUBTITLE
-from .terminal import SHORT_SUBTITLE
-from .searcher_enum import SearcherEnum
-from .downloader import T_RESULT_DATA
-from .downloader import ResourceIterproxy
-from .downloader import ResultPath
-from .downloader import list_resources
-from .downloader import extract_tags
-from .documents.api import BaseArsDocument
-from .documents.api import T_ARS_DOCUMENT
-from .documents.api import ResourceTypeDocument
-from .documents.api import get_utc_now
-from .documents.api import to_human_readable_elapsed
-from .documents.api import to_utc_dt
-from .documents.api import SIMPLE_DT_FMT
-from .documents.api import to_simple_dt_fmt
-from .documents.api import to_iso_dt_fmt
-from .documents.api import get_none_or_default
-from .documents.api import get_description
-from .documents.api import get_datetime
-from .documents.api import get_datetime_simple_fmt
-from .documents.api import get_datetime_iso_fmt
-from .documents.api import ResourceDocument
-from .documents.api import T_ARS_RESOURCE_DOCUMENT
-from .items.api import BaseArsItem
-from .items.api import T_ARS_ITEM
-from .items.api import DetailItem
-from .items.api import ExceptionItem
-from .items.api import FileItem
-from .items.api import InfoItem
-from .items.api import UrlItem
-from .items.api import AwsResourceTypeItem
-from .items.api import AwsResourceItem
-from .items.api import SetAwsProfileItem
-from .items.api import ShowAwsInfoItem
-from .base_searcher import preprocess_query
-from .base_searcher import BaseSearcher
-from .base_searcher import T_SEARCHER
-from .conf.init import config
+import typing as T
+
+from .utils import lazy_getattr
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .terminal import terminal
+    from .terminal import format_shortcut
+    from .terminal import highlight_text
+    from .terminal import format_resource_type
+    from .terminal import format_key
+    from .terminal import format_value
+    from .terminal import format_key_value
+    from .terminal import ShortcutEnum
+    from .terminal import SUBTITLE
+    from .terminal import SHORT_SUBTITLE
+    from .searcher_enum import SearcherEnum
+    from .downloader import T_RESULT_DATA
+    from .downloader import ResourceIterproxy
+    from .downloader import ResultPath
+    from .downloader import list_resources
+    from .downloader import extract_tags
+    from .documents.api import BaseArsDocument
+    from .documents.api import T_ARS_DOCUMENT
+    from .documents.api import ResourceTypeDocument
+    from .documents.api import get_utc_now
+    from .documents.api import to_human_readable_elapsed
+    from .documents.api import to_utc_dt
+    from .documents.api import SIMPLE_DT_FMT
+    from .documents.api import to_simple_dt_fmt
+    from .documents.api import to_iso_dt_fmt
+    from .documents.api import get_none_or_default
+    from .documents.api import get_description
+    from .documents.api import get_datetime
+    from .documents.api import get_datetime_simple_fmt
+    from .documents.api import get_datetime_iso_fmt
+    from .documents.api import ResourceDocument
+    from .documents.api import T_ARS_RESOURCE_DOCUMENT
+    from .items.api import BaseArsItem
+    from .items.api import T_ARS_ITEM
+    from .items.api import DetailItem
+    from .items.api import ExceptionItem
+    from .items.api import FileItem
+    from .items.api import InfoItem
+    from .items.api import UrlItem
+    from .items.api import AwsResourceTypeItem
+    from .items.api import AwsResourceItem
+    from .items.api import SetAwsProfileItem
+    from .items.api import ShowAwsInfoItem
+    from .base_searcher import preprocess_query
+    from .base_searcher import BaseSearcher
+    from .base_searcher import SearchPage
+    from .base_searcher import T_SEARCHER
+    from .conf.init import config
+
+_LAZY_ATTRS = {
+    "terminal": ".terminal",
+    "format_shortcut": ".terminal",
+    "highlight_text": ".terminal",
+    "format_resource_type": ".terminal",
+    "format_key": ".terminal",
+    "format_value": ".terminal",
+    "format_key_value": ".terminal",
+    "ShortcutEnum": ".terminal",
+    "SUBTITLE": ".terminal",
+    "SHORT_SUBTITLE": ".terminal",
+    "SearcherEnum": ".searcher_enum",
+    "T_RESULT_DATA": ".downloader",
+    "ResourceIterproxy": ".downloader",
+    "ResultPath": ".downloader",
+    "list_resources": ".downloader",
+    "extract_tags": ".downloader",
+    "BaseArsDocument": ".documents.api",
+    "T_ARS_DOCUMENT": ".documents.api",
+    "ResourceTypeDocument": ".documents.api",
+    "get_utc_now": ".documents.api",
+    "to_human_readable_elapsed": ".documents.api",
+    "to_utc_dt": ".documents.api",
+    "SIMPLE_DT_FMT": ".documents.api",
+    "to_simple_dt_fmt": ".documents.api",
+    "to_iso_dt_fmt": ".documents.api",
+    "get_none_or_default": ".documents.api",
+    "get_description": ".documents.api",
+    "get_datetime": ".documents.api",
+    "get_datetime_simple_fmt": ".documents.api",
+    "get_datetime_iso_fmt": ".documents.api",
+    "ResourceDocument": ".documents.api",
+    "T_ARS_RESOURCE_DOCUMENT": ".documents.api",
+    "BaseArsItem": ".items.api",
+    "T_ARS_ITEM": ".items.api",
+    "DetailItem": ".items.api",
+    "ExceptionItem": ".items.api",
+    "FileItem": ".items.api",
+    "InfoItem": ".items.api",
+    "UrlItem": ".items.api",
+    "AwsResourceTypeItem": ".items.api",
+    "AwsResourceItem": ".items.api",
+    "SetAwsProfileItem": ".items.api",
+    "ShowAwsInfoItem": ".items.api",
+    "preprocess_query": ".base_searcher",
+    "BaseSearcher": ".base_searcher",
+    "SearchPage": ".base_searcher",
+    "T_SEARCHER": ".base_searcher",
+    "config": ".conf.init",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+__getattr__ = lazy_getattr(__name__, __package__, _LAZY_ATTRS)
+
+
+def __dir__():
+    return __all__
@@ -10,12 +10,14 @@ programmatically based on the resource type.
 import typing as T
 import json
 import importlib
+import threading
 import dataclasses
 
 from .paths import path_searchers_json
 from .searcher_metadata import SearcherMetadata
 
 if T.TYPE_CHECKING:  # pragma: no cover
+    import aws_console_url.api as acu
     from .base_searcher import T_SEARCHER
 
 
@@ -28,6 +30,7 @@ class SearcherFinder:
 
     sm_meta_mapper: T.Dict[str, SearcherMetadata] = dataclasses.field(init=False)
     searcher_cache: T.Dict[str, "T_SEARCHER"] = dataclasses.field(default_factory=dict)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
 
     def reload(self):
         """
@@ -41,6 +44,7 @@ class SearcherFinder:
                 ngram=dct["ngram"],
                 module=dct["module"],
                 var=dct["var"],
+                console_url_attr=dct.get("console_url_attr"),
             )
             for id, dct in data.items()
         }
@@ -64,16 +68,44 @@ class SearcherFinder:
         """
         Import the searcher object by resource type, it uses cache to avoid
         loading the same module multiple times.
+
+        The searcher object is shared by the whole process, don't bind a boto
+        session to it, use :meth:`aws_resource_search.ars_def.ARS.get_searcher`
+        or pass the ``bsm`` argument to the search methods instead.
         """
         if self.is_valid_resource_type(resource_type):
-            if resource_type not in self.searcher_cache:
-                mod = searcher_finder.sm_meta_mapper[resource_type].module
-                var = searcher_finder.sm_meta_mapper[resource_type].var
-                module = importlib.import_module(f"aws_resource_search.res.{mod}")
-                self.searcher_cache[resource_type] = getattr(module, var)
-            return self.searcher_cache[resource_type]
+            try:
+                return self.searcher_cache[resource_type]
+            except KeyError:
+                pass
+            with self._lock:
+                if resource_type not in self.searcher_cache:
+                    mod = self.sm_meta_mapper[resource_type].module
+                    var = self.sm_meta_mapper[resource_type].var
+                    module = importlib.import_module(f"aws_resource_search.res.{mod}")
+                    self.searcher_cache[resource_type] = getattr(module, var)
+                return self.searcher_cache[resource_type]
         else:
             raise ValueError(f"Invalid resource type: {resource_type}")
 
+    def get_list_resources_console_url(
+        self,
+        resource_type: str,
+        console: "acu.AWSConsole",
+    ) -> T.Optional[str]:
+        """
+        Get the AWS console url to list resources of the given type from the
+        metadata, it doesn't import the searcher module.
+
+        :return: the url, or None if the resource type doesn't have one.
+        """
+        attr = self.sm_meta_mapper[resource_type].console_url_attr
+        if attr is None:
+            return None
+        value = console
+        for name in attr.split("."):
+            value = getattr(value, name)
+        return value
+
 
 searcher_finder = SearcherFinder()  # singleton object
@@ -4,6 +4,7 @@
 See :class:`SearcherMetadata`.
 """
 
+import typing as T
 import dataclasses
 
 from .base_model import BaseModel
@@ -36,7 +37,8 @@ class SearcherMetadata(BaseModel):
             klass="S3BucketSearcher",
             module="s3",
             ngram="simple storage service",
-            var="s3_bucket_searcher"
+            var="s3_bucket_searcher",
+            console_url_attr="s3.buckets",
         )
 
     :param id: the maintainer defined unique identifier of the resource type,
@@ -48,6 +50,11 @@ class SearcherMetadata(BaseModel):
     :param klass: the class name in the searcher module, for example ``LambdaFunction``
     :param var: the variable name of the searcher class instance of the
         searcher module, for example ``lambda_function_searcher``.
+    :param console_url_attr: the attribute path of the "list resources" AWS
+        console url on the :class:`aws_console_url.api.AWSConsole` object,
+        for example ``awslambda.functions``. None means there is no such url.
+        It lets us render the resource type list without importing the
+        searcher module.
     """
 
     id: str = dataclasses.field()
@@ -56,6 +63,7 @@ class SearcherMetadata(BaseModel):
     module: str = dataclasses.field(default=None)
     klass: str = dataclasses.field(default=None)
     var: str = dataclasses.field(default=None)
+    console_url_attr: T.Optional[str] = dataclasses.field(default=None)
 
     @property
     def id_snake(self) -> str:
@@ -5,17 +5,26 @@ This module contains functions to manipulate terminal output.
 """
 
 import typing as T
-import blessed
+import functools
 from datetime import datetime, timezone
 
-terminal = blessed.Terminal()
-"""
-The terminal object is a singleton instance of :class:`blessed.Terminal`.
-We only create this object once and use it in the 
-:func:`~aws_resource_search.ui.main.run_ui`.
-"""
+if T.TYPE_CHECKING:  # pragma: no cover
+    import blessed
+
+
+@functools.lru_cache(maxsize=1)
+def get_terminal() -> "blessed.Terminal":
+    """
+    Get the singleton instance of :class:`blessed.Terminal`. We only create
+    this object once and use it in the :func:`~aws_resource_search.ui.main.run_ui`.
+
+    ``blessed`` is imported on first use, so commands that don't print
+    colored text don't pay for it. The ``terminal`` and ``term`` attribute
+    of this module are the same object.
+    """
+    import blessed
 
-term = terminal
+    return blessed.Terminal()
 
 
 def format_shortcut(key: str) -> str:
@@ -25,7 +34,7 @@ def format_shortcut(key: str) -> str:
 
         :magenta:`Enter` to open url
     """
-    return f"{term.magenta}{key}{term.normal}"
+    return f"{get_terminal().magenta}{key}{get_terminal().normal}"
 
 
 def highlight_text(text: str) -> str:
@@ -35,7 +44,7 @@ def highlight_text(text: str) -> str:
 
         this is a very :cyan:`Important message`!
     """
-    return f"{term.cyan}{text}{term.normal}"
+    return f"{get_terminal().cyan}{text}{get_terminal().normal}"
 
 
 def format_resource_type(resource_type: str) -> str:
@@ -45,7 +54,7 @@ def format_resource_type(resource_type: str) -> str:
 
         :blue:`sfn-statemachine`: name = CognitoUserManagement
     """
-    return f"{term.green}{resource_type}{term.normal}"
+    return f"{get_terminal().green}{resource_type}{get_terminal().normal}"
 
 
 def format_key(key: str) -> str:
@@ -67,7 +76,7 @@ def format_value(value: str) -> str:
     """
     if isinstance(value, datetime):
         value = str(value.astimezone(tz=timezone.utc).replace(microsecond=0))[:19]
-    return f"{term.yellow}{value}{term.normal}"
+    return f"{get_terminal().yellow}{value}{get_terminal().normal}"
 
 
 def format_key_value(key: str, value: T.Any) -> str:
@@ -86,6 +95,7 @@ def remove_text_format(text: str) -> str:
     """
     Remove the terminal format from the given text.
     """
+    term = get_terminal()
     formats = [
         term.cyan,
         term.yellow,
@@ -99,6 +109,18 @@ def remove_text_format(text: str) -> str:
     return text
 
 
+class _Shortcut:
+    """
+    A class attribute that formats the shortcut key when it is accessed.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def __get__(self, instance, owner) -> str:
+        return format_shortcut(self.key)
+
+
 class ShortcutEnum:
     """
     Formatted keyboard shortcuts::
@@ -110,41 +132,65 @@ class ShortcutEnum:
         Tap :magenta:`Enter` to open url
     """
 
-    TAB = format_shortcut("Tab")
-    ENTER = format_shortcut("Enter")
-    CTRL_A = format_shortcut("Ctrl A")
-    CTRL_W = format_shortcut("Ctrl W")
-    CTRL_U = format_shortcut("Ctrl U")
-    CTRL_P = format_shortcut("Ctrl P")
-    F1 = format_shortcut("F1")
+    TAB = _Shortcut("Tab")
+    ENTER = _Shortcut("Enter")
+    CTRL_A = _Shortcut("Ctrl A")
+    CTRL_W = _Shortcut("Ctrl W")
+    CTRL_U = _Shortcut("Ctrl U")
+    CTRL_P = _Shortcut("Ctrl P")
+    F1 = _Shortcut("F1")
 
 
-SUBTITLE = (
-    f"🌐 {ShortcutEnum.ENTER} to open url, "
-    f"📋 {ShortcutEnum.CTRL_A} to copy arn, "
-    f"🔗 {ShortcutEnum.CTRL_U} to copy url, "
-    f"👀 {ShortcutEnum.CTRL_P} to view details."
-)
-"""
-The subtitle in the zelfred UI.
+def get_subtitle() -> str:
+    """
+    The subtitle in the zelfred UI.
 
-The default subtitle is the help text to show the user how to interact with the UI.
+    The default subtitle is the help text to show the user how to interact with the UI.
 
-Example:
+    Example:
 
-🌐 :magenta:`Enter` to open url, 📋 :magenta:`Ctrl A` to copy arn, 🔗 :magenta:`Ctrl U` to copy url, 👀 :magenta:`Ctrl P` to view details."
-"""
+    🌐 :magenta:`Enter` to open url, 📋 :magenta:`Ctrl A` to copy arn, 🔗 :magenta:`Ctrl U` to copy url, 👀 :magenta:`Ctrl P` to view details."
+    """
+    return (
+        f"🌐 {ShortcutEnum.ENTER} to open url, "
+        f"📋 {ShortcutEnum.CTRL_A} to copy arn, "
+        f"🔗 {ShortcutEnum.CTRL_U} to copy url, "
+        f"👀 {ShortcutEnum.CTRL_P} to view details."
+    )
 
-SHORT_SUBTITLE = (
-    f"🌐 {ShortcutEnum.ENTER}, "
-    f"📋 {ShortcutEnum.CTRL_A}, "
-    f"🔗 {ShortcutEnum.CTRL_U}, "
-    f"👀 {ShortcutEnum.CTRL_P}."
-)
-"""
-A shorter version of subtitle.
 
-Example:
+def get_short_subtitle() -> str:
+    """
+    A shorter version of subtitle.
 
-🌐 :magenta:`Enter`, 📋 :magenta:`Ctrl A`, 🔗 :magenta:`Ctrl U`, 👀 :magenta:`Ctrl P`."
-"""
+    Example:
+
+    🌐 :magenta:`Enter`, 📋 :magenta:`Ctrl A`, 🔗 :magenta:`Ctrl U`, 👀 :magenta:`Ctrl P`."
+    """
+    return (
+        f"🌐 {ShortcutEnum.ENTER}, "
+        f"📋 {ShortcutEnum.CTRL_A}, "
+        f"🔗 {ShortcutEnum.CTRL_U}, "
+        f"👀 {ShortcutEnum.CTRL_P}."
+    )
+
+
+_LAZY_ATTRS = {
+    "terminal": get_terminal,
+    "term": get_terminal,
+    "SUBTITLE": get_subtitle,
+    "SHORT_SUBTITLE": get_short_subtitle,
+}
+
+
+def __getattr__(name: str):
+    """
+    Create the ``terminal``, ``term``, ``SUBTITLE`` and ``SHORT_SUBTITLE``
+    module attributes on first access.
+    """
+    try:
+        value = _LAZY_ATTRS[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
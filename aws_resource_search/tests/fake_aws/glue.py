@@ -17,6 +17,9 @@ class GlueMixin:
 
     @classmethod
     def create_glue_database_table(cls: T.Type["FakeAws"]):
+        # the moto backend is reset for each test class
+        cls.glue_databases = list()
+        cls.glue_tables = list()
         for ith in range(6):
             env = rand_env()
             db_name = f"{env}-{guid}-{ith}-glue-database"
@@ -13,6 +13,8 @@ class S3Mixin:
 
     @classmethod
     def create_s3_bucket(cls: T.Type["FakeAws"]):
+        # the moto backend is reset for each test class
+        cls.s3_buckets = list()
         for ith in range(1, 1 + 10):
             env = rand_env()
             bucket = f"{env}-{guid}-{ith}-s3-bucket"
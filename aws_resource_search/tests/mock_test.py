@@ -3,6 +3,11 @@
 """
 Simplify using moto for unit testing.
 
+.. versionchanged:: 0.1.3
+
+    The persisted identity cache and profile account map are redirected to
+    a temp dir during the test.
+
 .. versionchanged:: 0.1.2
 
     Fix a bug that the ``_mock_list`` class attribute got messed up when having
@@ -11,9 +16,13 @@ Simplify using moto for unit testing.
 """
 
 import typing as T
+import shutil
+import tempfile
+from pathlib import Path
+
 from boto_session_manager import BotoSesManager
 
-__version__ = "0.1.2"
+__version__ = "0.1.3"
 
 
 class BaseMockTest:
@@ -55,6 +64,43 @@ class BaseMockTest:
     # Don't overwrite the following
     bsm: T.Optional[BotoSesManager] = None
     _mocked: T.Dict[T.Any, list] = dict()
+    _dir_local_cache: T.Optional[Path] = None
+    _original_local_cache_paths: T.Optional[T.Tuple[Path, Path]] = None
+
+    @classmethod
+    def setup_local_cache(cls):
+        """
+        Point the persisted identity cache and profile account map to a temp
+        dir, so the fake account ids never leak into the real
+        ``${HOME}/.aws_resource_search`` dir.
+        """
+        from ..identity import identity_cache
+        from ..account_map import profile_account_map
+
+        cls._dir_local_cache = Path(tempfile.mkdtemp())
+        cls._original_local_cache_paths = (
+            identity_cache.path,
+            profile_account_map.path,
+        )
+        identity_cache.path = cls._dir_local_cache.joinpath("identity.json")
+        profile_account_map.path = cls._dir_local_cache.joinpath(
+            "profile_account.json"
+        )
+        identity_cache.clear()
+        profile_account_map.clear()
+
+    @classmethod
+    def teardown_local_cache(cls):
+        from ..identity import identity_cache
+        from ..account_map import profile_account_map
+
+        identity_cache.clear()
+        profile_account_map.clear()
+        identity_cache.path, profile_account_map.path = cls._original_local_cache_paths
+        # reload from the real file next time
+        identity_cache._data = None
+        profile_account_map._data = None
+        shutil.rmtree(cls._dir_local_cache, ignore_errors=True)
 
     @classmethod
     def setup_moto(cls):
@@ -86,6 +132,7 @@ class BaseMockTest:
     @classmethod
     def setup_class(cls):
         cls.setup_class_pre_hook()
+        cls.setup_local_cache()
         cls.setup_moto()
         cls.setup_class_post_hook()
 
@@ -101,4 +148,5 @@ class BaseMockTest:
     def teardown_class(cls):
         cls.teardown_class_pre_hook()
         cls.teardown_moto()
+        cls.teardown_local_cache()
         cls.teardown_class_post_hook()
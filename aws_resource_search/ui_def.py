@@ -7,10 +7,13 @@ AWS Resource UI class declaration modules.
 import typing as T
 
 import zelfred.api as zf
+from zelfred.constants import SHOW_ITEMS_LIMIT
 
 from . import res_lib as rl
 
 from .terminal import terminal
+from .regions import parse_resource_type
+from .accounts import parse_account_query, escape_account_query
 from .handlers.api import (
     open_config_handler,
     search_aws_profile_handler,
@@ -23,6 +26,9 @@ if T.TYPE_CHECKING:  # pragma: no cover
     from .ars_def import ARS
 
 
+DEFAULT_PROMPT = "(Query)"
+
+
 def handler(
     query: str,
     ui: "UI",
@@ -56,9 +62,18 @@ def handler(
     """
     zf.debugger.log(f"handler Query: {query!r}")
 
+    # the sub handler sets it again if the new result has more pages
+    ui.set_next_page(None)
+
+    # reset the prompt, the sub handler may change it to show some status
+    if skip_ui is False:
+        ui.render.prompt = DEFAULT_PROMPT
+
     # srv id is the service_id-resource_type compound identifier
     # req query is the query string for the resource search
-    q = zf.QueryParser(delimiter=":").parse(query)
+    # the ":" in the role ARN of "#accounts" is not a delimiter
+    escaped_query = escape_account_query(query)
+    q = zf.QueryParser(delimiter=":").parse(escaped_query)
 
     # --- handle special commands ---
     # example: s3-bucket: my bucket!?
@@ -119,15 +134,19 @@ def handler(
         # - "ec2 inst"
         # - "s3-bucket"
         else:
-            resource_query = query.split(":")[1].strip()
+            resource_query = escaped_query.split(":")[1].strip()
+            resource_type, region_query = parse_resource_type(service_query)
+            resource_type, account_query = parse_account_query(resource_type)
 
-            # example: "s3-bucket"
-            if ui.ars.searcher_finder.is_valid_resource_type(service_query):
+            # example: "s3-bucket", "ec2-instance@*", "iam-role#*"
+            if ui.ars.searcher_finder.is_valid_resource_type(resource_type):
                 return search_resource_handler(
                     ui=ui,
-                    resource_type=service_query,
+                    resource_type=resource_type,
                     query=resource_query,
                     skip_ui=skip_ui,
+                    region_query=region_query,
+                    account_query=account_query,
                 )
 
             # example: "ec2 inst"
@@ -144,13 +163,17 @@ def handler(
         # - s3-bucket: resource query", "s3-bucket" is a valid srv_id
         # use "resource query" to search
         service_query = q.trimmed_parts[0]
-        resource_query = query.split(":")[1].strip()
-        if ui.ars.searcher_finder.is_valid_resource_type(service_query):
+        resource_query = escaped_query.split(":")[1].strip()
+        resource_type, region_query = parse_resource_type(service_query)
+        resource_type, account_query = parse_account_query(resource_type)
+        if ui.ars.searcher_finder.is_valid_resource_type(resource_type):
             return search_resource_handler(
                 ui=ui,
-                resource_type=service_query,
+                resource_type=resource_type,
                 query=resource_query,
                 skip_ui=skip_ui,
+                region_query=region_query,
+                account_query=account_query,
             )
 
         # example: # ec2 inst: something", "ec2 inst" is not a valid srv_id
@@ -173,6 +196,7 @@ class UI(zf.UI):
         **kwargs,
     ):
         self.ars: "ARS" = ars
+        self.next_page: T.Optional[T.Callable[[], T.List[zf.Item]]] = None
         super().__init__(handler=handler, terminal=terminal, **kwargs)
 
     @classmethod
@@ -189,6 +213,61 @@ class UI(zf.UI):
             capture_error=False,
         )
 
+    def set_next_page(
+        self,
+        next_page: T.Optional[T.Callable[[], T.List[zf.Item]]],
+    ):
+        """
+        The handler only returns the first page of the items, and it calls
+        this method to tell the UI how to get the next page. The next page is
+        loaded when the user scrolls past the end of the dropdown menu.
+
+        :param next_page: a function that returns the items of the next page,
+            it can call this method again if there are more pages. None means
+            there is no next page.
+        """
+        self.next_page = next_page
+
+    def load_next_page(self) -> bool:
+        """
+        Append the items of the next page to the dropdown menu, and keep the
+        selected item.
+
+        :return: True if any item is appended.
+        """
+        if self.next_page is None:
+            return False
+        next_page, self.next_page = self.next_page, None
+        items = next_page()
+        if len(items) == 0:
+            return False
+        dropdown = self.dropdown
+        dropdown.items = list(dropdown.items) + list(items)
+        dropdown.n_items = len(dropdown.items)
+        dropdown.show_items_limit = min(SHOW_ITEMS_LIMIT, dropdown.n_items)
+        return True
+
+    def _load_next_page_if_needed(self, n: int):
+        """
+        Load the next page if moving the selector down ``n`` items goes past
+        the end of the dropdown menu.
+        """
+        dropdown = self.dropdown
+        if dropdown.selected_item_index + n > dropdown.n_items - 1:
+            self.load_next_page()
+
+    def process_down(self):  # pragma: no cover
+        self._load_next_page_if_needed(1)
+        super().process_down()
+
+    def process_ctrl_d(self):  # pragma: no cover
+        self._load_next_page_if_needed(1)
+        super().process_ctrl_d()
+
+    def process_ctrl_f(self):  # pragma: no cover
+        self._load_next_page_if_needed(self.dropdown.scroll_speed)
+        super().process_ctrl_f()
+
     def process_ctrl_b(self):  # pragma: no cover
         """
         If you are searching an AWS resource, it will remove the query but keep
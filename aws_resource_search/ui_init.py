@@ -4,6 +4,7 @@ import zelfred.api as zf
 
 from .ars_init import ars
 from .ui_def import UI
+from .client_registry import preload_recent_clients
 
 
 ui = UI.new(ars)
@@ -15,4 +16,5 @@ def run_ui():
     """
     zf.debugger.reset()
     zf.debugger.enable()
+    preload_recent_clients(ars)
     ui.run()
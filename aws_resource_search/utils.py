@@ -1,9 +1,68 @@
 # -*- coding: utf-8 -*-
 
+import typing as T
+import sys
+import json
 import hashlib
+import importlib
 import subprocess
+from pathlib import Path
+
 from .vendor.os_platform import IS_WINDOWS
 
 
 def get_md5_hash(s: str) -> str:
     return hashlib.md5(s.encode()).hexdigest()
+
+
+def load_json(path: Path, default: T.Callable[[], T.Any]) -> T.Any:
+    """
+    Load a json file, return ``default()`` if the file doesn't exist or is
+    not a valid json.
+    """
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        return default()
+
+
+def dump_json(path: Path, data: T.Any, **kwargs):
+    """
+    Write a json file atomically, it writes to a temp file then replaces the
+    file, so the other processes never read a half written file.
+
+    :param kwargs: the keyword arguments of ``json.dumps``.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path_tmp = path.with_name(path.name + ".tmp")
+    path_tmp.write_text(json.dumps(data, **kwargs))
+    path_tmp.replace(path)
+
+
+def lazy_getattr(
+    module_name: str,
+    package: str,
+    lazy_attrs: T.Dict[str, str],
+) -> T.Callable[[str], T.Any]:
+    """
+    Create a module level ``__getattr__`` function (PEP 562), so an import
+    namespace module can expose the attributes of other modules but only
+    import them on first access.
+
+    :param module_name: the ``__name__`` of the namespace module.
+    :param package: the ``__package__`` of the namespace module.
+    :param lazy_attrs: the ``{attribute name: relative module name}`` mapping.
+    """
+    namespace = sys.modules[module_name]
+
+    def __getattr__(name: str) -> T.Any:
+        try:
+            relative_module_name = lazy_attrs[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        module = importlib.import_module(relative_module_name, package)
+        value = getattr(module, name)
+        setattr(namespace, name, value)
+        return value
+
+    return __getattr__
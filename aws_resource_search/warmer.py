@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pre-build the search index of many AWS resource types ahead of time, so that
+the first search in the UI doesn't need to wait for the data to be downloaded
+and indexed.
+
+Usage::
+
+    >>> from aws_resource_search.warmer import Warmer
+    >>> warmer = Warmer.new(profiles=["dev", "prod"], regions=["us-east-1"])
+    >>> for result in warmer.warm():
+    ...     print(result)
+"""
+
+import typing as T
+import time
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from boto_session_manager import BotoSesManager
+from boto_session_manager.manager import NOTHING
+
+from .base_model import BaseModel
+from .searcher_finder import searcher_finder
+from .ars_def import ARS, validate_bsm
+
+if T.TYPE_CHECKING:  # pragma: no cover
+    from .base_searcher import T_SEARCHER, SyncResult
+
+
+def get_warmable_resource_types(
+    ars: "ARS",
+    resource_types: T.Optional[T.Iterable[str]] = None,
+) -> T.List[str]:
+    """
+    Get the list of resource types that can be pre-built. The resource types
+    that requires a partitioner (parent resource) are excluded, because we don't
+    know the boto3 kwargs ahead of time.
+
+    :param ars: the :class:`~aws_resource_search.ars_def.ARS` object.
+    :param resource_types: only warm up these resource types, if not specified,
+        warm up all of them.
+    """
+    if resource_types is None:
+        resource_types = ars.all_resource_types()
+    warmable_resource_types = list()
+    for resource_type in resource_types:
+        if ars.is_valid_resource_type(resource_type) is False:
+            raise ValueError(f"Invalid resource type: {resource_type}")
+        if ars.has_partitioner(resource_type) is False:
+            warmable_resource_types.append(resource_type)
+    return warmable_resource_types
+
+
+@dataclasses.dataclass
+class WarmTask(BaseModel):
+    """
+    Build the index of one resource type in one boto session.
+
+    :param bsm: the boto session of the AWS account and region.
+    :param searcher: the searcher of the resource type.
+    """
+
+    bsm: BotoSesManager = dataclasses.field()
+    searcher: "T_SEARCHER" = dataclasses.field()
+
+    @property
+    def key(self) -> T.Tuple[str, str, str]:
+        """
+        The unique key of this task.
+        """
+        return (
+            str(self.bsm.profile_name),
+            str(self.bsm.aws_region),
+            self.searcher.resource_type,
+        )
+
+    def run(self, refresh_data: bool = False) -> "WarmResult":
+        """
+        Build the index, capture any exception into the result.
+        """
+        st = time.time()
+        try:
+            sync_result = self.searcher.sync_index(
+                refresh_data=refresh_data,
+                multi_thread=False,
+                bsm=self.bsm,
+            )
+            error = None
+        except Exception as e:
+            sync_result = None
+            error = repr(e)
+        return WarmResult(
+            task=self,
+            built=sync_result is not None,
+            elapsed=time.time() - st,
+            finished_at=time.time(),
+            error=error,
+            sync_result=sync_result,
+        )
+
+
+@dataclasses.dataclass
+class WarmResult(BaseModel):
+    """
+    The result of a :class:`WarmTask`.
+
+    :param task: the task object.
+    :param built: whether the index is built, False means the index is still
+        fresh and we don't need to build it.
+    :param elapsed: how many seconds it takes.
+    :param finished_at: the epoch timestamp when the task is finished.
+    :param error: the error message if failed.
+    :param sync_result: the inserts, updates and deletes applied to the index.
+    """
+
+    task: WarmTask = dataclasses.field()
+    built: bool = dataclasses.field()
+    elapsed: float = dataclasses.field()
+    finished_at: float = dataclasses.field()
+    error: T.Optional[str] = dataclasses.field(default=None)
+    sync_result: T.Optional["SyncResult"] = dataclasses.field(default=None)
+
+    def __str__(self) -> str:
+        profile, region, resource_type = self.task.key
+        if self.error:
+            status = f"🔴 failed ({self.error})"
+        elif self.built:
+            status = f"🟢 built, {self.sync_result}"
+        else:
+            status = "⚪ still fresh"
+        return (
+            f"{status}: {resource_type!r} "
+            f"(profile = {profile}, region = {region}) "
+            f"in {self.elapsed:.2f} sec"
+        )
+
+
+@dataclasses.dataclass
+class Warmer(BaseModel):
+    """
+    Build the index of many resource types for many boto sessions concurrently
+    with a bounded worker pool.
+
+    :param tasks: the list of :class:`WarmTask`.
+    :param max_workers: the max number of concurrent workers.
+    """
+
+    tasks: T.List[WarmTask] = dataclasses.field()
+    max_workers: int = dataclasses.field(default=8)
+
+    @classmethod
+    def new(
+        cls,
+        resource_types: T.Optional[T.Iterable[str]] = None,
+        profiles: T.Optional[T.Iterable[T.Optional[str]]] = None,
+        regions: T.Optional[T.Iterable[T.Optional[str]]] = None,
+        max_workers: int = 8,
+        bsm_list: T.Optional[T.List[BotoSesManager]] = None,
+    ):
+        """
+        Create the warmer from the cartesian product of profiles, regions and
+        resource types.
+
+        :param resource_types: only warm up these resource types, if not specified,
+            warm up all resource types that don't require a partitioner.
+        :param profiles: list of AWS profiles, if not specified, use the default profile.
+        :param regions: list of AWS regions, if not specified, use the default
+            region of the profile.
+        :param max_workers: the max number of concurrent workers.
+        :param bsm_list: explicitly give the list of boto sessions, if specified,
+            ``profiles`` and ``regions`` will be ignored.
+        """
+        if bsm_list is None:
+            if not profiles:
+                profiles = [NOTHING]
+            if not regions:
+                regions = [NOTHING]
+            bsm_list = [
+                BotoSesManager(profile_name=profile, region_name=region)
+                for profile in profiles
+                for region in regions
+            ]
+        ars = ARS.from_bsm(bsm=bsm_list[0])
+        resource_types = get_warmable_resource_types(ars, resource_types)
+        searchers = [searcher_finder.import_searcher(rt) for rt in resource_types]
+        for bsm in bsm_list:
+            # resolve the AWS account id and create the boto3 client in the
+            # main thread, because the boto3 session is not thread safe.
+            validate_bsm(bsm)
+            for service in sorted({searcher.service for searcher in searchers}):
+                bsm.get_client(service)
+        # the region-global resource type is only warmed once per account
+        tasks = list()
+        index_names = set()
+        for bsm in bsm_list:
+            for searcher in searchers:
+                index_name = searcher._get_index_name(
+                    bsm=bsm,
+                    final_boto_kwargs=searcher._get_final_boto_kwargs(),
+                )
+                if index_name not in index_names:
+                    index_names.add(index_name)
+                    tasks.append(WarmTask(bsm=bsm, searcher=searcher))
+        return cls(tasks=tasks, max_workers=max_workers)
+
+    def _run_tasks(
+        self,
+        tasks: T.List[WarmTask],
+        refresh_data: bool = False,
+    ) -> T.Iterable[WarmResult]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(task.run, refresh_data=refresh_data) for task in tasks
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def warm(self, refresh_data: bool = False) -> T.Iterable[WarmResult]:
+        """
+        Build all expired indexes concurrently, yield the result as soon as
+        each task is finished.
+
+        :param refresh_data: force to rebuild the index even if it is still fresh.
+        """
+        yield from self._run_tasks(self.tasks, refresh_data=refresh_data)
+
+    def warm_forever(
+        self,
+        refresh_data: bool = False,
+        margin: int = 60,
+        max_rounds: T.Optional[int] = None,
+    ) -> T.Iterable[WarmResult]:
+        """
+        Keep the indexes warm. Each resource type is re-warmed ``margin``
+        seconds before its ``cache_expire`` runs out.
+
+        :param refresh_data: force to rebuild the index in the first round.
+        :param margin: re-warm the index this many seconds before it expires,
+            it will never be more than 10% of the ``cache_expire``.
+        :param max_rounds: stop after this many rounds, run forever if None.
+        """
+        due_at: T.Dict[T.Tuple[str, str, str], float] = dict()
+        due_tasks = self.tasks
+        ith_round = 0
+        while 1:
+            ith_round += 1
+            for result in self._run_tasks(due_tasks, refresh_data=refresh_data):
+                cache_expire = result.task.searcher.cache_expire
+                final_margin = min(margin, cache_expire // 10)
+                due_at[result.task.key] = (
+                    result.finished_at + cache_expire - final_margin
+                )
+                yield result
+            if max_rounds is not None and ith_round >= max_rounds:
+                break
+            # the index is not expired yet when we re-warm it
+            refresh_data = True
+            next_due_at = min(due_at.values())
+            time.sleep(max(0, next_due_at - time.time()))
+            now = time.time()
+            due_tasks = [task for task in self.tasks if due_at[task.key] <= now]
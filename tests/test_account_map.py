@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import tempfile
+from pathlib import Path
+
+from unittest.mock import patch
+
+import pytest
+import moto
+import botocore.exceptions
+from boto_session_manager import BotoSesManager
+
+from aws_resource_search.tests.mock_test import BaseMockTest
+import aws_resource_search.account_map as account_map_module
+from aws_resource_search.account_map import ProfileAccountMap
+from aws_resource_search.identity import IdentityCache
+from aws_resource_search.res.s3 import s3_bucket_searcher
+
+path_json = Path(tempfile.gettempdir()).joinpath("ars_test_profile_account.json")
+path_identity_json = Path(tempfile.gettempdir()).joinpath("ars_test_identity.json")
+
+
+class TestProfileAccountMap(BaseMockTest):
+    mock_list = [
+        moto.mock_sts,
+    ]
+
+    def test(self, monkeypatch):
+        # don't hit the identity cache of the other tests
+        identity_cache = IdentityCache(path=path_identity_json)
+        identity_cache.clear()
+        monkeypatch.setattr(account_map_module, "identity_cache", identity_cache)
+
+        account_map = ProfileAccountMap(path=path_json)
+        account_map.clear()
+        assert account_map.get("my_org_dev") is None
+
+        bsm = BotoSesManager(profile_name="my_org_dev", region_name="us-east-1")
+        assert account_map.get_account_id(bsm) == "123456789012"
+        assert account_map.get_account_id(self.bsm) == "123456789012"
+
+        # the map is persisted
+        account_map = ProfileAccountMap(path=path_json)
+        assert account_map.get("my_org_dev") == "123456789012"
+        account_map.set("my_org_dev", "111122223333")
+        account_map.update(bsm)
+        assert ProfileAccountMap(path=path_json).get("my_org_dev") == "123456789012"
+        account_map.clear()
+
+        # a stale map entry never wins over the boto session
+        account_map.set("my_org_dev", "999999999999")
+        identity_cache.clear()
+        bsm = BotoSesManager(profile_name="my_org_dev", region_name="us-east-1")
+        assert account_map.get_account_id(bsm) == "123456789012"
+        assert account_map.get("my_org_dev") == "123456789012"
+        assert s3_bucket_searcher._get_index_name(bsm, {}).startswith("123456789012")
+
+        # the map is the fallback when the account can't be verified
+        account_map.set("my_org_dev", "111122223333")
+        identity_cache.clear()
+        bsm = BotoSesManager(profile_name="my_org_dev", region_name="us-east-1")
+        error = botocore.exceptions.EndpointConnectionError(endpoint_url="")
+        with patch.object(IdentityCache, "fetch", side_effect=error):
+            assert account_map.get_account_id(bsm) == "111122223333"
+        with patch.object(IdentityCache, "fetch", side_effect=ValueError()):
+            with pytest.raises(ValueError):
+                account_map.get_account_id(bsm)
+        account_map.clear()
+        with patch.object(IdentityCache, "fetch", side_effect=error):
+            with pytest.raises(botocore.exceptions.EndpointConnectionError):
+                account_map.get_account_id(bsm)
+        identity_cache.clear()
+
+        # the profiles of the same account share the same index
+        assert s3_bucket_searcher._get_index_name(
+            bsm, {}
+        ) == s3_bucket_searcher._get_index_name(self.bsm, {})
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.account_map", preview=False)
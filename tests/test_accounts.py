@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from unittest.mock import patch
+
+import moto
+
+from aws_resource_search.tests.mock_test import BaseMockTest
+import aws_resource_search.accounts as accounts_module
+from aws_resource_search.accounts import (
+    Account,
+    get_account,
+    escape_account_query,
+    parse_account_query,
+    resolve_accounts,
+)
+from aws_resource_search.ars_def import ARS
+from aws_resource_search.res.sqs import sqs_queue_searcher
+
+ROLE_ARN = "arn:aws:iam::222222222222:role/ars-search"
+
+
+def test_parse_account_query():
+    assert parse_account_query("s3-bucket") == ("s3-bucket", None)
+    assert parse_account_query("s3-bucket#*") == ("s3-bucket", "*")
+    assert parse_account_query("s3-bucket# dev,prod") == ("s3-bucket", "dev,prod")
+
+
+def test_escape_account_query():
+    query = escape_account_query(f"iam-role#dev,{ROLE_ARN}: admin")
+    resource_type_part, resource_query = query.split(":")
+    assert parse_account_query(resource_type_part) == ("iam-role", f"dev,{ROLE_ARN}")
+    assert resource_query == " admin"
+
+    query = escape_account_query(f"iam-role#{ROLE_ARN}@us-east-1")
+    assert ":" not in query
+    assert parse_account_query(query) == ("iam-role", f"{ROLE_ARN}@us-east-1")
+
+    # the ARN in the resource query is not escaped
+    query = f"iam-role: {ROLE_ARN}"
+    assert escape_account_query(query) == query
+
+
+class TestAccounts(BaseMockTest):
+    mock_list = [
+        moto.mock_sqs,
+        moto.mock_sts,
+    ]
+
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.bsm.sqs_client.create_queue(QueueName="team-queue-home")
+        account = Account.from_role(bsm=cls.bsm, role_arn=ROLE_ARN)
+        account.bsm.sqs_client.create_queue(QueueName="team-queue-other")
+
+    def _test_account(self):
+        account = Account.from_role(bsm=self.bsm, role_arn=ROLE_ARN)
+        assert account.bsm.aws_account_id == "222222222222"
+        assert account.label == "222222222222"
+        # the assumed role session is reused
+        assert Account.from_role(bsm=self.bsm, role_arn=ROLE_ARN) is account
+        assert get_account(ROLE_ARN) is account
+
+        assert Account.from_profile("my_org_dev").label == "my_org_dev"
+        assert Account.from_profile("my_org_dev") is Account.from_profile("my_org_dev")
+
+    def _test_resolve_accounts(self):
+        accounts = resolve_accounts(self.bsm, f"my_org_dev, {ROLE_ARN}")
+        assert [account.name for account in accounts] == ["my_org_dev", ROLE_ARN]
+        accounts = resolve_accounts(self.bsm, "*", default_accounts=[ROLE_ARN])
+        assert [account.name for account in accounts] == [ROLE_ARN]
+
+    def _test_search_accounts(self):
+        home = Account(name="home", bsm=self.bsm)
+        other = Account.from_role(bsm=self.bsm, role_arn=ROLE_ARN)
+        docs = sqs_queue_searcher.search(
+            query="team queue",
+            refresh_data=True,
+            accounts=[home, other],
+        )
+        assert [(doc.name, doc.account, doc.region) for doc in docs] == [
+            ("team-queue-home", "home", "us-east-1"),
+            ("team-queue-other", ROLE_ARN, "us-east-1"),
+        ]
+
+        res = sqs_queue_searcher.search(
+            query="team queue",
+            simple_response=False,
+            accounts=[other],
+            regions=["us-east-1", "us-west-2"],
+        )
+        assert res["size"] == 1
+        assert res["hits"][0]["_account"] == ROLE_ARN
+        assert res["hits"][0]["_region"] == "us-east-1"
+
+        ars = ARS.from_bsm(bsm=self.bsm)
+        assert ars.get_account_ars(None) is ars
+        ars_other = ars.get_account_ars(ROLE_ARN, region="us-west-2")
+        assert ars_other.aws_console.aws_account_id == "222222222222"
+        assert ars_other.aws_console.aws_region == "us-west-2"
+
+        # the account is not cached yet, or the assumed role is expired
+        accounts_module._account_cache.pop(ROLE_ARN)
+        ars_other = ars.get_account_ars(ROLE_ARN)
+        assert ars_other.aws_console.aws_account_id == "222222222222"
+        account = get_account(ROLE_ARN)
+        with patch.object(type(account.bsm), "is_expired", return_value=True):
+            ars_other = ars.get_account_ars(ROLE_ARN)
+        assert get_account(ROLE_ARN) is not account
+        assert ars_other.bsm is get_account(ROLE_ARN).bsm
+
+    def test(self):
+        self._test_account()
+        self._test_resolve_accounts()
+        self._test_search_accounts()
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.accounts", preview=False)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import time
+import asyncio
+import threading
+
+import pytest
+
+from aws_resource_search.aio import check_cancelled, run_in_thread
+from aws_resource_search.exc import OperationCancelledError
+from aws_resource_search.downloader import (
+    ResultPath,
+    list_resources,
+    alist_resources,
+)
+from aws_resource_search.detail_cache import detail_cache, aget_details
+from aws_resource_search.tests.fake_aws.utils import guid
+from aws_resource_search.tests.fake_aws.main import FakeAws
+
+
+def test_check_cancelled():
+    # no effect in the synchronous API
+    check_cancelled()
+
+
+def test_run_in_thread_cancel():
+    started = threading.Event()
+    errors = list()
+
+    def func():
+        started.set()
+        try:
+            while True:
+                check_cancelled()
+                time.sleep(0.01)
+        except OperationCancelledError as e:
+            errors.append(e)
+
+    async def main():
+        task = asyncio.ensure_future(run_in_thread(func))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    for _ in range(100):
+        if errors:
+            break
+        time.sleep(0.01)
+    assert len(errors) == 1
+
+
+class Test(FakeAws):
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.setup_ars()
+        cls.create_s3_bucket()
+        cls.create_iam()
+
+    def test_asearch(self):
+        async def main():
+            return await asyncio.gather(
+                self.ars.s3_bucket.asearch(guid, limit=3),
+                self.ars.iam_role.asearch("*", limit=3),
+            )
+
+        s3_docs, iam_docs = asyncio.run(main())
+        assert len(s3_docs) == 3
+        assert guid in s3_docs[0].name
+        assert len(iam_docs) > 0
+
+    def test_alist_resources(self):
+        kwargs = dict(
+            bsm=self.bsm,
+            service="iam",
+            method="list_groups",
+            is_paginator=True,
+            boto_kwargs=dict(PaginationConfig=dict(PageSize=2)),
+            result_path=ResultPath(path="Groups"),
+        )
+
+        async def main():
+            return [data async for data in alist_resources(**kwargs)]
+
+        names = [dct["GroupName"] for dct in asyncio.run(main())]
+        assert len(names) > 2
+        assert names == [dct["GroupName"] for dct in list_resources(**kwargs)]
+
+    def test_aget_details(self):
+        detail_cache.clear()
+        doc = self.ars.s3_bucket.search(guid, limit=1)[0]
+        items = asyncio.run(aget_details(self.ars, "s3-bucket", doc))
+        assert len(items)
+        items = asyncio.run(doc.aget_details(self.ars))
+        assert len(items)
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.aio", preview=False)
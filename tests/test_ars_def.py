@@ -1,5 +1,13 @@
 # -*- coding: utf-8 -*-
 
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+
+import botocore.exceptions
+
+from aws_resource_search.searcher_finder import searcher_finder
+from aws_resource_search.base_searcher import BaseSearcher
+from aws_resource_search.tests.fake_aws.utils import guid
 from aws_resource_search.tests.fake_aws.api import FakeAws
 
 
@@ -7,6 +15,8 @@ class TestARSDef(FakeAws):
     @classmethod
     def setup_class_post_hook(cls):
         cls.setup_ars()
+        cls.create_s3_bucket()
+        cls.create_glue_database_table()
 
     def _test_all_resource_types(self):
         _ = self.ars.all_resource_types()
@@ -18,10 +28,136 @@ class TestARSDef(FakeAws):
     def _test_set_profile(self):
         self.ars.set_profile()
 
+        # the cached searchers are bound to the new boto session
+        ars = self.ars.with_profile("my_org_dev")
+        assert ars.s3_bucket.bsm is ars.bsm
+        ars.set_profile("my_org_prod")
+        assert ars.s3_bucket.bsm is ars.bsm
+        assert ars.s3_bucket.bsm.profile_name == "my_org_prod"
+
+    def _test_with_profile(self):
+        ars = self.ars.with_profile()
+        assert ars is not self.ars
+        assert ars.dir_index == self.ars.dir_index
+
+    def _test_get_searcher(self):
+        sr = self.ars.get_searcher("s3-bucket")
+        assert sr is not searcher_finder.import_searcher("s3-bucket")
+        assert sr.bsm is self.ars.bsm
+
+        ars = self.ars.get_regional_ars("us-west-2")
+        assert ars.get_searcher("s3-bucket").bsm is ars.bsm
+        # getting the searcher of another ARS doesn't change this one
+        assert sr.bsm is self.ars.bsm
+
+    def _test_concurrent_search(self):
+        """
+        Search the same resource type in two regions from many threads at
+        the same time, each thread only sees the queues of its own region.
+        """
+        ars_mapper = {
+            region: self.ars.get_regional_ars(region)
+            for region in ["us-east-1", "us-west-2"]
+        }
+        for region, ars in ars_mapper.items():
+            for ith in range(1, 1 + 3):
+                ars.bsm.sqs_client.create_queue(QueueName=f"{region}-queue-{ith}")
+
+        def search(region: str):
+            ars = ars_mapper[region]
+            docs = ars.sqs_queue.search("*", limit=100)
+            return region, [doc.name for doc in docs]
+
+        regions = list(ars_mapper) * 20
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(search, regions))
+        for region, names in results:
+            assert len(names) == 3
+            assert all(name.startswith(region) for name in names)
+
+    def _test_search_many(self):
+        db_name = self.glue_databases[0]
+        table_names = [
+            name.split(".", 1)[1]
+            for name in self.glue_tables
+            if name.startswith(db_name + ".")
+        ][:3]
+        queries = [("s3-bucket", bucket) for bucket in self.s3_buckets]
+        queries.extend(
+            ("glue-database-table", table_name, {"DatabaseName": db_name})
+            for table_name in table_names
+        )
+        queries.append(("s3-bucket", "thereisnosuchbucket"))
+        results = self.ars.search_many(queries, limit=20)
+        assert len(results) == len(queries)
+        expected_names = self.s3_buckets + [
+            f"{db_name}.{table_name}" for table_name in table_names
+        ]
+        for name, docs in zip(expected_names, results):
+            assert name in [doc.name for doc in docs]
+        assert results[-1] == []
+        assert self.ars.search_many([]) == []
+
+        # the failed index is only built once, the error is returned in the
+        # slots of its queries, the other queries are not affected
+        n_builds = list()
+        original_build_index = BaseSearcher._build_index
+
+        def build_index(searcher, *args, **kwargs):
+            if searcher.resource_type == "s3-bucket":
+                n_builds.append(1)
+                raise error
+            return original_build_index(searcher, *args, **kwargs)
+
+        error = ValueError("failed to build")
+        queries = [("s3-bucket", bucket) for bucket in self.s3_buckets[:3]]
+        queries.append(("glue-database-table", table_names[0], {"DatabaseName": db_name}))
+        with patch.object(BaseSearcher, "_build_index", build_index):
+            results = self.ars.search_many(queries, refresh_data=True)
+        assert len(n_builds) == 1
+        assert results[:3] == [error] * 3
+        assert f"{db_name}.{table_names[0]}" in [doc.name for doc in results[3]]
+
+        # the existing index is searched when we are offline
+        n_builds.clear()
+        error = botocore.exceptions.EndpointConnectionError(endpoint_url="")
+        with patch.object(BaseSearcher, "_build_index", build_index):
+            results = self.ars.search_many(queries[:3], refresh_data=True)
+        assert len(n_builds) == 1
+        for bucket, docs in zip(self.s3_buckets, results):
+            assert bucket in [doc.name for doc in docs]
+
+    def _test_search_all_partitions(self):
+        partitions = self.ars.get_partitions("glue-database-table")
+        assert sorted(name for name, _ in partitions) == sorted(self.glue_databases)
+        for name, boto_kwargs in partitions:
+            assert boto_kwargs == {"DatabaseName": name}
+
+        docs = self.ars.search_all_partitions(
+            "glue-database-table",
+            query=f"{guid}-5-glue-table",
+            limit=100,
+        )
+        pairs = {(doc.partition, doc.name) for doc in docs}
+        for db_name in self.glue_databases:
+            table_name = f"{db_name.split('-')[0]}-{guid}-5-glue-table"
+            assert (db_name, f"{db_name}.{table_name}") in pairs
+
+        assert self.ars.search_all_partitions(
+            "glue-database-table",
+            query="*",
+            partitioner_query="thereisnosuchdatabase",
+        ) == []
+
     def test(self):
         self._test_all_resource_types()
         self._test_is_valid_resource_type()
         self._test_set_profile()
+        self._test_with_profile()
+        self._test_get_searcher()
+        self._test_concurrent_search()
+        self._test_search_many()
+        self._test_search_all_partitions()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 
+import dataclasses
+from types import SimpleNamespace
+
 import pytest
 import moto
 
 from aws_resource_search.tests.mock_test import BaseMockTest
-from aws_resource_search.base_searcher import preprocess_query
+from aws_resource_search.base_searcher import (
+    preprocess_query,
+    merge_hits,
+    wait_for_background_refresh,
+)
+from aws_resource_search.index_registry import index_registry
 from aws_resource_search.res.s3 import s3_bucket_searcher
 from aws_resource_search.res.iam import iam_group_searcher
 
@@ -24,6 +32,37 @@ def test_preprocess_query():
     assert preprocess_query("s?") == "s?~1"
 
 
+def test_merge_hits():
+    ds = SimpleNamespace(
+        _sortable_fields=["size"],
+        _fields_mapper={"size": SimpleNamespace(_is_ascending=lambda: False)},
+    )
+
+    def make_result(sizes):
+        return {
+            "hits": [
+                {"_score": 1, "_source": {"id": str(size), "size": size}}
+                for size in sizes
+            ]
+        }
+
+    # the numbers are sorted by value, not by their string
+    hits = merge_hits(
+        ds,
+        [
+            ({"_region": "us-east-1"}, make_result([10, 2])),
+            ({"_region": "us-west-2"}, make_result([9, None])),
+        ],
+        limit=10,
+    )
+    assert [hit["_source"]["size"] for hit in hits] == [10, 9, 2, None]
+    assert hits[0]["_region"] == "us-east-1"
+
+    ds._fields_mapper["size"]._is_ascending = lambda: True
+    hits = merge_hits(ds, [({}, make_result([10, None, 9]))], limit=10)
+    assert [hit["_source"]["size"] for hit in hits] == [9, 10, None]
+
+
 class TestSearcher(BaseMockTest):
     mock_list = [
         moto.mock_s3,
@@ -56,27 +95,167 @@ class TestSearcher(BaseMockTest):
     def _test_get_bsm(self):
         with pytest.raises(TypeError):
             s3_bucket_searcher._get_bsm(bsm="bsm")
-        s3_bucket_searcher._get_bsm(self.bsm)
-        s3_bucket_searcher.bsm = self.bsm
-        s3_bucket_searcher._get_bsm(self.bsm)
+        assert s3_bucket_searcher._get_bsm(self.bsm) is self.bsm
+        # the shared searcher is not bound to any boto session
+        with pytest.raises(TypeError):
+            s3_bucket_searcher._get_bsm()
+        searcher = dataclasses.replace(s3_bucket_searcher, bsm=self.bsm)
+        assert searcher._get_bsm() is self.bsm
 
     def _test_search(self):
         self._create_test_buckets()
-        s3_bucket_searcher.bsm = self.bsm
-        res = s3_bucket_searcher.search(refresh_data=True)
+        res = s3_bucket_searcher.search(bsm=self.bsm, refresh_data=True)
         assert len(res) == 2
 
-        res = s3_bucket_searcher.search(simple_response=False)
+        res = s3_bucket_searcher.search(bsm=self.bsm, simple_response=False)
         assert len(res["hits"]) == 2
 
         self._create_test_iam_groups()
-        iam_group_searcher.bsm = self.bsm
-        res = iam_group_searcher.search(refresh_data=True)
+        res = iam_group_searcher.search(bsm=self.bsm, refresh_data=True)
         assert len(res) == 2
 
+    def _test_stale_while_revalidate(self):
+        res = s3_bucket_searcher.search(
+            bsm=self.bsm,
+            refresh_data=True,
+            simple_response=False,
+        )
+        assert res["stale"] is False
+        assert res["age"] == 0
+        n_bucket = len(res["hits"])
+
+        # expire the index, then create a new bucket
+        ds = s3_bucket_searcher._get_ds(
+            bsm=self.bsm,
+            final_boto_kwargs=s3_bucket_searcher._get_final_boto_kwargs(),
+        )
+        index_registry.mark_expired(ds)
+        self.bsm.s3_client.create_bucket(Bucket="new-data")
+
+        # return the old data immediately, refresh it in the background
+        res = s3_bucket_searcher.search(
+            bsm=self.bsm,
+            simple_response=False,
+            stale_while_revalidate=True,
+        )
+        assert res["stale"] is True
+        assert res["age"] >= 0
+        assert len(res["hits"]) == n_bucket
+
+        wait_for_background_refresh()
+        res = s3_bucket_searcher.search(
+            bsm=self.bsm,
+            simple_response=False,
+            stale_while_revalidate=True,
+        )
+        assert res["stale"] is False
+        assert len(res["hits"]) == n_bucket + 1
+
+    def _test_sync_index(self):
+        sync_result = s3_bucket_searcher.sync_index(
+            bsm=self.bsm,
+            refresh_data=True,
+            incremental=False,
+        )
+        assert sync_result.full_rebuild is True
+        n_bucket = sync_result.n_inserted
+
+        # nothing changed
+        sync_result = s3_bucket_searcher.sync_index(bsm=self.bsm, refresh_data=True)
+        assert sync_result.full_rebuild is False
+        assert sync_result.n_changed == 0
+        assert sync_result.n_unchanged == n_bucket
+
+        # one insert and one delete
+        self.bsm.s3_client.create_bucket(Bucket="incremental-data")
+        self.bsm.s3_client.delete_bucket(Bucket="company-data")
+        sync_result = s3_bucket_searcher.sync_index(bsm=self.bsm, refresh_data=True)
+        assert sync_result.n_inserted == 1
+        assert sync_result.n_updated == 0
+        assert sync_result.n_deleted == 1
+        assert sync_result.n_unchanged == n_bucket - 1
+        str(sync_result)
+
+        docs = s3_bucket_searcher.search(bsm=self.bsm, limit=100)
+        names = {doc.name for doc in docs}
+        assert len(docs) == n_bucket
+        assert "incremental-data" in names
+        assert "company-data" not in names
+
+        # not expired, nothing to do
+        assert s3_bucket_searcher.sync_index(bsm=self.bsm) is None
+        assert s3_bucket_searcher.build_index(bsm=self.bsm) is False
+
+    def _test_batched_build(self):
+        ds = s3_bucket_searcher._get_ds(
+            bsm=self.bsm,
+            final_boto_kwargs=s3_bucket_searcher._get_final_boto_kwargs(),
+        )
+        progress = list()
+
+        # the documents indexed so far are searchable after each batch
+        def progress_callback(n_indexed: int):
+            res = s3_bucket_searcher._run_query(ds=ds, query="*", limit=100)
+            progress.append((n_indexed, res["size"]))
+
+        sync_result = s3_bucket_searcher.sync_index(
+            bsm=self.bsm,
+            refresh_data=True,
+            incremental=False,
+            batch_size=1,
+            progress_callback=progress_callback,
+        )
+        n_bucket = sync_result.n_inserted
+        assert progress == [(i, i) for i in range(1, n_bucket + 1)]
+
+        progress.clear()
+        self.bsm.s3_client.create_bucket(Bucket="batched-data")
+        sync_result = s3_bucket_searcher.sync_index(
+            bsm=self.bsm,
+            refresh_data=True,
+            batch_size=1,
+            progress_callback=progress_callback,
+        )
+        assert sync_result.n_inserted == 1
+        assert progress[-1] == (n_bucket + 1, n_bucket + 1)
+
+    def _test_search_page(self):
+        docs = s3_bucket_searcher.search(bsm=self.bsm, refresh_data=True, limit=100)
+        names = [doc.name for doc in docs]
+        assert len(names) > 2
+
+        paged_names = list()
+        page = s3_bucket_searcher.search_page(bsm=self.bsm, page_size=2)
+        while True:
+            assert len(page.docs) <= 2
+            paged_names.extend(doc.name for doc in page.docs)
+            if page.has_next is False:
+                break
+            page = s3_bucket_searcher.search_page(
+                bsm=self.bsm,
+                page_size=2,
+                cursor=page.next_cursor,
+            )
+        assert paged_names == names
+
+        page = s3_bucket_searcher.search_page(
+            bsm=self.bsm,
+            page_size=2,
+            cursor=str(len(names)),
+        )
+        assert page.docs == []
+        assert page.has_next is False
+        for cursor in ["abc", "-1"]:
+            with pytest.raises(ValueError):
+                s3_bucket_searcher.search_page(bsm=self.bsm, cursor=cursor)
+
     def test(self):
         self._test_get_bsm()
         self._test_search()
+        self._test_stale_while_revalidate()
+        self._test_sync_index()
+        self._test_batched_build()
+        self._test_search_page()
 
 
 if __name__ == "__main__":
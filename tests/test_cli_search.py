@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import pytest
+
+from aws_resource_search.base_searcher import BaseSearcher
+from aws_resource_search.cli.search import parse_line, search, main
+from aws_resource_search.tests.fake_aws.utils import guid
+from aws_resource_search.tests.fake_aws.main import FakeAws
+
+
+def test_parse_line():
+    assert parse_line("s3-bucket my bucket\n") == ("s3-bucket", "my bucket")
+    assert parse_line("s3-bucket: my bucket") == ("s3-bucket", "my bucket")
+    assert parse_line("s3-bucket") == ("s3-bucket", "*")
+
+
+class TestSearch(FakeAws):
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.setup_ars()
+        cls.create_s3_bucket()
+        cls.create_glue_database_table()
+
+    def test_search(self):
+        results = search(self.ars, "s3-bucket", f"{guid}-1-", limit=3)
+        assert len(results) == 3
+        assert guid in results[0]["name"]
+        assert results[0]["arn"].startswith("arn:aws:s3:::")
+        assert results[0]["console_url"].startswith("https://")
+        assert "raw_data" not in results[0]
+
+        with pytest.raises(ValueError):
+            search(self.ars, "invalid-type", "*")
+        with pytest.raises(ValueError):
+            search(self.ars, "glue-database-table", "*")
+        with pytest.raises(ValueError):
+            search(self.ars, "glue-database-table#*", "*@*")
+
+    def test_search_partitions(self):
+        table = f"{guid}-2-glue-table"
+        results = search(self.ars, "glue-database-table", f"*@{table}", limit=100)
+        databases = {
+            data["partition"] for data in results if data["name"].endswith(table)
+        }
+        assert databases == set(self.glue_databases)
+
+        db_name = self.glue_databases[0]
+        results = search(self.ars, "glue-database-table", f"{db_name}@*", limit=100)
+        assert len(results) == 10
+        assert all(data["name"].startswith(f"{db_name}.") for data in results)
+
+    def test_main(self):
+        output = io.StringIO()
+        main(
+            resource_type="s3-bucket",
+            query=guid,
+            limit=2,
+            json_output=True,
+            ars=self.ars,
+            output_stream=output,
+        )
+        lines = output.getvalue().splitlines()
+        assert len(lines) == 2
+        assert guid in json.loads(lines[0])["name"]
+
+        output = io.StringIO()
+        main(
+            resource_type="s3-bucket",
+            query=guid,
+            limit=2,
+            ars=self.ars,
+            output_stream=output,
+        )
+        assert guid in output.getvalue().splitlines()[0]
+
+        with pytest.raises(ValueError):
+            main(ars=self.ars)
+
+    def test_main_stdin(self):
+        input_stream = io.StringIO(
+            f"s3-bucket {guid}-1-\n"
+            "\n"
+            "s3-bucket: thereisnosuchbucket\n"
+            "invalid-type something\n"
+        )
+        output = io.StringIO()
+        main(
+            stdin=True,
+            limit=1,
+            ars=self.ars,
+            input_stream=input_stream,
+            output_stream=output,
+        )
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert len(rows) == 3
+        assert rows[0]["resource_type"] == "s3-bucket"
+        assert rows[0]["query"] == f"{guid}-1-"
+        assert guid in rows[0]["name"]
+        assert rows[1]["not_found"] is True
+        assert "error" in rows[2]
+
+    def test_main_stdin_refresh(self, monkeypatch):
+        # each index is only rebuilt once per batch, s3 bucket is a
+        # region-global resource type, so "@us-east-1" is the same index
+        rebuilt = list()
+        original_build_index = BaseSearcher.build_index
+
+        def build_index(self, *args, **kwargs):
+            rebuilt.append(kwargs.get("refresh_data"))
+            return original_build_index(self, *args, **kwargs)
+
+        monkeypatch.setattr(BaseSearcher, "build_index", build_index)
+        input_stream = io.StringIO(
+            f"s3-bucket {guid}-1-\n"
+            f"s3-bucket {guid}-2-\n"
+            f"s3-bucket@us-east-1 {guid}-3-\n"
+            f"glue-database-table *@{guid}\n"
+            f"glue-database-table *@{guid}\n"
+        )
+        output = io.StringIO()
+        main(
+            stdin=True,
+            limit=1,
+            refresh=True,
+            ars=self.ars,
+            input_stream=input_stream,
+            output_stream=output,
+        )
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert all("error" not in row for row in rows)
+        # one s3 bucket index, one glue database index, and one glue table
+        # index per database
+        assert rebuilt == [True] * (2 + len(self.glue_databases))
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.cli.search", preview=False)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from boto_session_manager import BotoSesManager
+
+import aws_resource_search.client_registry as client_registry_module
+from aws_resource_search.client_registry import (
+    ClientRegistry,
+    RecentResourceTypes,
+    preload_recent_clients,
+)
+from aws_resource_search.tests.fake_aws.api import FakeAws
+
+path_json = Path(tempfile.gettempdir()).joinpath("ars_test_recent_resource_types.json")
+
+
+def test_client_registry():
+    registry = ClientRegistry()
+    bsm = BotoSesManager(region_name="us-east-1")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: registry.get_client(bsm, "sqs"), range(8)))
+    assert len({id(client) for client in clients}) == 1
+    # it is shared with the bsm.${service}_client property
+    assert bsm.sqs_client is clients[0]
+
+    registry.preload(bsm, ["sns", "s3"]).join()
+    assert registry.get_client(bsm, "sns") is bsm.sns_client
+
+    # the direct client creation waits for the preload thread
+    registry.preload(bsm, lambda: ["sqs", "dynamodb"])
+    registry.wait_preload(bsm)
+    assert "dynamodb" in bsm._client_cache
+    registry.wait_preload(BotoSesManager(region_name="us-east-1"))
+
+
+def test_recent_resource_types():
+    recent = RecentResourceTypes(path=path_json, max_size=2)
+    recent.clear()
+    assert recent.get() == []
+    recent.add("s3-bucket")
+    recent.add("s3-bucket")
+    recent.add("iam-role")
+    recent.add("s3-bucket")
+    recent.add("sqs-queue")
+    assert recent.get() == ["sqs-queue", "s3-bucket"]
+    assert RecentResourceTypes(path=path_json).get() == ["sqs-queue", "s3-bucket"]
+    recent.clear()
+
+
+class TestPreloadRecentClients(FakeAws):
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.setup_ars()
+
+    def test(self, monkeypatch):
+        recent = RecentResourceTypes(path=path_json)
+        recent.clear()
+        recent.add("dynamodb-table")
+        recent.add("invalid-resource-type")
+        monkeypatch.setattr(client_registry_module, "recent_resource_types", recent)
+        preload_recent_clients(self.ars).join()
+        assert "dynamodb" in self.ars.bsm._client_cache
+        recent.clear()
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.client_registry", preview=False)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import time
+import stat
+from urllib.request import urlopen, Request
+from urllib.error import HTTPError
+
+import pytest
+
+from aws_resource_search.daemon import Daemon
+from aws_resource_search import daemon_client
+from aws_resource_search.tests.fake_aws.utils import guid
+from aws_resource_search.tests.fake_aws.main import FakeAws
+
+
+class TestDaemon(FakeAws):
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.setup_ars()
+        cls.create_s3_bucket()
+
+    def test(self):
+        daemon = Daemon.new(ars=self.ars, port=0)
+        port = daemon.bind()
+        thread = daemon.start_in_background()
+
+        assert daemon_client.ping(port=port)["version"]
+
+        # only the current user can read the token file
+        mode = stat.S_IMODE(daemon.path_token.stat().st_mode)
+        assert mode == 0o600
+
+        # the request without the token or from another host is rejected
+        url = f"http://127.0.0.1:{port}"
+        token_header = {daemon_client.TOKEN_HEADER: daemon.token}
+        for request in [
+            Request(f"{url}/ping"),
+            Request(f"{url}/shutdown", data=b"", method="POST"),
+            Request(f"{url}/query?q=s3", headers={daemon_client.TOKEN_HEADER: "x"}),
+            Request(
+                f"{url}/query?q=s3",
+                headers={**token_header, "Host": f"evil.com:{port}"},
+            ),
+        ]:
+            with pytest.raises(HTTPError) as e:
+                urlopen(request, timeout=5)
+            assert e.value.code == 403
+        with urlopen(Request(f"{url}/ping", headers=token_header), timeout=5) as res:
+            assert res.status == 200
+
+        # resource type search
+        items = daemon_client.query("s3", port=port)
+        assert items[0]["arg"] == "s3-bucket"
+        assert "\x1b" not in items[0]["title"]
+
+        # resource search, the second query is served by the warm index
+        items = daemon_client.query(f"s3-bucket: {guid}", limit=2, port=port)
+        assert len(items) == 2
+        start = time.perf_counter()
+        items = daemon_client.query(f"s3-bucket: {guid}", port=port)
+        assert time.perf_counter() - start < 1
+        for item in items:
+            assert guid in item["title"]
+            assert item["variables"]["resource_type"] == "s3-bucket"
+
+        with pytest.raises(Exception):
+            daemon_client.query("s3-bucket: x", limit="not-a-number", port=port)
+
+        daemon_client.shutdown(port=port)
+        thread.join(timeout=5)
+        assert thread.is_alive() is False
+        assert daemon.path_token.exists() is False
+        with pytest.raises(OSError):
+            daemon_client.ping(port=port)
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.daemon", preview=False)
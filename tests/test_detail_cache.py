@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+from aws_resource_search.searcher_enum import SearcherEnum
+from aws_resource_search.detail_cache import DetailCache, detail_cache, get_details
+from aws_resource_search.tests.fake_aws.api import FakeAws
+
+
+def test_detail_cache():
+    cache = DetailCache(expire=3600, max_size=2)
+    cache.put(("a", "r", "t", "1"), [1])
+    cache.put(("a", "r", "t", "2"), [2])
+    assert cache.get(("a", "r", "t", "1")) == [1]
+    cache.put(("a", "r", "t", "3"), [3])
+    # "2" is the least recently used one
+    assert cache.get(("a", "r", "t", "2")) is None
+
+    cache.expire = 0
+    cache.put(("a", "r", "t", "4"), [4])
+    time.sleep(0.01)
+    assert cache.get(("a", "r", "t", "4")) is None
+
+    cache.clear()
+    assert len(cache.data) == 0
+
+
+class TestDetailCache(FakeAws):
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.setup_ars()
+        cls.create_ec2_instances()
+
+    def test(self):
+        detail_cache.clear()
+        resource_type = SearcherEnum.ec2_instance.value
+        searcher = self.ars.get_searcher(resource_type)
+        docs = searcher.search(refresh_data=True, limit=100)
+        doc = docs[0]
+
+        # nothing changed, the index is not touched
+        items = get_details(ars=self.ars, resource_type=resource_type, doc=doc)
+        assert len(items)
+        assert searcher.read_repair(doc=doc, bsm=self.bsm) is False
+
+        # the second call is served from the cache
+        assert get_details(ars=self.ars, resource_type=resource_type, doc=doc) is items
+
+        # rename the instance, the detail view writes the new name back
+        new_name = "read-repaired-ec2-instance"
+        self.bsm.ec2_client.create_tags(
+            Resources=[doc.id],
+            Tags=[dict(Key="Name", Value=new_name)],
+        )
+        detail_cache.clear()
+        get_details(ars=self.ars, resource_type=resource_type, doc=doc)
+        docs = searcher.search(query=new_name, limit=100)
+        assert [d.id for d in docs if d.name == new_name] == [doc.id]
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.detail_cache", preview=False)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+from pathlib import Path
+
+from aws_resource_search.fuzzy_matcher import FuzzyMatcher, tokenize
+
+path_txt = Path(tempfile.gettempdir()).joinpath("ars_test_fuzzy_matcher.txt")
+
+
+def downloader():
+    return [
+        {"id": line, "name": line}
+        for line in path_txt.read_text().splitlines()
+        if line.strip()
+    ]
+
+
+def test_tokenize():
+    assert tokenize("S3-Bucket ecs_task.def") == ["s3", "bucket", "ecs", "task", "def"]
+
+
+def test_fuzzy_matcher():
+    path_txt.write_text("s3-bucket\ns3-object\nsqs-queue\nlambda-function")
+    matcher = FuzzyMatcher(paths=[path_txt], downloader=downloader, fields=["name"])
+
+    def search(query: str):
+        return [doc["id"] for doc in matcher.search(query)]
+
+    assert search("*") == ["s3-bucket", "s3-object", "sqs-queue", "lambda-function"]
+    assert search("") == search("*")
+    assert search("buck") == ["s3-bucket"]
+    assert search("s3 obj") == ["s3-object"]
+    assert search("cket") == ["s3-bucket"]
+    assert search("lambdafunctions") == []
+    assert search("unknown") == []
+
+    # fuzzy match
+    assert search("buckt") == []
+    assert search("buckt~1") == ["s3-bucket"]
+    assert search("lmbda~1") == ["lambda-function"]
+    assert search("xambda~1") == []  # the first character has to match
+
+    # paging
+    docs = matcher.search("*", limit=2, offset=2)
+    assert [doc["id"] for doc in docs] == ["sqs-queue", "lambda-function"]
+    assert matcher.search("s3", limit=1, offset=1)[0]["id"] == "s3-object"
+    assert matcher.search("s3", limit=1, offset=2) == []
+
+    # the index is rebuilt when the file is changed
+    path_txt.write_text("s3-bucket\niam-role")
+    stat = path_txt.stat()
+    os.utime(path_txt, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert search("*") == ["s3-bucket", "iam-role"]
+    path_txt.unlink()
+
+
+def test_ranking():
+    matcher = FuzzyMatcher(
+        paths=[],
+        downloader=lambda: [
+            {"id": "glue-job", "desc": "etl job"},
+            {"id": "dynamodb-table", "desc": "database"},
+            {"id": "rds-database", "desc": "database"},
+        ],
+        fields=["id", "desc"],
+    )
+    # word prefix match ranks higher, more matched fields ranks higher
+    assert [doc["id"] for doc in matcher.search("ta")] == [
+        "dynamodb-table",
+        "rds-database",
+    ]
+    assert [doc["id"] for doc in matcher.search("data")] == [
+        "rds-database",
+        "dynamodb-table",
+    ]
+    assert [doc["id"] for doc in matcher.search("tabel~1")] == ["dynamodb-table"]
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.fuzzy_matcher", preview=False)
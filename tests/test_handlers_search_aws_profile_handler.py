@@ -3,6 +3,7 @@
 from aws_resource_search.handlers.search_aws_profile_handler import (
     search_aws_profile_and_return_items,
 )
+from aws_resource_search.paths import path_aws_credentials
 from aws_resource_search.tests.mock_aws_cli import test_home_aws_folder
 
 
@@ -27,6 +28,16 @@ def test_search_aws_profile_handler():
         )
         assert len(items) == 1
 
+        # the profile added to ~/.aws/credentials is found without refresh
+        with path_aws_credentials.open("a") as f:
+            f.write("\n[my_org_sandbox]\naws_access_key_id = a\naws_secret_access_key = b\n")
+        items = search_aws_profile_and_return_items(
+            line_input="s3-bucket: my-bucket",
+            profile_query="sandbox",
+        )
+        assert len(items) == 1
+        assert "my_org_sandbox" in items[0].title
+
 
 if __name__ == "__main__":
     from aws_resource_search.tests.helper import run_cov_test
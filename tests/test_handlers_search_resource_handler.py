@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import aws_resource_search.handlers.search_resource_handler as handler_module
 from aws_resource_search.handlers.search_resource_handler import (
     search_resource,
+    search_resource_and_return_items,
     search_resource_under_partitioner,
 )
 from aws_resource_search.tests.fake_aws.utils import guid
@@ -15,6 +17,7 @@ class TestSearchResourceHandler(FakeAws):
         cls.setup_ui()
         cls.create_s3_bucket()
         cls.create_state_machines()
+        cls.create_glue_database_table()
 
     def test_search_resource(self):
         items = search_resource(
@@ -44,6 +47,45 @@ class TestSearchResourceHandler(FakeAws):
         for item in items:
             assert guid in item.get_name()
 
+    def test_search_resource_and_return_items_paging(self, monkeypatch):
+        monkeypatch.setattr(handler_module, "PAGE_SIZE", 3)
+        searcher = self.ars.get_searcher("s3-bucket")
+        # the next page uses the same stale_while_revalidate as the first page
+        stale_while_revalidate_list = list()
+        original_search_page = searcher.search_page
+
+        def search_page(*args, **kwargs):
+            stale_while_revalidate_list.append(kwargs["stale_while_revalidate"])
+            return original_search_page(*args, **kwargs)
+
+        monkeypatch.setattr(searcher, "search_page", search_page)
+        self.ui.set_next_page(None)
+        items = search_resource_and_return_items(
+            ui=self.ui,
+            searcher=searcher,
+            query=guid,
+            stale_while_revalidate=True,
+        )
+        assert len(items) == 3
+        self.ui.dropdown.update(items)
+        # the selector is not at the end yet
+        self.ui._load_next_page_if_needed(1)
+        assert self.ui.dropdown.n_items == 3
+        self.ui.dropdown.press_down(n=2)
+        self.ui._load_next_page_if_needed(1)
+        assert self.ui.dropdown.n_items == 6
+        # the selected item doesn't change
+        assert self.ui.dropdown.selected_item_index == 2
+        names = [item.get_name() for item in self.ui.dropdown.items]
+        assert len(set(names)) == 6
+
+        while self.ui.load_next_page():
+            pass
+        assert self.ui.dropdown.n_items == len(self.s3_buckets)
+        assert self.ui.load_next_page() is False
+        assert len(stale_while_revalidate_list) > 1
+        assert all(stale_while_revalidate_list)
+
     def test_search_resource_under_partitioner(self):
         sm_items = search_resource(
             ui=self.ui,
@@ -64,6 +106,35 @@ class TestSearchResourceHandler(FakeAws):
             # for item in items:
             #     assert guid in item.get_name()
 
+    def test_search_resource_under_all_partitioners(self, monkeypatch):
+        # the single digit in the query doesn't narrow down the result
+        monkeypatch.setattr(handler_module, "SKIP_UI_LIMIT", 100)
+        items = search_resource_under_partitioner(
+            ui=self.ui,
+            resource_type="glue-database-table",
+            partitioner_resource_type="glue-database",
+            query=f"*@{guid}-3-glue-table",
+            skip_ui=True,
+        )
+        databases = set()
+        for item in items:
+            doc = item.variables["doc"]
+            assert doc.partition == doc.database
+            assert item.variables["boto_kwargs"] == {"DatabaseName": doc.database}
+            if doc.table.endswith(f"{guid}-3-glue-table"):
+                databases.add(doc.database)
+        # the table exists in every database
+        assert databases == set(self.glue_databases)
+
+        items = search_resource_under_partitioner(
+            ui=self.ui,
+            resource_type="glue-database-table",
+            partitioner_resource_type="glue-database",
+            query="*@",
+            skip_ui=True,
+        )
+        assert len(items) == len(self.glue_tables)
+
 
 if __name__ == "__main__":
     from aws_resource_search.tests.helper import run_cov_test
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import aws_resource_search.handlers.search_resource_type_handler as handler_module
 from aws_resource_search.handlers.search_resource_type_handler import (
     search_resource_type_and_return_items,
 )
@@ -22,6 +23,24 @@ class TestSearchResourceTypeHandler(FakeAws):
             for item in items:
                 assert query in item.title
 
+    def test_paging(self, monkeypatch):
+        monkeypatch.setattr(handler_module, "PAGE_SIZE", 2)
+        self.ui.set_next_page(None)
+        items = search_resource_type_and_return_items(ui=self.ui, query="*")
+        assert len(items) == 2
+        self.ui.dropdown.update(items)
+        assert self.ui.load_next_page() is True
+        assert self.ui.dropdown.n_items == 4
+        titles = [item.title for item in self.ui.dropdown.items]
+        assert len(set(titles)) == 4
+
+        items = search_resource_type_and_return_items(
+            ui=self.ui,
+            query="*",
+            skip_ui=True,
+        )
+        assert len(items) > 2
+
 
 if __name__ == "__main__":
     from aws_resource_search.tests.helper import run_cov_test
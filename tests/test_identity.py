@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import moto
+from boto_session_manager import BotoSesManager
+
+from aws_resource_search.tests.mock_test import BaseMockTest
+from aws_resource_search.identity import IdentityCache, get_profile, get_fingerprint
+
+path_json = Path(tempfile.gettempdir()).joinpath("ars_test_identity.json")
+
+
+class TestIdentityCache(BaseMockTest):
+    mock_list = [
+        moto.mock_sts,
+        moto.mock_iam,
+    ]
+
+    def test(self, monkeypatch):
+        bsm = BotoSesManager(profile_name="my_org_dev")
+        assert get_profile(bsm) == "my_org_dev"
+        assert get_profile(BotoSesManager()) is None
+        with pytest.raises(ValueError):
+            get_profile(
+                BotoSesManager(aws_access_key_id="a", aws_secret_access_key="b")
+            )
+
+        identity_cache = IdentityCache(path=path_json)
+        identity_cache.clear()
+        assert identity_cache.get("my_org_dev") is None
+
+        identity = identity_cache.fetch(bsm)
+        assert identity.account_id == "123456789012"
+        assert identity.region == "us-east-1"
+        assert identity.account_alias is None
+        assert identity_cache.get_account_alias(bsm) == ""
+
+        # the identity is persisted
+        identity_cache = IdentityCache(path=path_json)
+        identity = identity_cache.get("my_org_dev")
+        assert identity.account_id == "123456789012"
+        assert identity.account_alias == ""
+
+        identity_cache.verify_in_background("my_org_dev").join()
+        assert identity_cache.get("my_org_dev").account_alias == ""
+
+        # the AWS config files are only read again when they are changed
+        path_config = Path(tempfile.gettempdir()).joinpath("ars_test_aws_config")
+        path_config.write_text("[profile my_org_dev]\n")
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(path_config))
+        fingerprint = get_fingerprint("my_org_dev")
+        with patch.object(Path, "read_bytes") as read_bytes:
+            assert get_fingerprint("my_org_dev") == fingerprint
+            assert read_bytes.call_count == 0
+        path_config.write_text("[profile my_org_dev]\nregion = eu-west-1\n")
+        assert get_fingerprint("my_org_dev") != fingerprint
+        path_config.unlink()
+        monkeypatch.delenv("AWS_CONFIG_FILE")
+
+        # the cache is invalid once the AWS config changes
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        assert identity_cache.get("my_org_dev") is None
+        identity_cache.clear()
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.identity", preview=False)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""
+Each import runs in a new Python process, so it checks the cold start. We
+assert on the heavy modules that are imported at startup instead of the
+wall-clock time, which is not stable on slow CI machines.
+"""
+
+import sys
+import json
+import subprocess
+
+import pytest
+
+HEAVY_MODULES = [
+    "boto3",
+    "blessed",
+    "sayt",
+    "zelfred",
+    "aws_console_url",
+    "pyperclip",
+    "awscli_mate",
+]
+
+CODE = """
+import sys, json
+{statement}
+print(json.dumps({{"modules": sorted(sys.modules)}}))
+"""
+
+
+def cold_import(statement: str) -> dict:
+    res = subprocess.run(
+        [sys.executable, "-c", CODE.format(statement=statement)],
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return json.loads(res.stdout.decode("utf-8").splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "statement,allowed",
+    [
+        # ``ars -v``, ``ars clear``
+        ("import aws_resource_search.cli.main", []),
+        ("import aws_resource_search.cli.clear", []),
+        ("import aws_resource_search.api", []),
+        ("import aws_resource_search.res_lib", []),
+        # the thin client of the query daemon
+        ("import aws_resource_search.daemon_client", []),
+        # library usage doesn't import the UI
+        (
+            "from aws_resource_search.api import ARS",
+            ["boto3", "aws_console_url"],
+        ),
+        (
+            "import aws_resource_search.res.s3",
+            ["boto3", "sayt", "aws_console_url"],
+        ),
+    ],
+)
+def test_cold_import(statement, allowed):
+    result = cold_import(statement)
+    modules = set(result["modules"])
+    for name in HEAVY_MODULES:
+        if name not in allowed:
+            assert name not in modules, f"{statement!r} imports {name!r}"
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search", preview=False)
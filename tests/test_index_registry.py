@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import moto
+from boto_session_manager import BotoSesManager
+
+from aws_resource_search.tests.mock_test import BaseMockTest
+from aws_resource_search.base_searcher import preprocess_query
+from aws_resource_search.index_registry import (
+    QueryCache,
+    IndexRegistry,
+    index_registry,
+)
+from aws_resource_search.res.s3 import s3_bucket_searcher
+
+
+def test_query_cache():
+    query_cache = QueryCache(max_size=2)
+    query_cache.put("a~1", 10, [{"_id": 1}])
+    query_cache.put("b~1", 10, [{"_id": 1}] * 10)
+    assert query_cache.get("a~1", 10) == [{"_id": 1}]
+    assert query_cache.get("a~1", 20) is None
+
+    # "a~1" is complete, "b~1" is not, because it hits the limit
+    assert query_cache.find_base("a~1 x~1", 10) == ("x~1", [{"_id": 1}])
+    assert query_cache.find_base("b~1 x~1", 10) is None
+    assert query_cache.find_base("a~1", 10) is None
+    assert query_cache.find_base("x~1 a~1", 10) is None
+    assert query_cache.find_base("a~1 OR x~1", 10) is None
+
+    # "b~1" is the least recently used one
+    query_cache.put("c~1", 10, [])
+    assert query_cache.get("b~1", 10) is None
+    assert query_cache.get("a~1", 10) is not None
+
+
+class TestIndexRegistry(BaseMockTest):
+    mock_list = [
+        moto.mock_s3,
+        moto.mock_sts,
+    ]
+
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.bsm.s3_client.create_bucket(Bucket="registry-bucket-1")
+
+    def _get_ds(self):
+        return s3_bucket_searcher._get_ds(
+            bsm=self.bsm,
+            final_boto_kwargs=s3_bucket_searcher._get_final_boto_kwargs(),
+        )
+
+    def test(self):
+        # the dataset object is reused
+        ds = self._get_ds()
+        assert self._get_ds() is ds
+
+        s3_bucket_searcher.sync_index(refresh_data=True, bsm=self.bsm)
+        assert index_registry.is_expired(ds) is False
+
+        # the searcher is reused until the index generation changes
+        with index_registry.searcher(ds) as searcher1:
+            assert searcher1.doc_count() == 1
+        with index_registry.searcher(ds) as searcher2:
+            assert searcher2 is searcher1
+
+        self.bsm.s3_client.create_bucket(Bucket="registry-bucket-2")
+        s3_bucket_searcher.sync_index(refresh_data=True, bsm=self.bsm)
+        with index_registry.searcher(ds) as searcher3:
+            assert searcher3 is not searcher1
+            assert searcher3.doc_count() == 2
+
+        # the repeated query is served from the cache, the longer query
+        # is narrowed down from the previous result
+        query = preprocess_query("registry")
+        res = s3_bucket_searcher._run_query(ds=ds, query=query, limit=50)
+        assert res["cache"] is False
+        assert res["size"] == 2
+        res = s3_bucket_searcher._run_query(ds=ds, query=query, limit=50)
+        assert res["cache"] is True
+
+        query = preprocess_query("registry bucket 2")
+        hits = s3_bucket_searcher._run_query(ds=ds, query=query, limit=50)["hits"]
+        index_registry.get_handle(ds).query_cache.clear()
+        expected = s3_bucket_searcher._run_query(ds=ds, query=query, limit=50)["hits"]
+        assert [hit["_id"] for hit in hits] == [hit["_id"] for hit in expected]
+
+        index_registry.mark_expired(ds)
+        assert index_registry.is_expired(ds) is True
+
+        # the profiles of the same account share the handle, the open
+        # searcher and the query cache are kept
+        bsm = BotoSesManager(profile_name="my_org_dev", region_name="us-east-1")
+        handle = index_registry.get_handle(ds)
+        ds_dev = s3_bucket_searcher._get_ds(
+            bsm=bsm,
+            final_boto_kwargs=s3_bucket_searcher._get_final_boto_kwargs(),
+        )
+        assert ds_dev is ds
+        assert index_registry.get_handle(ds) is handle
+        assert handle.searcher is searcher3
+        assert index_registry.get_boto_context(ds.index_name, None, None)[0] is bsm
+        assert self._get_ds() is ds
+        assert index_registry.get_boto_context(ds.index_name, None, None)[0] is self.bsm
+
+        # a new registry reads the expire time from the disk
+        s3_bucket_searcher.sync_index(bsm=self.bsm)
+        registry = IndexRegistry()
+        assert registry.is_expired(ds) is False
+
+        index_registry.close(ds.index_name)
+        assert self._get_ds() is not ds
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.index_registry", preview=False)
@@ -23,6 +23,33 @@ class TestAwsResourceTypeItem(FakeAws):
             ars=self.ars,
         )[0]
         assert isinstance(item, AwsResourceTypeItem)
+        assert item.variables["console_url"] == self.ars.aws_console.s3.buckets
+
+    def test_console_url_attr(self):
+        # listing resource types doesn't import the searcher module
+        searcher_finder = self.ars.searcher_finder
+        searcher_finder.searcher_cache.pop("sqs-queue", None)
+        AwsResourceTypeItem.from_document(
+            ResourceTypeDocument(id="sqs-queue", name="sqs-queue", desc="", ngram=""),
+            ars=self.ars,
+        )
+        assert "sqs-queue" not in searcher_finder.searcher_cache
+
+        # the searchers.json is up-to-date with the searcher modules
+        for resource_type in searcher_finder.all_resource_types():
+            searcher = searcher_finder.import_searcher(resource_type)
+            try:
+                expected = searcher.doc_class.get_list_resources_console_url(
+                    console=self.ars.aws_console
+                )
+            except NotImplementedError:
+                expected = None
+            assert (
+                searcher_finder.get_list_resources_console_url(
+                    resource_type, self.ars.aws_console
+                )
+                == expected
+            )
 
 
 if __name__ == "__main__":
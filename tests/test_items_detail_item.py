@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import time
+
 from aws_resource_search.items.detail_item import DetailItem, ExceptionItem
 
 
@@ -71,6 +73,32 @@ class TestDetailItem:
             raise ValueError("something wrong")
         assert isinstance(detail_items[0], ExceptionItem)
 
+    def test_run_tasks(self):
+        def make_task(title: str, delay: float):
+            def task(detail_items):
+                time.sleep(delay)
+                detail_items.append(DetailItem.new(title=title))
+
+            return task
+
+        def failed_task(detail_items):
+            raise ValueError("something wrong")
+
+        st = time.time()
+        detail_items = DetailItem.run_tasks(
+            [DetailItem.new(title="arn")],
+            [make_task("a", 0.3), failed_task, make_task("b", 0.1)],
+        )
+        # the tasks run concurrently, but the order is deterministic
+        assert time.time() - st < 0.5
+        assert detail_items[0].title == "arn"
+        assert detail_items[1].title == "a"
+        assert isinstance(detail_items[2], ExceptionItem)
+        assert detail_items[3].title == "b"
+
+        detail_items = DetailItem.run_tasks([], [make_task("a", 0)])
+        assert detail_items[0].title == "a"
+
 
 if __name__ == "__main__":
     from aws_resource_search.tests.helper import run_cov_test
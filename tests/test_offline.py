@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import moto
+import botocore.exceptions
+
+from aws_resource_search.tests.mock_test import BaseMockTest
+from aws_resource_search.offline import is_offline_mode, is_offline_error
+from aws_resource_search.index_registry import index_registry
+from aws_resource_search.res.s3 import s3_bucket_searcher
+
+
+def test_is_offline_error():
+    assert is_offline_error(
+        botocore.exceptions.EndpointConnectionError(endpoint_url="https://s3")
+    )
+    assert is_offline_error(botocore.exceptions.NoCredentialsError())
+    assert is_offline_error(
+        botocore.exceptions.ClientError(
+            {"Error": {"Code": "ExpiredToken"}}, "ListBuckets"
+        )
+    )
+    assert not is_offline_error(
+        botocore.exceptions.ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "ListBuckets"
+        )
+    )
+    assert not is_offline_error(ValueError())
+
+
+def test_is_offline_mode(monkeypatch):
+    monkeypatch.delenv("ARS_OFFLINE", raising=False)
+    assert is_offline_mode() is False
+    monkeypatch.setenv("ARS_OFFLINE", "true")
+    assert is_offline_mode() is True
+
+
+class TestOffline(BaseMockTest):
+    mock_list = [
+        moto.mock_s3,
+        moto.mock_sts,
+    ]
+
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.bsm.s3_client.create_bucket(Bucket="offline-bucket")
+
+    def test(self, monkeypatch):
+        res = s3_bucket_searcher.search(
+            refresh_data=True, bsm=self.bsm, simple_response=False
+        )
+        assert res["offline"] is False
+        assert res["size"] == 1
+
+        # the expired index is searched in offline mode
+        ds = s3_bucket_searcher._get_ds(bsm=self.bsm, final_boto_kwargs={})
+        index_registry.mark_expired(ds)
+        monkeypatch.setenv("ARS_OFFLINE", "true")
+        res = s3_bucket_searcher.search(bsm=self.bsm, simple_response=False)
+        assert res["offline"] is True
+        assert res["stale"] is True
+        assert res["size"] == 1
+        monkeypatch.delenv("ARS_OFFLINE")
+
+        # fall back to the existing index when we can't reach AWS
+        def build_index(*args, **kwargs):
+            raise botocore.exceptions.EndpointConnectionError(endpoint_url="https://s3")
+
+        monkeypatch.setattr(s3_bucket_searcher, "_build_index", build_index)
+        res = s3_bucket_searcher.search(bsm=self.bsm, simple_response=False)
+        assert res["offline"] is True
+        assert res["fresh"] is False
+        assert res["size"] == 1
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.offline", preview=False)
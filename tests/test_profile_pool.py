@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import moto
+
+from aws_resource_search.tests.mock_test import BaseMockTest
+from aws_resource_search.profile_pool import ProfilePool, profile_pool
+from aws_resource_search.ars_def import ARS
+
+
+class TestProfilePool(BaseMockTest):
+    mock_list = [
+        moto.mock_sts,
+    ]
+
+    def test(self):
+        pool = ProfilePool(max_size=1)
+        dev = pool.get("my_org_dev")
+        assert dev.profile == "my_org_dev"
+        assert dev.aws_console.aws_account_id == "123456789012"
+        assert pool.get("my_org_dev") is dev
+
+        # the least recently used profile is evicted
+        pool.get("my_org_test")
+        assert pool.get("my_org_dev") is not dev
+
+        # the default profile is never pooled
+        assert pool.get().profile is None
+        assert pool.get() is not pool.get()
+        pool.clear()
+
+        # switching back to a recently used profile reuses its boto session
+        ars = ARS.from_profile("my_org_dev")
+        bsm = ars.bsm
+        ars.set_profile("my_org_prod")
+        assert ars.bsm is not bsm
+        ars.set_profile("my_org_dev")
+        assert ars.bsm is bsm
+        profile_pool.clear()
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.profile_pool", preview=False)
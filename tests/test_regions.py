@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import moto
+
+from aws_resource_search.tests.mock_test import BaseMockTest
+from aws_resource_search.regions import (
+    parse_resource_type,
+    get_regional_bsm,
+    resolve_regions,
+)
+from aws_resource_search.ars_def import ARS
+from aws_resource_search.res.s3 import s3_bucket_searcher
+from aws_resource_search.res.sqs import sqs_queue_searcher
+
+
+def test_parse_resource_type():
+    assert parse_resource_type("ec2-instance") == ("ec2-instance", None)
+    assert parse_resource_type("ec2-instance@*") == ("ec2-instance", "*")
+    assert parse_resource_type("ec2-instance@ us-east-1,us-west-2") == (
+        "ec2-instance",
+        "us-east-1,us-west-2",
+    )
+
+
+class TestRegions(BaseMockTest):
+    mock_list = [
+        moto.mock_s3,
+        moto.mock_sqs,
+        moto.mock_ec2,
+        moto.mock_sts,
+    ]
+
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.bsm.s3_client.create_bucket(Bucket="regions-test-bucket")
+        cls.bsm.sqs_client.create_queue(QueueName="web-queue-east")
+        bsm_west = get_regional_bsm(cls.bsm, "us-west-2")
+        bsm_west.sqs_client.create_queue(QueueName="web-queue-west")
+
+    def _test_get_regional_bsm(self):
+        assert get_regional_bsm(self.bsm, "us-east-1") is self.bsm
+        bsm_west = get_regional_bsm(self.bsm, "us-west-2")
+        assert bsm_west.aws_region == "us-west-2"
+        assert get_regional_bsm(self.bsm, "us-west-2") is bsm_west
+
+    def _test_resolve_regions(self):
+        assert resolve_regions(self.bsm, "us-east-1, us-west-2,us-east-1") == [
+            "us-east-1",
+            "us-west-2",
+        ]
+        assert resolve_regions(self.bsm, "*", default_regions=["eu-west-1"]) == [
+            "eu-west-1"
+        ]
+        regions = resolve_regions(self.bsm, "*", default_regions=[])
+        assert "us-east-1" in regions
+        assert "us-west-2" in regions
+
+    def _test_search_regions(self):
+        regions = ["us-east-1", "us-west-2"]
+        docs = sqs_queue_searcher.search(
+            query="web queue",
+            refresh_data=True,
+            bsm=self.bsm,
+            regions=regions,
+        )
+        assert [(doc.name, doc.region) for doc in docs] == [
+            ("web-queue-east", "us-east-1"),
+            ("web-queue-west", "us-west-2"),
+        ]
+
+        res = sqs_queue_searcher.search(
+            query="web queue",
+            bsm=self.bsm,
+            simple_response=False,
+            regions=regions,
+        )
+        assert res["size"] == 2
+        assert res["errors"] == {}
+        assert res["fresh"] is False
+
+        # the bucket list is the same in all regions, it is only searched once
+        res = s3_bucket_searcher.search(
+            refresh_data=True,
+            bsm=self.bsm,
+            simple_response=False,
+            regions=regions,
+        )
+        assert res["size"] == 1
+        assert "_region" not in res["hits"][0]
+
+    def _test_global_index(self):
+        bsm_west = get_regional_bsm(self.bsm, "us-west-2")
+        index_name = s3_bucket_searcher._get_index_name(bsm_west, {})
+        assert index_name == s3_bucket_searcher._get_index_name(self.bsm, {})
+        assert "global" in index_name
+        assert "us-west-2" in sqs_queue_searcher._get_index_name(bsm_west, {})
+
+        # the index built in us-east-1 also serves us-west-2
+        s3_bucket_searcher.sync_index(refresh_data=True, bsm=self.bsm)
+        assert s3_bucket_searcher.sync_index(bsm=bsm_west) is None
+        docs = s3_bucket_searcher.search(bsm=bsm_west)
+        assert [doc.name for doc in docs] == ["regions-test-bucket"]
+
+    def _test_get_regional_ars(self):
+        ars = ARS.from_bsm(bsm=self.bsm)
+        assert ars.get_regional_ars(None) is ars
+        assert ars.get_regional_ars("us-east-1") is ars
+        ars_west = ars.get_regional_ars("us-west-2")
+        assert ars_west.bsm.aws_region == "us-west-2"
+        assert ars_west.aws_console.aws_region == "us-west-2"
+
+    def test(self):
+        self._test_get_regional_bsm()
+        self._test_resolve_regions()
+        self._test_search_regions()
+        self._test_global_index()
+        self._test_get_regional_ars()
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.regions", preview=False)
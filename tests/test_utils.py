@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+import tempfile
+from pathlib import Path
+
+from aws_resource_search.utils import load_json, dump_json
+
+path_json = Path(tempfile.gettempdir()).joinpath("ars_test_utils", "data.json")
+
+
+def test_load_and_dump_json():
+    path_json.unlink(missing_ok=True)
+    assert load_json(path_json, default=dict) == {}
+    dump_json(path_json, {"b": 2, "a": 1}, indent=4, sort_keys=True)
+    assert load_json(path_json, default=dict) == {"a": 1, "b": 2}
+    assert path_json.with_name(path_json.name + ".tmp").exists() is False
+    path_json.write_text("not a json")
+    assert load_json(path_json, default=list) == []
+    path_json.unlink()
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.utils", preview=False)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from aws_resource_search.searcher_enum import SearcherEnum
+from aws_resource_search.warmer import get_warmable_resource_types, Warmer
+from aws_resource_search.regions import get_regional_bsm
+from aws_resource_search.tests.fake_aws.api import FakeAws
+
+
+class TestWarmer(FakeAws):
+    @classmethod
+    def setup_class_post_hook(cls):
+        cls.setup_ars()
+        cls.create_s3_bucket()
+        cls.create_iam()
+
+    def _test_get_warmable_resource_types(self):
+        resource_types = get_warmable_resource_types(self.ars)
+        assert SearcherEnum.s3_bucket.value in resource_types
+        assert SearcherEnum.glue_database_table.value not in resource_types
+
+        with pytest.raises(ValueError):
+            get_warmable_resource_types(self.ars, ["invalid"])
+
+    def _test_warm(self):
+        warmer = Warmer.new(
+            resource_types=[
+                SearcherEnum.s3_bucket.value,
+                SearcherEnum.iam_role.value,
+                SearcherEnum.glue_database_table.value,
+            ],
+            bsm_list=[self.bsm, get_regional_bsm(self.bsm, "us-west-2")],
+            max_workers=2,
+        )
+        # both resource types are region-global
+        assert len(warmer.tasks) == 2
+
+        results = list(warmer.warm(refresh_data=True))
+        assert len(results) == 2
+        for result in results:
+            assert result.built is True
+            assert result.error is None
+            str(result)
+
+        # the index is still fresh, nothing to build
+        results = list(warmer.warm())
+        for result in results:
+            assert result.built is False
+
+        results = list(warmer.warm_forever(max_rounds=1))
+        assert len(results) == 2
+
+        docs = self.ars.s3_bucket.search()
+        assert len(docs) == 10
+
+    def test(self):
+        self._test_get_warmable_resource_types()
+        self._test_warm()
+
+
+if __name__ == "__main__":
+    from aws_resource_search.tests.helper import run_cov_test
+
+    run_cov_test(__file__, "aws_resource_search.warmer", preview=False)